@@ -33,6 +33,7 @@ from .workflow_engine import (
 from .orchestrator import (
     AgentTeamOrchestrator,
     OrchestrationStrategy,
+    configure_logging,
 )
 
 __all__ = [
@@ -58,6 +59,7 @@ __all__ = [
     # Orchestrator
     "AgentTeamOrchestrator",
     "OrchestrationStrategy",
+    "configure_logging",
 ]
 
 __version__ = "1.0.0"
@@ -12,32 +12,54 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
+from typing import List
 
 # Add parent directory to path for imports
 parent_dir = str(Path(__file__).parent.parent)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from scripts.orchestrator import AgentTeamOrchestrator, OrchestrationStrategy
+from scripts.orchestrator import (
+    AgentTeamOrchestrator,
+    OrchestrationStrategy,
+    configure_logging,
+)
+from scripts.team_coordinator import to_json
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write rendered output lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_orchestrate(args: argparse.Namespace) -> int:
     """Execute orchestration for a project request"""
-    print(f"\n{'=' * 60}")
-    print("AGENT TEAM ORCHESTRATOR")
-    print(f"{'=' * 60}")
-    print(f"\nProject: {args.project_name}")
-    print(f"Request: {args.request}")
-    print(f"Strategy: {args.strategy}")
-    print(f"{'=' * 60}\n")
+    # The header goes out before the run so it precedes progress logging
+    _write_lines(
+        [
+            f"\n{'=' * 60}",
+            "AGENT TEAM ORCHESTRATOR",
+            f"{'=' * 60}",
+            f"\nProject: {args.project_name}",
+            f"Request: {args.request}",
+            f"Strategy: {args.strategy}",
+            f"{'=' * 60}\n",
+        ]
+    )
 
     # Initialize orchestrator
     storage_path = args.storage_path or "/tmp/agent_team_data"
     strategy = OrchestrationStrategy(args.strategy)
 
-    orchestrator = AgentTeamOrchestrator(strategy=strategy, storage_path=storage_path)
+    orchestrator = AgentTeamOrchestrator(
+        strategy=strategy,
+        storage_path=storage_path,
+        use_analysis_cache=not args.no_cache,
+        storage_format=args.storage_format,
+    )
 
     # Execute orchestration
     result = orchestrator.orchestrate_complete_project(
@@ -45,40 +67,47 @@ def cmd_orchestrate(args: argparse.Namespace) -> int:
     )
 
     # Display results
-    print(f"\n{'=' * 60}")
-    print("ORCHESTRATION RESULTS")
-    print(f"{'=' * 60}")
-    print(f"\nStatus: {'SUCCESS' if result['success'] else 'FAILED'}")
-    print(f"Duration: {result['total_duration']:.2f}s")
+    lines = [
+        f"\n{'=' * 60}",
+        "ORCHESTRATION RESULTS",
+        f"{'=' * 60}",
+        f"\nStatus: {'SUCCESS' if result['success'] else 'FAILED'}",
+        f"Duration: {result['total_duration']:.2f}s",
+    ]
 
     if result.get("tasks"):
-        print(f"\nTasks ({len(result['tasks'])}):")
-        for task in result["tasks"]:
-            print(f"  - {task['id']}: {task['title']} (Priority: {task['priority']})")
+        lines.append(f"\nTasks ({len(result['tasks'])}):")
+        lines.extend(
+            f"  - {task['id']}: {task['title']} (Priority: {task['priority']})"
+            for task in result["tasks"]
+        )
 
     if result.get("agents"):
-        print(f"\nAgents ({len(result['agents'])}):")
-        for agent in result["agents"]:
-            print(f"  - {agent['name']} ({agent['id']})")
+        lines.append(f"\nAgents ({len(result['agents'])}):")
+        lines.extend(
+            f"  - {agent['name']} ({agent['id']})" for agent in result["agents"]
+        )
 
     if result.get("execution_results"):
         exec_results = result["execution_results"]
-        print(f"\nExecution:")
-        print(f"  Total Tasks: {exec_results.get('total_tasks', 0)}")
-        print(f"  Completed: {exec_results.get('completed_tasks', 0)}")
-        print(f"  Failed: {exec_results.get('failed_tasks', 0)}")
+        lines.append(f"\nExecution:")
+        lines.append(f"  Total Tasks: {exec_results.get('total_tasks', 0)}")
+        lines.append(f"  Completed: {exec_results.get('completed_tasks', 0)}")
+        lines.append(f"  Failed: {exec_results.get('failed_tasks', 0)}")
 
     if result.get("error"):
-        print(f"\nError: {result['error']}")
+        lines.append(f"\nError: {result['error']}")
+        _write_lines(lines)
         return 1
 
     # Output JSON if requested
     if args.json_output:
-        print(f"\n{'=' * 60}")
-        print("JSON OUTPUT")
-        print(f"{'=' * 60}")
-        print(json.dumps(result, indent=2, default=str))
+        lines.append(f"\n{'=' * 60}")
+        lines.append("JSON OUTPUT")
+        lines.append(f"{'=' * 60}")
+        lines.append(to_json(result))
 
+    _write_lines(lines)
     return 0 if result["success"] else 1
 
 
@@ -90,40 +119,78 @@ def cmd_status(args: argparse.Namespace) -> int:
         strategy=OrchestrationStrategy.AUTOMATIC, storage_path=storage_path
     )
 
+    # Reuse the last rendered status while the memory store is unchanged
+    store_file = orchestrator.memory_manager.store_file
+    cache_path = Path(storage_path) / ".status_cache.json"
+    # Size and inode too: coarse mtimes can miss an append or a compaction
+    # within the same tick
+    stamp = None
+    if store_file.exists():
+        st = store_file.stat()
+        stamp = [st.st_ino, st.st_mtime_ns, st.st_size]
+
+    if stamp is not None:
+        try:
+            cached = json.loads(cache_path.read_text())
+            if cached["stamp"] == stamp:
+                _write_lines([cached["payload"]])
+                return 0
+        except (OSError, ValueError, KeyError):
+            pass
+
     # Load existing state
     loaded = orchestrator.memory_manager.load_from_disk()
 
-    print(f"\n{'=' * 60}")
-    print("ORCHESTRATOR STATUS")
-    print(f"{'=' * 60}")
+    lines = [
+        f"\n{'=' * 60}",
+        "ORCHESTRATOR STATUS",
+        f"{'=' * 60}",
+    ]
 
     status = orchestrator.get_team_status()
-    print(f"\nTask Summary:")
-    print(f"  Total: {status['tasks']['total']}")
-    print(f"  Completed: {status['tasks']['completed']}")
-    print(f"  In Progress: {status['tasks']['in_progress']}")
-    print(f"  Failed: {status['tasks']['failed']}")
-    print(f"  Completion Rate: {status['tasks']['completion_rate']:.1%}")
+    lines.append(f"\nTask Summary:")
+    lines.append(f"  Total: {status['tasks']['total']}")
+    lines.append(f"  Completed: {status['tasks']['completed']}")
+    lines.append(f"  In Progress: {status['tasks']['in_progress']}")
+    lines.append(f"  Failed: {status['tasks']['failed']}")
+    lines.append(f"  Completion Rate: {status['tasks']['completion_rate']:.1%}")
 
     if status["agents"]:
-        print(f"\nAgents ({len(status['agents'])}):")
+        lines.append(f"\nAgents ({len(status['agents'])}):")
         for agent_id, agent_info in status["agents"].items():
-            print(f"  - {agent_info['name']} ({agent_id}): {agent_info['status']}")
+            lines.append(
+                f"  - {agent_info['name']} ({agent_id}): {agent_info['status']}"
+            )
 
     monitor = orchestrator.monitor_execution()
-    print(f"\nMemory:")
-    print(f"  Active Contexts: {monitor['active_contexts']}")
-    print(f"  Memory Entries: {monitor['memory_entries']}")
-    print(f"  Loaded from disk: {loaded}")
+    lines.append(f"\nMemory:")
+    lines.append(f"  Active Contexts: {monitor['active_contexts']}")
+    lines.append(f"  Memory Entries: {monitor['memory_entries']}")
+    lines.append(f"  Loaded from disk: {loaded}")
+
+    payload = "\n".join(lines)
+    _write_lines([payload])
+
+    if stamp is not None:
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps({"stamp": stamp, "payload": payload}))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
 
     return 0
 
 
 def cmd_demo(args: argparse.Namespace) -> int:
     """Run a demo orchestration"""
-    print(f"\n{'=' * 60}")
-    print("RUNNING DEMO ORCHESTRATION")
-    print(f"{'=' * 60}\n")
+    _write_lines(
+        [
+            f"\n{'=' * 60}",
+            "RUNNING DEMO ORCHESTRATION",
+            f"{'=' * 60}\n",
+        ]
+    )
 
     # Demo request
     demo_request = "Build a React frontend with database integration and API endpoints"
@@ -137,63 +204,82 @@ def cmd_demo(args: argparse.Namespace) -> int:
         user_request=demo_request, project_name=demo_project
     )
 
-    print(f"\n{'=' * 60}")
-    print("DEMO RESULTS")
-    print(f"{'=' * 60}")
-    print(f"\nProject: {result['project_name']}")
-    print(f"Status: {'SUCCESS' if result['success'] else 'FAILED'}")
-    print(f"Duration: {result['total_duration']:.2f}s")
+    lines = [
+        f"\n{'=' * 60}",
+        "DEMO RESULTS",
+        f"{'=' * 60}",
+        f"\nProject: {result['project_name']}",
+        f"Status: {'SUCCESS' if result['success'] else 'FAILED'}",
+        f"Duration: {result['total_duration']:.2f}s",
+    ]
 
     if result.get("analysis"):
-        print(f"\nComponents Identified: {len(result['analysis']['components'])}")
-        for comp in result["analysis"]["components"]:
-            print(f"  - {comp['type']}: {comp['description']}")
+        lines.append(
+            f"\nComponents Identified: {len(result['analysis']['components'])}"
+        )
+        lines.extend(
+            f"  - {comp['type']}: {comp['description']}"
+            for comp in result["analysis"]["components"]
+        )
 
     team_status = orchestrator.get_team_status()
-    print(f"\nTeam Status: {team_status['tasks']['completion_rate']:.1%} complete")
+    lines.append(
+        f"\nTeam Status: {team_status['tasks']['completion_rate']:.1%} complete"
+    )
 
+    _write_lines(lines)
     return 0 if result["success"] else 1
 
 
 def cmd_analyze(args: argparse.Namespace) -> int:
     """Analyze a request without executing"""
-    print(f"\n{'=' * 60}")
-    print("REQUEST ANALYSIS")
-    print(f"{'=' * 60}\n")
+    storage_path = args.storage_path or "/tmp/agent_team_data"
 
-    orchestrator = AgentTeamOrchestrator(strategy=OrchestrationStrategy.AUTOMATIC)
+    orchestrator = AgentTeamOrchestrator(
+        strategy=OrchestrationStrategy.AUTOMATIC,
+        storage_path=storage_path,
+        use_analysis_cache=not args.no_cache,
+    )
 
     analysis = orchestrator.analyze_requirements(args.request)
 
-    print(f"Original Request: {analysis['original_request']}\n")
-
-    print(f"Components ({len(analysis['components'])}):")
+    lines = [
+        f"\n{'=' * 60}",
+        "REQUEST ANALYSIS",
+        f"{'=' * 60}\n",
+        f"Original Request: {analysis['original_request']}\n",
+        f"Components ({len(analysis['components'])}):",
+    ]
     for comp in analysis["components"]:
-        print(f"  - [{comp['id']}] {comp['type'].upper()}")
-        print(f"    Description: {comp['description']}")
-        print(f"    Priority: {comp['priority']}")
+        lines.append(f"  - [{comp['id']}] {comp['type'].upper()}")
+        lines.append(f"    Description: {comp['description']}")
+        lines.append(f"    Priority: {comp['priority']}")
 
-    print(f"\nDependencies ({len(analysis['dependencies'])}):")
-    for dep in analysis["dependencies"]:
-        print(f"  - {dep['depends_on']}: {dep['reason']}")
+    lines.append(f"\nDependencies ({len(analysis['dependencies'])}):")
+    lines.extend(
+        f"  - {dep['depends_on']}: {dep['reason']}" for dep in analysis["dependencies"]
+    )
 
-    print(f"\nEstimated Resources:")
     resources = analysis["estimated_resources"]
-    print(f"  Min Agents: {resources['min_agents']}")
-    print(f"  Max Agents: {resources['max_agents']}")
-    print(f"  Estimated Duration: {resources['estimated_duration']}s")
+    lines.append(f"\nEstimated Resources:")
+    lines.append(f"  Min Agents: {resources['min_agents']}")
+    lines.append(f"  Max Agents: {resources['max_agents']}")
+    lines.append(f"  Estimated Duration: {resources['estimated_duration']}s")
 
     if args.json_output:
-        print(f"\n{'=' * 60}")
-        print("JSON OUTPUT")
-        print(f"{'=' * 60}")
-        print(json.dumps(analysis, indent=2, default=str))
+        lines.append(f"\n{'=' * 60}")
+        lines.append("JSON OUTPUT")
+        lines.append(f"{'=' * 60}")
+        lines.append(to_json(analysis))
 
+    _write_lines(lines)
     return 0
 
 
 def main() -> int:
     """Main entry point"""
+    configure_logging("team_orchestrator.log")
+
     parser = argparse.ArgumentParser(
         description="Agent Team Orchestrator CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -239,6 +325,18 @@ Examples:
         action="store_true",
         help="Output results as JSON",
     )
+    orchestrate_parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Re-analyze and re-plan instead of reusing cached results",
+    )
+    orchestrate_parser.add_argument(
+        "--format",
+        dest="storage_format",
+        choices=["json", "msgpack"],
+        help="Memory store format (default: existing store, else msgpack if installed)",
+    )
     orchestrate_parser.set_defaults(func=cmd_orchestrate)
 
     # Status command
@@ -268,6 +366,15 @@ Examples:
         action="store_true",
         help="Output results as JSON",
     )
+    analyze_parser.add_argument(
+        "--storage", "-d", dest="storage_path", help="Path to storage location"
+    )
+    analyze_parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Re-analyze the request instead of reusing a cached analysis",
+    )
     analyze_parser.set_defaults(func=cmd_analyze)
 
     args = parser.parse_args()
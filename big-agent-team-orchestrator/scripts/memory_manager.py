@@ -6,24 +6,98 @@ This script manages shared memory spaces, context injection for agent handoffs,
 tracks project state and decision history, enables cross-agent knowledge sharing.
 """
 
+import bisect
+import contextlib
+import heapq
 import json
+import os
 import time
 import logging
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict, field
+from itertools import count, islice
+from typing import Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 import threading
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # only used to stream legacy snapshots
+    ijson = None
+
+try:
+    import msgpack
+except ImportError:  # binary journal format is optional
+    msgpack = None
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
-class MemoryType(Enum):
+if orjson is not None:
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+
+else:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+
+# Journal file name per storage format
+_STORE_FILES = {"json": "memory_store.jsonl", "msgpack": "memory_store.mp"}
+
+
+class _JournalReader:
+    """
+    Iterates the records of a JSON-lines or msgpack journal stream
+
+    After iteration, torn tells whether the stream ended partway through a
+    record (an interrupted append); that tail is skipped.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.torn = False
+
+    def __iter__(self):
+        f = self.f
+        # Records are always maps: '{' starts JSON, msgpack maps start >= 0x80
+        if f.peek(1)[:1] in (b"{", b""):
+            for line in f:
+                if not line.endswith(b"\n"):
+                    self.torn = True
+                if not line.strip():
+                    continue
+                try:
+                    yield _loads(line)
+                except ValueError:
+                    if not self.torn:
+                        raise
+                    logger.warning("Ignoring truncated record at end of journal")
+        else:
+            unpacker = msgpack.Unpacker(f, raw=False, strict_map_key=False)
+            yield from unpacker
+            # The unpacker read to the end; bytes it did not consume are the
+            # start of a record that was never finished
+            if unpacker.tell() != f.tell():
+                self.torn = True
+                logger.warning("Ignoring truncated record at end of journal")
+
+
+class MemoryType(str, Enum):
     """Types of memory that can exist"""
 
     TASK_RESULTS = "task_results"
@@ -33,7 +107,11 @@ class MemoryType(Enum):
     TEMPORARY = "temporary"
 
 
-@dataclass
+# Direct value -> member lookup for the journal replay loop
+_MT_BY_VALUE = {m.value: m for m in MemoryType}
+
+
+@dataclass(slots=True)
 class MemoryEntry:
     """Represents a piece of stored memory"""
 
@@ -45,14 +123,20 @@ class MemoryEntry:
     source_agent: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        if self.created_at == 0:
-            self.created_at = time.time()
-        if self.accessed_at == 0:
-            self.accessed_at = time.time()
+    def to_plain(self) -> Dict[str, Any]:
+        """Shallow serializable dict; nested values are shared, not copied"""
+        return {
+            "id": self.id,
+            "content": self.content,
+            "memory_type": self.memory_type.value,
+            "created_at": self.created_at,
+            "accessed_at": self.accessed_at,
+            "source_agent": self.source_agent,
+            "metadata": self.metadata,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class SharedContext:
     """Represents a shared context for the entire team"""
 
@@ -65,50 +149,132 @@ class SharedContext:
     agent_states: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     dependencies: List[str] = field(default_factory=list)
 
-    def __post_init__(self):
-        if self.created_at == 0:
-            self.created_at = time.time()
-        if self.last_updated == 0:
-            self.last_updated = time.time()
+    def to_plain(self) -> Dict[str, Any]:
+        """Shallow serializable dict; nested values are shared, not copied"""
+        return {
+            "project_id": self.project_id,
+            "name": self.name,
+            "description": self.description,
+            "created_at": self.created_at,
+            "last_updated": self.last_updated,
+            "global_state": self.global_state,
+            "agent_states": self.agent_states,
+            "dependencies": self.dependencies,
+        }
 
 
 class MemoryManager:
     """Main memory management class for multi-agent coordination"""
 
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        threadsafe: bool = False,
+        storage_format: Optional[str] = None,
+    ):
         """
         Initialize the memory manager
 
         Args:
             storage_path: Path to store persistent memory (optional)
+            threadsafe: Guard every operation with a re-entrant lock. Must be
+                True when agents running on several threads share the manager;
+                single-threaded callers such as the CLI skip the locking cost.
+            storage_format: "json" or "msgpack" journal. Defaults to the format
+                of an existing store, else msgpack when it is installed.
         """
         self.storage_path = storage_path
         self.contexts: Dict[str, SharedContext] = {}
         self.memory_entries: Dict[str, MemoryEntry] = {}
-        self.context_memory_map: Dict[str, List[str]] = {}
-        self.lock = threading.RLock()
+        # None until a context's first entry, so empty contexts cost no list
+        self.context_memory_map: Dict[str, Optional[List[str]]] = {}
+        self.lock = threading.RLock() if threadsafe else contextlib.nullcontext()
+
+        # (context_id, memory_type) -> [(created_at, entry_id)] kept ascending,
+        # so newest-first queries read from the tail without sorting
+        self._ctx_type_index: Dict[
+            Tuple[str, MemoryType], List[Tuple[float, str]]
+        ] = {}
+
+        # Ids changed since the last save_to_disk; only these are journaled
+        self._dirty_entries: Set[str] = set()
+        self._dirty_contexts: Set[str] = set()
+        self._dirty_maps: Set[str] = set()
+        # Length of each context's id list as far as the journal has it, so
+        # a save only appends the ids added since
+        self._map_logged: Dict[str, int] = {}
+
+        # Entry ids are "mem-<epoch>-<n>": the epoch is fixed per manager
+        # (milliseconds, so a reloading process gets a fresh prefix) and n
+        # comes from a counter instead of a clock read per entry
+        self._id_epoch = int(time.time() * 1000)
+        self._id_counter = count()
+
+        # Journal bookkeeping: records currently in the file, and whether the
+        # in-memory state is a superset of it (required before compacting)
+        self._log_records = 0
+        self._log_synced = False
+
+        self.storage_format: Optional[str] = None
+        self.store_file: Optional[Path] = None
 
         # Create storage directory if needed
         if self.storage_path:
             Path(self.storage_path).mkdir(parents=True, exist_ok=True)
+            self.storage_format = self._resolve_format(storage_format)
+            self.store_file = (
+                Path(self.storage_path) / _STORE_FILES[self.storage_format]
+            )
+            self._log_synced = not self.store_file.exists()
 
         logger.info("Memory Manager initialized")
 
-    def create_context(self, context: SharedContext) -> str:
+    def _resolve_format(self, storage_format: Optional[str]) -> str:
+        """Pick the journal format for this storage path"""
+        if storage_format is None:
+            for fmt, filename in _STORE_FILES.items():
+                if (Path(self.storage_path) / filename).exists():
+                    if fmt == "msgpack" and msgpack is None:
+                        raise ImportError(f"Reading {filename} requires msgpack")
+                    return fmt
+            return "msgpack" if msgpack is not None else "json"
+
+        if storage_format not in _STORE_FILES:
+            raise ValueError(f"Unsupported storage format: {storage_format}")
+        if storage_format == "msgpack" and msgpack is None:
+            raise ImportError("storage_format='msgpack' requires msgpack")
+        return storage_format
+
+    def _encode(self, record: Dict[str, Any]) -> bytes:
+        if self.storage_format == "msgpack":
+            return msgpack.packb(record, use_bin_type=True)
+        return _dumps(record) + b"\n"
+
+    def create_context(
+        self, context: SharedContext, context_id: Optional[str] = None
+    ) -> str:
         """
         Create and initialize a new shared context
 
         Args:
             context: The SharedContext to create
+            context_id: ID to register the context under; defaults to (and
+                otherwise overrides) context.project_id
 
         Returns:
             context_id: The ID of the created context
         """
         with self.lock:
-            context_id = context.project_id
+            if context_id is None:
+                context_id = context.project_id
+            else:
+                context.project_id = context_id
             self.contexts[context_id] = context
-            self.context_memory_map[context_id] = []
-            logger.info(f"Created context: {context_id}")
+            self.context_memory_map[context_id] = None
+            self._map_logged.pop(context_id, None)
+            self._dirty_contexts.add(context_id)
+            self._dirty_maps.add(context_id)
+            logger.info("Created context: %s", context_id)
             return context_id
 
     def get_context(self, context_id: str) -> Optional[SharedContext]:
@@ -138,37 +304,93 @@ class MemoryManager:
             entry_id: The ID of the created memory entry
         """
         with self.lock:
-            entry = MemoryEntry(
-                id=f"mem-{int(time.time())}-{len(self.memory_entries)}",
-                content=content,
-                memory_type=memory_type,
-                source_agent=source_agent,
-                metadata=metadata or {},
+            entry = self._insert_memory(
+                content, memory_type, source_agent, context_id, metadata
             )
 
-            self.memory_entries[entry.id] = entry
-
-            # Add to appropriate context
-            if context_id:
-                if context_id not in self.context_memory_map:
-                    self.context_memory_map[context_id] = []
-                self.context_memory_map[context_id].append(entry.id)
-            else:
-                for cid, mids in self.context_memory_map.items():
-                    if cid in [c.project_id for c in self.contexts.values()]:
-                        self.context_memory_map[cid].append(entry.id)
-
             logger.info(
-                f"Added memory entry: {entry.id} (type={memory_type.value}, "
-                f"agent={source_agent}, context={context_id})"
+                "Added memory entry: %s (type=%s, agent=%s, context=%s)",
+                entry.id,
+                memory_type.value,
+                entry.source_agent,
+                context_id,
             )
             return entry.id
 
+    def add_memories(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add several memory entries under a single lock acquisition
+
+        Args:
+            entries: Keyword arguments for add_memory, one dict per entry
+
+        Returns:
+            IDs of the created entries, in input order
+        """
+        with self.lock:
+            entry_ids = [
+                self._insert_memory(
+                    spec["content"],
+                    spec["memory_type"],
+                    spec.get("source_agent", ""),
+                    spec.get("context_id", ""),
+                    spec.get("metadata"),
+                ).id
+                for spec in entries
+            ]
+
+            logger.info("Added %d memory entries", len(entry_ids))
+            return entry_ids
+
+    def _insert_memory(
+        self,
+        content: Dict[str, Any],
+        memory_type: MemoryType,
+        source_agent: str,
+        context_id: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> MemoryEntry:
+        """Create, store and index one entry; the caller holds the lock"""
+        # Agent ids come from a small closed set; share one str per id
+        source_agent = sys.intern(source_agent) if source_agent else ""
+
+        entry = MemoryEntry(
+            id=f"mem-{self._id_epoch}-{next(self._id_counter)}",
+            content=content,
+            memory_type=memory_type,
+            source_agent=source_agent,
+            metadata=metadata or {},
+        )
+
+        self.memory_entries[entry.id] = entry
+        self._dirty_entries.add(entry.id)
+
+        # Add to appropriate context
+        if context_id:
+            mids = self.context_memory_map.get(context_id)
+            if mids is None:
+                mids = self.context_memory_map[context_id] = []
+            mids.append(entry.id)
+            self._dirty_maps.add(context_id)
+            self._index_entry(context_id, entry)
+        else:
+            # contexts is keyed by project_id, so membership is O(1)
+            for cid, mids in self.context_memory_map.items():
+                if cid in self.contexts:
+                    if mids is None:
+                        mids = self.context_memory_map[cid] = []
+                    mids.append(entry.id)
+                    self._dirty_maps.add(cid)
+                    self._index_entry(cid, entry)
+
+        return entry
+
     def get_context_memory(
         self,
         context_id: str,
         memory_type: Optional[MemoryType] = None,
         limit: Optional[int] = None,
+        touch: bool = True,
     ) -> List[MemoryEntry]:
         """
         Retrieve memory entries for a specific context
@@ -177,6 +399,8 @@ class MemoryManager:
             context_id: The context to query
             memory_type: Filter by memory type (optional)
             limit: Maximum number of entries to return (optional)
+            touch: Stamp accessed_at on the returned entries; read-only
+                callers such as status displays pass False
 
         Returns:
             List of memory entries
@@ -186,31 +410,51 @@ class MemoryManager:
             if not context:
                 return []
 
-            # Get all memory IDs for this context
-            memory_ids = self.context_memory_map.get(context_id, [])
-
-            # Filter by type if specified
+            # Newest-first (created_at, entry_id) pairs for this context
             if memory_type:
-                memory_ids = [
-                    mid
-                    for mid in memory_ids
-                    if self.memory_entries[mid].memory_type == memory_type
-                ]
-
-            # Retrieve entries
-            entries = [self.memory_entries[mid] for mid in memory_ids]
-            entries.sort(key=lambda x: x.created_at, reverse=True)
+                ordered = reversed(
+                    self._ctx_type_index.get((context_id, memory_type), [])
+                )
+            else:
+                ordered = heapq.merge(
+                    *(
+                        reversed(self._ctx_type_index[(context_id, mt)])
+                        for mt in MemoryType
+                        if (context_id, mt) in self._ctx_type_index
+                    ),
+                    reverse=True,
+                )
 
             # Apply limit
             if limit:
-                entries = entries[:limit]
+                ordered = islice(ordered, limit)
 
-            # Update access times
-            for entry in entries:
-                entry.accessed_at = time.time()
+            entries = [self.memory_entries[mid] for _, mid in ordered]
+
+            # Update access times with a single clock read
+            if touch:
+                now = time.time()
+                for entry in entries:
+                    entry.accessed_at = now
 
             return entries
 
+    def _index_entry(self, context_id: str, entry: MemoryEntry) -> None:
+        """Record an entry in the per-(context, type) recency index"""
+        bisect.insort(
+            self._ctx_type_index.setdefault((context_id, entry.memory_type), []),
+            (entry.created_at, entry.id),
+        )
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the recency index from context_memory_map after a load"""
+        self._ctx_type_index = {}
+        for cid, mids in self.context_memory_map.items():
+            for mid in mids or ():
+                entry = self.memory_entries.get(mid)
+                if entry is not None:
+                    self._index_entry(cid, entry)
+
     def add_to_agent_state(
         self,
         context_id: str,
@@ -228,7 +472,7 @@ class MemoryManager:
         with self.lock:
             context = self.contexts.get(context_id)
             if not context:
-                logger.warning(f"Context {context_id} not found")
+                logger.warning("Context %s not found", context_id)
                 return
 
             if not state_data:
@@ -240,8 +484,68 @@ class MemoryManager:
             # Merge with existing state
             context.agent_states[agent_id].update(state_data)
             context.last_updated = time.time()
+            self._dirty_contexts.add(context_id)
+
+            logger.info("Updated agent %s state in context %s", agent_id, context_id)
+
+    def update_agent_states(
+        self, context_id: str, states: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """
+        Merge state for several agents within a context in one update
+
+        Args:
+            context_id: The context to update
+            states: New state data to add/merge, keyed by agent id
+        """
+        with self.lock:
+            context = self.contexts.get(context_id)
+            if not context:
+                logger.warning("Context %s not found", context_id)
+                return
+
+            agent_states = context.agent_states
+            for agent_id, state_data in states.items():
+                agent_states.setdefault(agent_id, {}).update(state_data)
+            context.last_updated = time.time()
+            self._dirty_contexts.add(context_id)
+
+            logger.info(
+                "Updated %d agent states in context %s", len(states), context_id
+            )
+
+    def update_global_state(self, context_id: str, state: Dict[str, Any]) -> None:
+        """
+        Merge keys into a context's global state
+
+        Args:
+            context_id: The context to update
+            state: New global state to add/merge
+        """
+        with self.lock:
+            context = self.contexts.get(context_id)
+            if not context:
+                logger.warning("Context %s not found", context_id)
+                return
+
+            context.global_state.update(state)
+            self.mark_context_dirty(context_id)
+
+    def mark_context_dirty(self, context_id: str) -> None:
+        """
+        Have the next save persist a context edited in place
+
+        Changes made directly on a SharedContext (e.g. its global_state) are
+        not tracked; call this afterwards so save_to_disk journals them.
+        """
+        with self.lock:
+            context = self.contexts.get(context_id)
+            if not context:
+                logger.warning("Context %s not found", context_id)
+                return
 
-            logger.info(f"Updated agent {agent_id} state in context {context_id}")
+            context.last_updated = time.time()
+            self._dirty_contexts.add(context_id)
 
     def get_agent_state(
         self, context_id: str, agent_id: str = "", keys: Optional[List[str]] = None
@@ -269,40 +573,158 @@ class MemoryManager:
 
             return agent_state
 
+    def _context_record(self, context_id: str) -> Dict[str, Any]:
+        return {
+            "kind": "ctx",
+            "id": context_id,
+            "data": self.contexts[context_id].to_plain(),
+        }
+
+    def _entry_record(self, entry_id: str) -> Dict[str, Any]:
+        return {
+            "kind": "entry",
+            "id": entry_id,
+            "data": self.memory_entries[entry_id].to_plain(),
+        }
+
+    def _map_record(self, context_id: str, full: bool = False) -> Dict[str, Any]:
+        ids = self.context_memory_map.get(context_id) or []
+        logged = None if full else self._map_logged.get(context_id)
+        if logged is not None and logged <= len(ids):
+            # Id lists only grow, so the journal already has this prefix
+            return {"kind": "map+", "id": context_id, "ids": ids[logged:]}
+        return {"kind": "map", "id": context_id, "ids": ids}
+
+    def _map_lengths(self) -> Dict[str, int]:
+        return {cid: len(mids or ()) for cid, mids in self.context_memory_map.items()}
+
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Replay a single journal record (last writer wins per id)"""
+        kind = record["kind"]
+        if kind == "ctx":
+            self._load_context(record["data"])
+        elif kind == "entry":
+            self._load_entry(record["data"])
+        elif kind == "map":
+            self.context_memory_map[record["id"]] = record["ids"] or None
+        elif kind == "map+":
+            mids = self.context_memory_map.get(record["id"])
+            if mids is None:
+                mids = self.context_memory_map[record["id"]] = []
+            mids.extend(record["ids"])
+
+    def _load_context(self, ctx_data: Dict[str, Any]) -> None:
+        self.contexts[ctx_data["project_id"]] = SharedContext(
+            project_id=ctx_data["project_id"],
+            name=ctx_data["name"],
+            description=ctx_data["description"],
+            created_at=ctx_data["created_at"],
+            last_updated=ctx_data["last_updated"],
+            global_state=ctx_data.get("global_state", {}),
+            agent_states=ctx_data.get("agent_states", {}),
+            dependencies=ctx_data.get("dependencies", []),
+        )
+
+    def _load_entry(self, entry_data: Dict[str, Any]) -> None:
+        self.memory_entries[entry_data["id"]] = MemoryEntry(
+            id=entry_data["id"],
+            content=entry_data["content"],
+            memory_type=_MT_BY_VALUE[entry_data["memory_type"]],
+            created_at=entry_data["created_at"],
+            accessed_at=entry_data.get("accessed_at"),
+            source_agent=sys.intern(entry_data.get("source_agent") or ""),
+            metadata=entry_data.get("metadata", {}),
+        )
+
+    def _snapshot_size(self) -> int:
+        """Number of records a freshly compacted journal would hold"""
+        return (
+            len(self.contexts) + len(self.memory_entries) + len(self.context_memory_map)
+        )
+
     def save_to_disk(self) -> None:
-        """Save memory state to disk for persistence"""
+        """
+        Save memory state to disk for persistence
+
+        Only contexts and entries changed since the previous save, and the
+        ids added to each context since then, are appended to the journal;
+        nothing is written when nothing changed. The file is compacted once
+        it holds more than twice the records needed to describe the current
+        state.
+        """
         if not self.storage_path:
             return
 
         with self.lock:
+            if not (self._dirty_contexts or self._dirty_entries or self._dirty_maps):
+                return
+
             try:
-                save_data = {
-                    "contexts": {
-                        cid: asdict(ctx) for cid, ctx in self.contexts.items()
-                    },
-                    "memory_entries": {
-                        eid: {
-                            "id": e.id,
-                            "content": e.content,
-                            "memory_type": e.memory_type.value,
-                            "created_at": e.created_at,
-                            "accessed_at": e.accessed_at,
-                            "source_agent": e.source_agent,
-                            "metadata": e.metadata,
-                        }
-                        for eid, e in self.memory_entries.items()
-                    },
-                    "context_memory_map": self.context_memory_map,
-                }
-
-                filepath = Path(self.storage_path) / "memory_store.json"
-                with open(filepath, "w") as f:
-                    json.dump(save_data, f, indent=2)
-
-                logger.info(f"Saved memory state to {filepath}")
+                records = (
+                    [self._context_record(cid) for cid in self._dirty_contexts]
+                    + [self._entry_record(eid) for eid in self._dirty_entries]
+                    + [self._map_record(cid) for cid in self._dirty_maps]
+                )
+
+                with open(self.store_file, "ab") as f:
+                    f.writelines(self._encode(record) for record in records)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                self._log_records += len(records)
+                for cid in self._dirty_maps:
+                    self._map_logged[cid] = len(self.context_memory_map.get(cid) or ())
+                self._dirty_contexts.clear()
+                self._dirty_entries.clear()
+                self._dirty_maps.clear()
+
+                logger.info("Appended %d records to %s", len(records), self.store_file)
+
+                if self._log_synced and self._log_records > 2 * self._snapshot_size():
+                    self.compact()
 
             except Exception as e:
-                logger.error(f"Error saving memory state: {e}")
+                logger.error("Error saving memory state: %s", e)
+
+    def compact(self) -> None:
+        """
+        Rewrite the journal from in-memory state, one record per live id
+
+        The in-memory state must already include everything in the journal
+        (i.e. call load_from_disk first when reusing an existing store),
+        otherwise records written by other processes are dropped.
+        """
+        if not self.storage_path:
+            return
+
+        with self.lock:
+            records = (
+                [self._context_record(cid) for cid in self.contexts]
+                + [self._entry_record(eid) for eid in self.memory_entries]
+                + [self._map_record(cid, full=True) for cid in self.context_memory_map]
+            )
+
+            # Write beside the journal and swap it in, so a crash mid-write
+            # leaves the previous journal intact
+            tmp_file = self.store_file.with_name(self.store_file.name + ".tmp")
+            try:
+                with open(tmp_file, "wb") as f:
+                    f.writelines(self._encode(record) for record in records)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.store_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
+
+            self._log_records = len(records)
+            self._log_synced = True
+            self._map_logged = self._map_lengths()
+            self._dirty_contexts.clear()
+            self._dirty_entries.clear()
+            self._dirty_maps.clear()
+
+            logger.info("Compacted memory journal to %d records", len(records))
 
     def load_from_disk(self) -> int:
         """
@@ -316,52 +738,71 @@ class MemoryManager:
 
         with self.lock:
             try:
-                filepath = Path(self.storage_path) / "memory_store.json"
-                if not filepath.exists():
-                    return 0
-
-                with open(filepath, "r") as f:
-                    save_data = json.load(f)
-
-                # Reconstruct contexts
-                for ctx_id, ctx_data in save_data.get("contexts", {}).items():
-                    self.contexts[ctx_id] = SharedContext(
-                        project_id=ctx_data["project_id"],
-                        name=ctx_data["name"],
-                        description=ctx_data["description"],
-                        created_at=ctx_data["created_at"],
-                        last_updated=ctx_data["last_updated"],
-                        global_state=ctx_data.get("global_state", {}),
-                        agent_states=ctx_data.get("agent_states", {}),
-                        dependencies=ctx_data.get("dependencies", []),
-                    )
-
-                # Reconstruct memory entries
-                entry_ids = []
-                for eid, entry_data in save_data.get("memory_entries", {}).items():
-                    self.memory_entries[eid] = MemoryEntry(
-                        id=entry_data["id"],
-                        content=entry_data["content"],
-                        memory_type=MemoryType(entry_data["memory_type"]),
-                        created_at=entry_data["created_at"],
-                        accessed_at=entry_data.get("accessed_at"),
-                        source_agent=entry_data.get("source_agent"),
-                        metadata=entry_data.get("metadata", {}),
-                    )
-                    entry_ids.append(eid)
-
-                # Reconstruct context map
-                self.context_memory_map = save_data.get("context_memory_map", {})
+                if not self.store_file.exists():
+                    return self._load_legacy_store()
+
+                records = 0
+                with open(self.store_file, "rb") as f:
+                    reader = _JournalReader(f)
+                    for record in reader:
+                        self._apply_record(record)
+                        records += 1
+
+                self._log_records = records
+                self._log_synced = True
+                self._map_logged = self._map_lengths()
+                self._rebuild_index()
+
+                if reader.torn:
+                    # Drop the torn tail before anything is appended after it
+                    self.compact()
 
                 logger.info(
-                    f"Loaded {len(self.memory_entries)} memory entries from disk"
+                    "Loaded %d memory entries from disk", len(self.memory_entries)
                 )
                 return len(self.memory_entries)
 
             except Exception as e:
-                logger.error(f"Error loading memory state: {e}")
+                logger.error("Error loading memory state: %s", e)
                 return 0
 
+    def _load_legacy_store(self) -> int:
+        """Import a pre-journal memory_store.json snapshot, if present"""
+        filepath = Path(self.storage_path) / "memory_store.json"
+        if not filepath.exists():
+            return 0
+
+        sections = ("contexts", "memory_entries", "context_memory_map")
+        if ijson is not None:
+            # Stream one record at a time instead of materializing the tree
+            items = {key: _stream_section(filepath, key) for key in sections}
+        else:
+            save_data = _loads(filepath.read_bytes())
+            items = {key: save_data.get(key, {}).items() for key in sections}
+
+        for _, ctx_data in items["contexts"]:
+            self._load_context(ctx_data)
+        for _, entry_data in items["memory_entries"]:
+            self._load_entry(entry_data)
+        self.context_memory_map = dict(items["context_memory_map"])
+        self._rebuild_index()
+
+        # Everything goes into the journal on the next save
+        self._dirty_contexts.update(self.contexts)
+        self._dirty_entries.update(self.memory_entries)
+        self._dirty_maps.update(self.context_memory_map)
+
+        logger.info(
+            "Imported %d memory entries from %s", len(self.memory_entries), filepath
+        )
+        return len(self.memory_entries)
+
+
+def _stream_section(filepath: Path, key: str):
+    """Yield (key, value) pairs of one top-level object in a JSON file"""
+    with open(filepath, "rb") as f:
+        yield from ijson.kvitems(f, key, use_float=True)
+
 
 class ContextInjector:
     """Helper class for context injection scenarios"""
@@ -413,21 +854,28 @@ class ContextInjector:
         )
 
         # Merge global state
-        merged.global_state = primary_context.global_state.copy()
-        merged.global_state.update(secondary_context.global_state)
+        merged.global_state = (
+            primary_context.global_state | secondary_context.global_state
+        )
 
-        # Merge agent states
-        for agent_id, state in secondary_context.agent_states.items():
-            if agent_id in merged.agent_states:
-                merged.agent_states[agent_id].update(state)
-            else:
-                merged.agent_states[agent_id] = state
+        # Merge agent states; per-agent state from both sides, secondary wins
+        primary_agents = primary_context.agent_states
+        secondary_agents = secondary_context.agent_states
+        merged.agent_states = {
+            agent_id: primary_agents.get(agent_id, {})
+            | secondary_agents.get(agent_id, {})
+            for agent_id in primary_agents | secondary_agents
+        }
 
         return merged
 
 
 def main():
     """Example usage of the Memory Manager"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
 
     # Initialize memory manager
     manager = MemoryManager(storage_path="/tmp/agent_team_memory")
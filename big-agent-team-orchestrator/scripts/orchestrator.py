@@ -7,9 +7,15 @@ coordination system, combining task analysis, agent selection, workflow executio
 and memory management.
 """
 
+import functools
+import hashlib
 import json
 import logging
+import re
+from collections import defaultdict
+from itertools import count
 import time
+import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
@@ -32,14 +38,120 @@ from scripts.team_coordinator import (
 from scripts.memory_manager import MemoryManager, SharedContext, MemoryType
 from scripts.workflow_engine import WorkflowEngine, TaskNode, ExecutionStrategy
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("team_orchestrator.log"), logging.StreamHandler()],
-)
 logger = logging.getLogger(__name__)
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def configure_logging(path: Optional[str] = None, level: int = logging.INFO) -> None:
+    """
+    Send log records to stderr, and to a file when a path is given
+
+    Meant for entry points only; importing the orchestration modules does
+    not touch logging configuration.
+
+    Args:
+        path: Log file to append to (optional)
+        level: Root logger level
+    """
+    handlers: List[logging.Handler] = [logging.StreamHandler()]
+    if path:
+        handlers.append(logging.FileHandler(path))
+    logging.basicConfig(level=level, format=LOG_FORMAT, handlers=handlers)
+
+
+# Bump when the shape of analyze_requirements output changes so stale
+# cached analyses are not reused
+_ANALYSIS_FORMAT = 3
+
+# Component types in the order they are reported, with their task metadata
+_COMPONENT_SPECS = {
+    "frontend": (2, "Frontend implementation"),
+    "backend": (2, "Backend implementation"),
+    "database": (2, "Database setup and operations"),
+    "testing": (2, "Testing and validation"),
+    "deployment": (3, "Deployment and configuration"),
+}
+
+# Keywords that identify each component type
+_COMPONENT_KEYWORDS = {
+    "frontend": "frontend",
+    "ui": "frontend",
+    "backend": "backend",
+    "api": "backend",
+    "database": "database",
+    "db": "database",
+    "testing": "testing",
+    "test": "testing",
+    "deployment": "deployment",
+    "deploy": "deployment",
+}
+
+# Keywords must start a word ("ui" is not found in "build") but may be
+# followed by a suffix ("apis", "tests", "deployed")
+_COMPONENT_RE = re.compile(
+    r"\b(?:" + "|".join(sorted(_COMPONENT_KEYWORDS, key=len, reverse=True)) + ")"
+)
+
+
+def _disk_cached_analysis(func):
+    """Serve analyze_requirements from analysis_cache_dir, keyed on the request"""
+
+    @functools.wraps(func)
+    def wrapper(self, user_request: str) -> Dict[str, Any]:
+        if self.analysis_cache_dir is None:
+            return func(self, user_request)
+
+        key = hashlib.blake2b(
+            f"{_ANALYSIS_FORMAT}:{user_request}".encode(), digest_size=16
+        ).hexdigest()
+        cache_file = self.analysis_cache_dir / f"{key}.json"
+
+        try:
+            analysis = json.loads(cache_file.read_text())
+            logger.info("Using cached analysis: %s", cache_file.name)
+            return analysis
+        except (OSError, ValueError):
+            pass
+
+        analysis = func(self, user_request)
+        try:
+            self.analysis_cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(analysis))
+        except OSError as e:
+            logger.warning("Could not cache analysis: %s", e)
+        return analysis
+
+    return wrapper
+
+
+# Agent (id, name, capabilities) per component type; unlisted types go to
+# the frontend specialist
+_DEFAULT_AGENT = (
+    "frontend-dev",
+    "Frontend Specialist",
+    ("react", "vue", "css", "javascript", "html", "api-consumption"),
+)
+_BACKEND_AGENT = (
+    "backend-dev",
+    "Backend Developer",
+    ("nodejs", "python", "api-design", "database", "rest", "authentication"),
+)
+_AGENT_DEFS = {
+    "backend": _BACKEND_AGENT,
+    "api": _BACKEND_AGENT,
+    "testing": (
+        "qa-specialist",
+        "Quality Assurance Specialist",
+        ("testing", "testing-frameworks", "validation", "quality-control"),
+    ),
+    "deployment": (
+        "devops-lead",
+        "DevOps Engineer",
+        ("deployment", "ci-cd", "configuration", "infrastructure"),
+    ),
+}
+
 
 class OrchestrationStrategy(Enum):
     """Strategies for coordinating multiple agents"""
@@ -56,6 +168,8 @@ class AgentTeamOrchestrator:
         self,
         strategy: OrchestrationStrategy = OrchestrationStrategy.AUTOMATIC,
         storage_path: Optional[str] = None,
+        use_analysis_cache: bool = False,
+        storage_format: Optional[str] = None,
     ):
         """
         Initialize the orchestrator
@@ -63,21 +177,50 @@ class AgentTeamOrchestrator:
         Args:
             strategy: Coordination strategy to use
             storage_path: Path for persistent storage
+            use_analysis_cache: Reuse analyses and execution plans of identical
+                requests stored under storage_path/analysis_cache and
+                storage_path/plan_cache (requires storage_path)
+            storage_format: Memory journal format ("json" or "msgpack")
         """
         self.strategy = strategy
+        self.analysis_cache_dir: Optional[Path] = (
+            Path(storage_path) / "analysis_cache"
+            if storage_path and use_analysis_cache
+            else None
+        )
 
         # Initialize sub-systems
         self.team_coordinator = TeamCoordinator()
-        self.memory_manager = MemoryManager(storage_path=storage_path)
-        self.workflow_engine = WorkflowEngine()
+        # Not threadsafe: the workflow engine's worker threads only run tasks
+        # and never see the manager; all memory reads and writes happen on
+        # the calling thread, before and after execute_workflow
+        self.memory_manager = MemoryManager(
+            storage_path=storage_path, storage_format=storage_format
+        )
+        self.workflow_engine = WorkflowEngine(
+            plan_cache_dir=(
+                str(Path(storage_path) / "plan_cache")
+                if storage_path and use_analysis_cache
+                else None
+            )
+        )
 
         # State management
         self.active_contexts: Dict[str, SharedContext] = {}
         self.active_tasks: Dict[str, Task] = {}
         self.execution_monitoring: Dict[str, float] = {}
 
+        # Tasks built from "general" components; validated as quality gates
+        self._general_task_ids: List[str] = []
+
+        # Context ids are "project-<run>-<n>": a random prefix per orchestrator
+        # keeps ids unique across runs sharing a store, the counter within one
+        self._context_prefix = uuid.uuid4().hex[:12]
+        self._context_counter = count()
+
         logger.info("Agent Team Orchestrator initialized")
 
+    @_disk_cached_analysis
     def analyze_requirements(self, user_request: str) -> Dict[str, Any]:
         """
         Analyze and decompose user requirements
@@ -88,7 +231,7 @@ class AgentTeamOrchestrator:
         Returns:
             Analysis results with task breakdown
         """
-        logger.info(f"Analyzing requirements: {user_request}")
+        logger.info("Analyzing requirements: %s", user_request)
 
         analysis = {
             "original_request": user_request,
@@ -102,84 +245,41 @@ class AgentTeamOrchestrator:
             },
         }
 
-        # Simple keyword-based component detection
-        components = []
-
-        if "frontend" in user_request.lower() or "ui" in user_request.lower():
-            components.append(
-                {
-                    "type": "frontend",
-                    "priority": 2,
-                    "description": "Frontend implementation",
-                }
-            )
-
-        if "backend" in user_request.lower() or "api" in user_request.lower():
-            components.append(
-                {
-                    "type": "backend",
-                    "priority": 2,
-                    "description": "Backend implementation",
-                }
-            )
-
-        if "database" in user_request.lower() or "db" in user_request.lower():
-            components.append(
-                {
-                    "type": "database",
-                    "priority": 2,
-                    "description": "Database setup and operations",
-                }
-            )
-
-        if "testing" in user_request.lower() or "test" in user_request.lower():
-            components.append(
-                {
-                    "type": "testing",
-                    "priority": 2,
-                    "description": "Testing and validation",
-                }
-            )
-
-        if "deploy" in user_request.lower() or "deployment" in user_request.lower():
-            components.append(
-                {
-                    "type": "deployment",
-                    "priority": 3,
-                    "description": "Deployment and configuration",
-                }
-            )
+        # Keyword-based component detection in a single pass over the request
+        found = {
+            _COMPONENT_KEYWORDS[m.group()]
+            for m in _COMPONENT_RE.finditer(user_request.lower())
+        }
+        detected = [
+            (comp_type, priority, description)
+            for comp_type, (priority, description) in _COMPONENT_SPECS.items()
+            if comp_type in found
+        ]
 
         # Add default component if none found
-        if not components:
-            components.append(
-                {
-                    "type": "general",
-                    "priority": 1,
-                    "description": "General implementation task",
-                }
-            )
-
+        if not detected:
+            detected = [("general", 1, "General implementation task")]
+
+        components = [
+            {
+                "type": comp_type,
+                "priority": priority,
+                "description": description,
+                "id": f"component-{i}",
+            }
+            for i, (comp_type, priority, description) in enumerate(detected)
+        ]
         analysis["components"] = components
 
-        # Calculate dependencies
-        deps = []
-        component_ids = []
-
-        for i, comp in enumerate(components):
-            comp_id = f"component-{i}"
-            component_ids.append(comp_id)
-            analysis["components"][i]["id"] = comp_id
-
-            if i > 0:
-                deps.append(
-                    {
-                        "depends_on": component_ids[i - 1],
-                        "reason": "Sequential dependency based on user request",
-                    }
-                )
-
-        analysis["dependencies"] = deps
+        # Calculate dependencies: each component follows the previous one
+        analysis["dependencies"] = [
+            {
+                "dependent": comp["id"],
+                "depends_on": prev["id"],
+                "reason": "Sequential dependency based on user request",
+            }
+            for prev, comp in zip(components, components[1:])
+        ]
 
         return analysis
 
@@ -193,64 +293,22 @@ class AgentTeamOrchestrator:
         Returns:
             List of selected agents
         """
-        logger.info(f"Selecting agents for {len(components)} components")
-
-        selected_agents: List[AgentInfo] = []
-
-        # Sample agent capabilities
-        agent_definitions = [
-            (
-                "frontend-dev",
-                "Frontend Specialist",
-                ["react", "vue", "css", "javascript", "html", "api-consumption"],
-            ),
-            (
-                "backend-dev",
-                "Backend Developer",
-                [
-                    "nodejs",
-                    "python",
-                    "api-design",
-                    "database",
-                    "rest",
-                    "authentication",
-                ],
-            ),
-            (
-                "qa-specialist",
-                "Quality Assurance Specialist",
-                ["testing", "testing-frameworks", "validation", "quality-control"],
-            ),
-            (
-                "devops-lead",
-                "DevOps Engineer",
-                ["deployment", "ci-cd", "configuration", "infrastructure"],
-            ),
-        ]
-
-        for comp in components:
-            comp_type = comp["type"]
-            priority = comp["priority"]
-
-            # Select agent based on component type
-            agent_id, agent_name, capabilities = agent_definitions[0]
-
-            if comp_type in ["backend", "api"]:
-                agent_id, agent_name, capabilities = agent_definitions[1]
-            elif comp_type == "testing":
-                agent_id, agent_name, capabilities = agent_definitions[2]
-            elif comp_type == "deployment":
-                agent_id, agent_name, capabilities = agent_definitions[3]
+        logger.info("Selecting agents for %d components", len(components))
 
-            agent = AgentInfo(
+        # Select agent based on component type
+        definitions = [_AGENT_DEFS.get(c["type"], _DEFAULT_AGENT) for c in components]
+        selected_agents = [
+            AgentInfo(
                 id=agent_id,
                 name=agent_name,
-                capabilities=capabilities,
-                specializations=[comp_type],
+                capabilities=list(capabilities),
+                specializations=[comp["type"]],
             )
-
-            selected_agents.append(agent)
-            self.team_coordinator.add_agent(agent)
+            for comp, (agent_id, agent_name, capabilities) in zip(
+                components, definitions
+            )
+        ]
+        self.team_coordinator.add_agents(selected_agents)
 
         return selected_agents
 
@@ -264,24 +322,27 @@ class AgentTeamOrchestrator:
         Returns:
             List of Task objects
         """
-        tasks = []
+        # Prerequisites of each component, built once
+        dep_index: Dict[str, List[str]] = defaultdict(list)
+        for dep in analysis["dependencies"]:
+            dep_index[dep["dependent"]].append(dep["depends_on"])
 
-        for comp in analysis["components"]:
-            task = Task(
+        tasks = [
+            Task(
                 id=comp["id"],
                 title=f"{comp['type'].capitalize()} Implementation",
                 description=comp["description"],
                 priority=comp["priority"],
-                dependencies=[
-                    dep["depends_on"]
-                    for dep in analysis["dependencies"]
-                    if dep["depends_on"] == comp["id"]
-                ],
+                dependencies=dep_index[comp["id"]],
                 metadata={"component_type": comp["type"]},
             )
+            for comp in analysis["components"]
+        ]
+        self.team_coordinator.add_tasks(tasks)
 
-            tasks.append(task)
-            self.team_coordinator.add_task(task)
+        self._general_task_ids = [
+            comp["id"] for comp in analysis["components"] if comp["type"] == "general"
+        ]
 
         return tasks
 
@@ -295,7 +356,7 @@ class AgentTeamOrchestrator:
         Returns:
             Context ID
         """
-        context_id = f"project-{time.time()}"
+        context_id = f"project-{self._context_prefix}-{next(self._context_counter)}"
 
         context = SharedContext(
             project_id=context_id,
@@ -307,7 +368,7 @@ class AgentTeamOrchestrator:
             },
         )
 
-        context_id = self.memory_manager.create_context(context)
+        self.memory_manager.create_context(context, context_id=context_id)
 
         # Add initial shared knowledge
         self.memory_manager.add_memory(
@@ -332,10 +393,10 @@ class AgentTeamOrchestrator:
         Returns:
             Execution results
         """
-        # Step 1: Create workflow tasks
-        workflow_tasks = []
-        for task in tasks:
-            workflow_task = TaskNode(
+        # Step 1: Create workflow tasks; the engine's plan runs the most
+        # critical tasks of each level first
+        workflow_tasks = [
+            TaskNode(
                 id=task.id,
                 title=task.title,
                 description=task.description,
@@ -343,58 +404,57 @@ class AgentTeamOrchestrator:
                 estimated_duration=task.estimated_duration * 1000,
                 priority=task.priority,
             )
-            workflow_tasks.append(workflow_task)
+            for task in tasks
+        ]
+        for workflow_task in workflow_tasks:
             self.workflow_engine.add_task(workflow_task)
 
-        # Step 2: Assign agents to tasks (simplified matching)
-        assigned_count = 0
-        for agent_id, agent in enumerate(agents):
-            for task in workflow_tasks:
-                if task.id not in [t.assigned_agent for t in workflow_tasks]:
-                    task.assigned_agent = f"{agent_id}-{agent_id + 1}"
-                    assigned_count += 1
-                    break
+        # Step 2: Assign agents to tasks; agents are selected per component,
+        # in the same order the tasks were created
+        for agent, workflow_task in zip(agents, workflow_tasks):
+            workflow_task.assigned_agent = agent.id
 
         # Step 3: Build workflow graph
         self.workflow_engine.build_graph()
 
         # Step 4: Create execution plan
         plan = self.workflow_engine.create_execution_plan()
-        logger.info(f"Execution plan created with {len(plan)} parallel groups")
+        logger.info("Execution plan created with %d parallel groups", len(plan))
 
-        # Step 5: Execute workflow
+        # Step 5: Execute workflow, wide enough to start every root at once
+        # (up to the engine's default worker count)
+        roots = sum(1 for t in workflow_tasks if not t.dependencies)
         results = self.workflow_engine.execute_workflow(
-            max_parallel_tasks=2,
-            quality_gates=[
-                t.id
-                for t in workflow_tasks
-                if t.metadata.get("component_type") == "general"
-            ],
+            max_parallel_tasks=min(max(2, roots), WorkflowEngine.DEFAULT_MAX_WORKERS),
+            quality_gates=self._general_task_ids,
         )
 
         # Step 6: Save results to memory
-        for result_task_id, result_data in results.items():
-            self.memory_manager.add_memory(
-                content={
-                    "task_id": result_task_id,
-                    "result": result_data,
-                    "processed_at": time.time(),
-                },
-                memory_type=MemoryType.TASK_RESULTS,
-                context_id=context_id,
-            )
+        processed_at = time.time()
+        self.memory_manager.add_memories(
+            [
+                {
+                    "content": {
+                        "task_id": result_task_id,
+                        "result": result_data,
+                        "processed_at": processed_at,
+                    },
+                    "memory_type": MemoryType.TASK_RESULTS,
+                    "context_id": context_id,
+                }
+                for result_task_id, result_data in results.items()
+            ]
+        )
 
         # Step 7: Update agent states
+        now_iso = datetime.now().isoformat()
+        agent_states: Dict[str, Dict[str, Any]] = {}
         for workflow_task in workflow_tasks:
             if workflow_task.assigned_agent:
-                self.memory_manager.add_to_agent_state(
-                    context_id,
-                    agent_id=workflow_task.assigned_agent,
-                    state_data={
-                        "status": workflow_task.status,
-                        "last_activity": datetime.now().isoformat(),
-                    },
+                agent_states.setdefault(workflow_task.assigned_agent, {}).update(
+                    status=workflow_task.status, last_activity=now_iso
                 )
+        self.memory_manager.update_agent_states(context_id, agent_states)
 
         return results
 
@@ -426,7 +486,7 @@ class AgentTeamOrchestrator:
         }
 
         try:
-            logger.info(f"=== Starting orchestration for project: {project_name} ===")
+            logger.info("=== Starting orchestration for project: %s ===", project_name)
 
             # Phase 1: Requirements Analysis
             analysis = self.analyze_requirements(user_request)
@@ -434,7 +494,7 @@ class AgentTeamOrchestrator:
 
             # Phase 2: Context Initialization
             context_id = self.initialize_shared_context(project_name)
-            logger.info(f"Initialized context: {context_id}")
+            logger.info("Initialized context: %s", context_id)
 
             # Phase 3: Agent Selection
             agents = self.select_agents_for_components(analysis["components"])
@@ -461,11 +521,11 @@ class AgentTeamOrchestrator:
             # Save final state
             self.memory_manager.save_to_disk()
 
-            logger.info(f"=== Orchestration completed: {result['success']} ===")
-            logger.info(f"Total duration: {result['total_duration']:.2f}s")
+            logger.info("=== Orchestration completed: %s ===", result["success"])
+            logger.info("Total duration: %.2fs", result["total_duration"])
 
         except Exception as e:
-            logger.error(f"Orchestration failed: {e}", exc_info=True)
+            logger.error("Orchestration failed: %s", e, exc_info=True)
             result["error"] = str(e)
 
         return result
@@ -487,6 +547,7 @@ class AgentTeamOrchestrator:
 
 def main():
     """Example usage of the Agent Team Orchestrator"""
+    configure_logging("team_orchestrator.log")
 
     # Initialize orchestrator
     orchestrator = AgentTeamOrchestrator(
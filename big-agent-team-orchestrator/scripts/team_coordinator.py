@@ -6,21 +6,52 @@ This script manages task queues, agent availability, and execution flow
 for multi-agent coordination projects.
 """
 
+import heapq
 import json
 import time
 import logging
+from array import array
+from collections import defaultdict
+from itertools import count
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode values the JSON encoders don't handle natively"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+if orjson is not None:
+
+    def to_json(obj: Any) -> str:
+        """Serialize status/result payloads as indented JSON"""
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+else:
+
+    def to_json(obj: Any) -> str:
+        """Serialize status/result payloads as indented JSON"""
+        return json.dumps(obj, indent=2, default=_json_default)
+
+
 class TaskStatus(Enum):
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -29,13 +60,17 @@ class TaskStatus(Enum):
     BLOCKED = "blocked"
 
 
+# Compact status codes for the coordinator's status column
+_STATUS_CODE = {status: code for code, status in enumerate(TaskStatus)}
+
+
 class AgentStatus(Enum):
     AVAILABLE = "available"
     BUSY = "busy"
     OFFLINE = "offline"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a work unit that needs to be completed"""
 
@@ -46,20 +81,19 @@ class Task:
     status: TaskStatus = TaskStatus.PENDING
     priority: int = 1
     dependencies: List[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
+    # Stamped by TeamCoordinator.add_task when left unset
+    created_at: Optional[datetime] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     estimated_duration: int = 3600
     actual_duration: Optional[int] = None
+    # time.monotonic() at assignment, for measuring actual_duration
+    started_monotonic: Optional[float] = None
     outputs: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
-
 
-@dataclass
+@dataclass(slots=True)
 class AgentInfo:
     """Represents an agent in the team"""
 
@@ -71,13 +105,10 @@ class AgentInfo:
     status: AgentStatus = AgentStatus.AVAILABLE
     performance_score: float = 1.0
     current_task: Optional[str] = None
-    last_active: Optional[datetime] = field(default_factory=datetime.now)
+    # Stamped by TeamCoordinator.add_agent when left unset
+    last_active: Optional[datetime] = None
     specializations: List[str] = field(default_factory=list)
 
-    def __post_init__(self):
-        if self.last_active is None:
-            self.last_active = datetime.now()
-
 
 class TeamCoordinator:
     """Main coordinator class for managing multi-agent teams"""
@@ -85,22 +116,121 @@ class TeamCoordinator:
     def __init__(self):
         self.tasks: Dict[str, Task] = {}
         self.agents: Dict[str, AgentInfo] = {}
-        self.task_queue: List[str] = []
         self.completed_tasks: List[str] = []
         self.failed_tasks: List[str] = []
         self.execution_history: List[Dict] = []
         self.shared_context: Dict[str, Any] = {}
 
+        # Dependency bookkeeping: unfinished prerequisites per task and the
+        # tasks waiting on each task
+        self._pending_deps: Dict[str, int] = {}
+        self._dependents: Dict[str, List[str]] = defaultdict(list)
+        # Prerequisites each task was entered under in _dependents, so
+        # re-adding the task can take those entries back out
+        self._waits_on: Dict[str, List[str]] = {}
+
+        # Tasks whose prerequisites are all done, as a min-heap on
+        # (-priority, -estimated_duration, seq, task_id): highest priority
+        # first, longest job first among equals. Assigned tasks are not
+        # removed eagerly; they are skipped once they reach the top.
+        self._ready_heap: List[Tuple[int, int, int, str]] = []
+        self._seq = count()
+
+        # Task status as one int8 code per task (in add order), plus running
+        # totals per code kept in step with it, so status counts cost nothing
+        self._task_index: Dict[str, int] = {}
+        self._status_codes = array("b")
+        self._status_totals = [0] * len(_STATUS_CODE)
+
+        # Rendered per-agent stats, rebuilt only after an agent changes
+        self._agent_version = 0
+        self._agent_stats: Optional[Dict[str, Dict[str, Any]]] = None
+        self._agent_stats_version = -1
+
     def add_agent(self, agent: AgentInfo) -> None:
         """Add an agent to the team"""
+        if agent.last_active is None:
+            agent.last_active = datetime.now()
         self.agents[agent.id] = agent
-        logger.info(f"Added agent: {agent.name} ({agent.id})")
+        self._agent_version += 1
+        logger.info("Added agent: %s (%s)", agent.name, agent.id)
+
+    def add_agents(self, agents: Iterable[AgentInfo]) -> None:
+        """Add several agents to the team with a single update"""
+        now = datetime.now()
+        added = {}
+        for agent in agents:
+            if agent.last_active is None:
+                agent.last_active = now
+            added[agent.id] = agent
+        self.agents.update(added)
+        self._agent_version += 1
+        logger.info("Added %d agents", len(added))
 
     def add_task(self, task: Task) -> None:
         """Add a task to the coordination system"""
+        self._register_task(task, datetime.now())
+        logger.info("Added task: %s (%s)", task.title, task.id)
+
+    def add_tasks(self, tasks: Iterable[Task]) -> None:
+        """Add several tasks to the coordination system"""
+        now = datetime.now()
+        added = 0
+        for task in tasks:
+            self._register_task(task, now)
+            added += 1
+        logger.info("Added %d tasks", added)
+
+    def _register_task(self, task: Task, now: datetime) -> None:
+        """Store a task and wire up its status and dependency bookkeeping"""
+        if task.created_at is None:
+            task.created_at = now
         self.tasks[task.id] = task
-        self.task_queue.append(task.id)
-        logger.info(f"Added task: {task.title} ({task.id})")
+
+        code = _STATUS_CODE[task.status]
+        index = self._task_index.get(task.id)
+        if index is None:
+            self._task_index[task.id] = len(self._status_codes)
+            self._status_codes.append(code)
+        else:
+            self._status_totals[self._status_codes[index]] -= 1
+            self._status_codes[index] = code
+            self._forget_dependencies(task.id)
+        self._status_totals[code] += 1
+
+        waits_on = []
+        for dep_id in task.dependencies:
+            dep = self.tasks.get(dep_id)
+            if dep is None or dep.status != TaskStatus.COMPLETED:
+                self._dependents[dep_id].append(task.id)
+                waits_on.append(dep_id)
+        self._waits_on[task.id] = waits_on
+        self._pending_deps[task.id] = len(waits_on)
+        if not waits_on:
+            self._push_ready(task.id)
+
+        # Added already done: release whatever was registered waiting on it
+        if task.status == TaskStatus.COMPLETED:
+            self._release_dependents(task.id)
+
+    def _forget_dependencies(self, task_id: str) -> None:
+        """Drop the waiting and ready entries of a task that is being replaced"""
+        for dep_id in self._waits_on.pop(task_id, ()):
+            waiters = self._dependents.get(dep_id)
+            if waiters and task_id in waiters:
+                waiters.remove(task_id)
+
+        heap = self._ready_heap
+        if any(entry[3] == task_id for entry in heap):
+            self._ready_heap = [entry for entry in heap if entry[3] != task_id]
+            heapq.heapify(self._ready_heap)
+
+    def _release_dependents(self, task_id: str) -> None:
+        """Count a completed task off the tasks waiting on it"""
+        for child_id in self._dependents.pop(task_id, ()):
+            self._pending_deps[child_id] -= 1
+            if self._pending_deps[child_id] == 0:
+                self._push_ready(child_id)
 
     def assign_task(self, task_id: str, agent_id: str) -> bool:
         """Assign a task to an available agent"""
@@ -111,28 +241,31 @@ class TeamCoordinator:
         agent = self.agents[agent_id]
 
         if agent.status != AgentStatus.AVAILABLE:
-            logger.warning(f"Agent {agent_id} is not available")
+            logger.warning("Agent %s is not available", agent_id)
             return False
 
         # Check dependencies
-        for dep_id in task.dependencies:
-            if self.tasks[dep_id].status != TaskStatus.COMPLETED:
-                logger.warning(f"Task {task_id} has incomplete dependency {dep_id}")
-                return False
+        if self._pending_deps[task_id] > 0:
+            logger.warning(
+                "Task %s has %d incomplete dependencies",
+                task_id,
+                self._pending_deps[task_id],
+            )
+            return False
 
+        now = datetime.now()
         task.assigned_agent = agent_id
-        task.status = TaskStatus.IN_PROGRESS
-        task.started_at = datetime.now()
+        self._set_status(task, TaskStatus.IN_PROGRESS)
+        task.started_at = now
+        task.started_monotonic = time.monotonic()
 
         agent.status = AgentStatus.BUSY
         agent.current_workload += task.priority * 10
         agent.current_task = task_id
-        agent.last_active = datetime.now()
-
-        if task_id in self.task_queue:
-            self.task_queue.remove(task_id)
+        agent.last_active = now
+        self._agent_version += 1
 
-        logger.info(f"Assigned task {task_id} to agent {agent_id}")
+        logger.info("Assigned task %s to agent %s", task_id, agent_id)
         return True
 
     def complete_task(
@@ -146,46 +279,124 @@ class TeamCoordinator:
         if task.status != TaskStatus.IN_PROGRESS:
             return False
 
-        task.status = TaskStatus.COMPLETED
+        self._set_status(task, TaskStatus.COMPLETED)
         task.completed_at = datetime.now()
 
         if outputs:
             task.outputs.update(outputs)
 
-        # Calculate actual duration
-        if task.started_at:
-            duration = (task.completed_at - task.started_at).total_seconds()
-            task.actual_duration = int(duration)
-
-        # Update agent status
-        if task.assigned_agent:
-            agent = self.agents[task.assigned_agent]
-            agent.status = AgentStatus.AVAILABLE
-            agent.current_workload = max(0, agent.current_workload - task.priority * 10)
-            agent.current_task = None
-            agent.last_active = datetime.now()
+        # Calculate actual duration on the monotonic clock, so wall-clock
+        # adjustments can't make it negative
+        if task.started_monotonic is not None:
+            task.actual_duration = int(time.monotonic() - task.started_monotonic)
+
+        self._release_agent(task)
+
+        # Release tasks that were only waiting on this one
+        self._release_dependents(task_id)
 
         self.completed_tasks.append(task_id)
-        logger.info(f"Completed task: {task_id}")
+        logger.info("Completed task: %s", task_id)
         return True
 
-    def get_team_status(self) -> Dict[str, Any]:
-        """Get current status of the entire team"""
-        total_tasks = len(self.tasks)
-        completed = len(self.completed_tasks)
-        failed = len(self.failed_tasks)
-        in_progress = len(
-            [t for t in self.tasks.values() if t.status == TaskStatus.IN_PROGRESS]
+    def fail_task(self, task_id: str, error: str = "") -> bool:
+        """Mark an in-progress task as failed; its dependents stay blocked"""
+        if task_id not in self.tasks:
+            return False
+
+        task = self.tasks[task_id]
+        if task.status != TaskStatus.IN_PROGRESS:
+            return False
+
+        self._set_status(task, TaskStatus.FAILED)
+        task.completed_at = datetime.now()
+        if error:
+            task.outputs["error"] = error
+
+        self._release_agent(task)
+
+        self.failed_tasks.append(task_id)
+        logger.warning("Failed task: %s", task_id)
+        return True
+
+    def _release_agent(self, task: Task) -> None:
+        """Return the task's agent to the pool once the task has finished"""
+        if not task.assigned_agent:
+            return
+
+        agent = self.agents[task.assigned_agent]
+        agent.status = AgentStatus.AVAILABLE
+        agent.current_workload = max(0, agent.current_workload - task.priority * 10)
+        agent.current_task = None
+        agent.last_active = task.completed_at
+        self._agent_version += 1
+
+    def _set_status(self, task: Task, status: TaskStatus) -> None:
+        task.status = status
+        index = self._task_index[task.id]
+        code = _STATUS_CODE[status]
+        self._status_totals[self._status_codes[index]] -= 1
+        self._status_totals[code] += 1
+        self._status_codes[index] = code
+
+    def status_counts(self) -> Dict[TaskStatus, int]:
+        """Number of tasks in each status"""
+        totals = self._status_totals
+        return {status: totals[code] for status, code in _STATUS_CODE.items()}
+
+    def _push_ready(self, task_id: str) -> None:
+        task = self.tasks[task_id]
+        heapq.heappush(
+            self._ready_heap,
+            (-task.priority, -task.estimated_duration, next(self._seq), task_id),
         )
 
-        agent_stats = {}
-        for agent in self.agents.values():
-            agent_stats[agent.id] = {
-                "name": agent.name,
-                "status": agent.status.value,
-                "current_workload": agent.current_workload,
-                "performance_score": agent.performance_score,
+    def next_ready_task(self) -> Optional[str]:
+        """Highest-priority pending task whose dependencies have completed"""
+        heap = self._ready_heap
+        while heap:
+            task_id = heap[0][3]
+            if self.tasks[task_id].status == TaskStatus.PENDING:
+                return task_id
+            heapq.heappop(heap)
+        return None
+
+    def get_ready_tasks(self) -> List[str]:
+        """Pending tasks whose dependencies have all completed, by priority"""
+        return [
+            entry[3]
+            for entry in sorted(self._ready_heap)
+            if self.tasks[entry[3]].status == TaskStatus.PENDING
+        ]
+
+    def _get_agent_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-agent summary, cached until an agent is added or changes state
+
+        Agent fields changed directly (outside the coordinator's methods) are
+        not picked up until the next coordinator-driven change. Callers get
+        copies, so editing a returned summary leaves the cache intact.
+        """
+        if self._agent_stats_version != self._agent_version:
+            self._agent_stats = {
+                agent.id: {
+                    "name": agent.name,
+                    "status": agent.status.value,
+                    "current_workload": agent.current_workload,
+                    "performance_score": agent.performance_score,
+                }
+                for agent in self.agents.values()
             }
+            self._agent_stats_version = self._agent_version
+        return {agent_id: dict(stats) for agent_id, stats in self._agent_stats.items()}
+
+    def get_team_status(self) -> Dict[str, Any]:
+        """Get current status of the entire team"""
+        total_tasks = len(self.tasks)
+        totals = self._status_totals
+        completed = totals[_STATUS_CODE[TaskStatus.COMPLETED]]
+        failed = totals[_STATUS_CODE[TaskStatus.FAILED]]
+        in_progress = totals[_STATUS_CODE[TaskStatus.IN_PROGRESS]]
 
         return {
             "timestamp": datetime.now().isoformat(),
@@ -196,13 +407,17 @@ class TeamCoordinator:
                 "in_progress": in_progress,
                 "completion_rate": completed / max(1, total_tasks),
             },
-            "agents": agent_stats,
+            "agents": self._get_agent_stats(),
             "shared_context_size": len(self.shared_context),
         }
 
 
 def main():
     """Example usage of the Team Coordinator"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
 
     # Initialize coordinator
     coordinator = TeamCoordinator()
@@ -250,7 +465,7 @@ def main():
 
     # Get team status
     status = coordinator.get_team_status()
-    print(json.dumps(status, indent=2))
+    print(to_json(status))
 
     return coordinator
 
@@ -6,8 +6,13 @@ Run with: python test_orchestrator.py
 """
 
 import sys
+import io
 import json
 import tempfile
+import time
+from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -22,9 +27,11 @@ from scripts.team_coordinator import (
     TaskStatus,
     AgentStatus,
 )
+from scripts import memory_manager
 from scripts.memory_manager import MemoryManager, SharedContext, MemoryType
 from scripts.workflow_engine import WorkflowEngine, TaskNode, ExecutionStrategy
 from scripts.orchestrator import AgentTeamOrchestrator, OrchestrationStrategy
+from scripts.cli import cmd_status
 
 
 def test_team_coordinator():
@@ -59,6 +66,10 @@ def test_team_coordinator():
     coordinator.add_task(task2)
     assert len(coordinator.tasks) == 2, "Should have 2 tasks"
 
+    # Dependent task waits on its prerequisite
+    assert coordinator.get_ready_tasks() == ["task-1"]
+    assert coordinator.assign_task("task-2", "agent-2") is False
+
     # Assign and complete task
     result = coordinator.assign_task("task-1", "agent-1")
     assert result is True, "Should assign task successfully"
@@ -67,12 +78,51 @@ def test_team_coordinator():
     result = coordinator.complete_task("task-1", {"output": "completed"})
     assert result is True, "Should complete task successfully"
     assert coordinator.tasks["task-1"].status == TaskStatus.COMPLETED
+    assert coordinator.get_ready_tasks() == ["task-2"]
+    assert coordinator.next_ready_task() == "task-2"
 
     # Get status
     status = coordinator.get_team_status()
     assert status["tasks"]["completed"] == 1
     assert status["tasks"]["total"] == 2
 
+    # Failing a task frees its agent and shows up in the counts
+    assert coordinator.assign_task("task-2", "agent-2") is True
+    assert coordinator.fail_task("task-2", "boom") is True
+    status = coordinator.get_team_status()
+    assert status["tasks"]["failed"] == 1
+    assert status["tasks"]["in_progress"] == 0
+    assert status["agents"]["agent-2"]["status"] == "available"
+
+    # The agent summaries are copies of the cached ones
+    status["agents"]["agent-2"]["status"] = "edited"
+    status["agents"].pop("agent-1")
+    status = coordinator.get_team_status()
+    assert status["agents"]["agent-2"]["status"] == "available"
+    assert "agent-1" in status["agents"]
+
+    # Re-adding a task replaces its dependency edges instead of doubling them
+    coordinator.add_task(Task(id="task-4", title="T4", description="", priority=1))
+    waiter = Task(
+        id="task-5", title="T5", description="", dependencies=["task-4", "task-6"]
+    )
+    coordinator.add_task(waiter)
+    coordinator.add_task(waiter)
+    assert coordinator.assign_task("task-4", "agent-1") is True
+    assert coordinator.complete_task("task-4") is True
+    assert "task-5" not in coordinator.get_ready_tasks()
+
+    # A prerequisite added already completed releases its waiters
+    coordinator.add_task(
+        Task(
+            id="task-6",
+            title="T6",
+            description="",
+            status=TaskStatus.COMPLETED,
+        )
+    )
+    assert "task-5" in coordinator.get_ready_tasks()
+
     print("  TeamCoordinator: PASSED")
     return True
 
@@ -117,6 +167,39 @@ def test_memory_manager():
         loaded = manager.load_from_disk()
         assert loaded >= 1
 
+        # A fresh manager replays the journal
+        reloaded = MemoryManager(storage_path=tmpdir)
+        assert reloaded.load_from_disk() == len(manager.memory_entries)
+        assert reloaded.get_agent_state(context_id, "test-agent") == {
+            "status": "active"
+        }
+        assert reloaded.context_memory_map[context_id] == [entry_id]
+
+        # Bulk insert lands in the same context, newest first
+        bulk_ids = manager.add_memories(
+            [
+                {
+                    "content": {"n": n},
+                    "memory_type": MemoryType.TASK_RESULTS,
+                    "context_id": context_id,
+                }
+                for n in range(2)
+            ]
+        )
+        assert len(bulk_ids) == 2
+        typed = manager.get_context_memory(context_id, MemoryType.TASK_RESULTS)
+        assert [e.id for e in typed] == bulk_ids[::-1]
+
+        # Saves journal only the new ids; in-place edits persist once marked
+        manager.save_to_disk()
+        manager.get_context(context_id).global_state["phase"] = "build"
+        manager.mark_context_dirty(context_id)
+        manager.save_to_disk()
+        reloaded = MemoryManager(storage_path=tmpdir)
+        reloaded.load_from_disk()
+        assert reloaded.context_memory_map[context_id] == [entry_id] + bulk_ids
+        assert reloaded.get_context(context_id).global_state == {"phase": "build"}
+
     print("  MemoryManager: PASSED")
     return True
 
@@ -125,7 +208,7 @@ def test_workflow_engine():
     """Test WorkflowEngine functionality"""
     print("\n--- Testing WorkflowEngine ---")
 
-    engine = WorkflowEngine(strategy=ExecutionStrategy.HYBRID)
+    engine = WorkflowEngine(strategy=ExecutionStrategy.HYBRID, simulate_work=False)
 
     # Add tasks
     task1 = TaskNode(
@@ -147,28 +230,163 @@ def test_workflow_engine():
         dependencies=["wf-task-1"],
     )
 
+    # Fans out wider than max_parallel_tasks below
+    task4 = TaskNode(
+        id="wf-task-4",
+        title="Workflow Task 4",
+        description="Fourth workflow task",
+        dependencies=["wf-task-1"],
+    )
+
     engine.add_task(task1)
     engine.add_task(task2)
     engine.add_task(task3)
-    assert len(engine.tasks) == 3
+    engine.add_task(task4)
+    assert len(engine.tasks) == 4
 
     # Build graph
     engine.build_graph()
-    assert len(engine.task_graph) == 3
+    assert len(engine.task_graph) == 4
 
     # Create execution plan
     plan = engine.create_execution_plan()
     assert len(plan) > 0
+    assert all(not task.metadata for task in engine.tasks.values())
+
+    # Only the target and its dependencies run
+    results = engine.execute_workflow(max_parallel_tasks=2, targets=["wf-task-2"])
+    assert results["total_tasks"] == 2
+    assert results["tasks_completed"] == ["wf-task-1", "wf-task-2"]
+    assert engine.tasks["wf-task-3"].status == "pending"
+
+    # Task timestamps stay wall-clock times
+    done = engine.tasks["wf-task-1"]
+    assert isinstance(done.completed_at, float)
+    assert time.time() - 60 < done.started_at <= done.completed_at
 
     # Execute workflow
     results = engine.execute_workflow(max_parallel_tasks=2)
     assert results["success"] is True
-    assert results["completed_tasks"] > 0
+    assert results["completed_tasks"] == len(engine.tasks)
 
     print("  WorkflowEngine: PASSED")
     return True
 
 
+def test_msgpack_store():
+    """Test the msgpack memory store and its refusal without msgpack"""
+    print("\n--- Testing msgpack store ---")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if memory_manager.msgpack is not None:
+            manager = MemoryManager(storage_path=tmpdir, storage_format="msgpack")
+            context_id = manager.create_context(
+                SharedContext(project_id="mp", name="MP", description="msgpack")
+            )
+            entry_id = manager.add_memory(
+                content={"bytes": "é", "n": [1, 2.5]},
+                memory_type=MemoryType.TASK_RESULTS,
+                context_id=context_id,
+            )
+            manager.save_to_disk()
+            assert manager.store_file.name == "memory_store.mp"
+
+            reloaded = MemoryManager(storage_path=tmpdir)
+            assert reloaded.storage_format == "msgpack"
+            assert reloaded.load_from_disk() == len(manager.memory_entries)
+            assert reloaded.memory_entries[entry_id].content == {
+                "bytes": "é",
+                "n": [1, 2.5],
+            }
+        else:
+            # Stands in for a store written where msgpack was installed
+            (Path(tmpdir) / "memory_store.mp").write_bytes(b"\x80")
+
+        # Without msgpack, an existing msgpack store is refused, not replaced
+        installed = memory_manager.msgpack
+        memory_manager.msgpack = None
+        try:
+            for storage_format in (None, "msgpack"):
+                try:
+                    MemoryManager(storage_path=tmpdir, storage_format=storage_format)
+                    raise AssertionError("msgpack store opened without msgpack")
+                except ImportError:
+                    pass
+        finally:
+            memory_manager.msgpack = installed
+        assert not (Path(tmpdir) / "memory_store.jsonl").exists()
+
+    print("  msgpack store: PASSED")
+    return True
+
+
+def test_caches():
+    """Test that the status and plan caches are only used while they fit"""
+    print("\n--- Testing status and plan caches ---")
+
+    def status_output(storage_path: str) -> str:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            assert cmd_status(Namespace(storage_path=storage_path)) == 0
+        return out.getvalue()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = MemoryManager(storage_path=tmpdir)
+        context_id = manager.create_context(
+            SharedContext(project_id="cache", name="Cache", description="caches")
+        )
+        manager.add_memory({"n": 1}, MemoryType.TASK_RESULTS, context_id=context_id)
+        manager.save_to_disk()
+
+        first = status_output(tmpdir)
+        assert "Memory Entries: 1" in first
+
+        # While the store is unchanged the cached rendering is printed as is
+        cache_path = Path(tmpdir) / ".status_cache.json"
+        cached = json.loads(cache_path.read_text())
+        cached["payload"] = "cached status"
+        cache_path.write_text(json.dumps(cached))
+        assert status_output(tmpdir) == "cached status\n"
+
+        # A write to the store makes the stamp stale, so status is rendered
+        manager.add_memory({"n": 2}, MemoryType.TASK_RESULTS, context_id=context_id)
+        manager.save_to_disk()
+        assert "Memory Entries: 2" in status_output(tmpdir)
+
+        def plan_engine() -> WorkflowEngine:
+            engine = WorkflowEngine(simulate_work=False, plan_cache_dir=tmpdir)
+            for n in range(4):
+                engine.add_task(
+                    TaskNode(
+                        id=f"t{n}",
+                        title=f"T{n}",
+                        description="",
+                        dependencies=[f"t{n - 1}"] if n else [],
+                        estimated_duration=n + 1,
+                    )
+                )
+            engine.build_graph()
+            return engine
+
+        plan = plan_engine().create_execution_plan()
+        (cache_file,) = Path(tmpdir).glob("plan-*.json")
+
+        # A cache file whose arrays do not fit the graph is ignored
+        for bad in (
+            {**json.loads(cache_file.read_bytes()), "indptr": [0, 1]},
+            {**json.loads(cache_file.read_bytes()), "levels": [[0], [9]]},
+            {"task_ids": ["t0", "t1", "t2", "t3"]},
+            [1, 2, 3],
+        ):
+            cache_file.write_text(json.dumps(bad))
+            engine = plan_engine()
+            assert engine.create_execution_plan() == plan
+            assert engine.execute_workflow()["completed_tasks"] == 4
+
+    print("  Status and plan caches: PASSED")
+    return True
+
+
 def test_orchestrator():
     """Test AgentTeamOrchestrator functionality"""
     print("\n--- Testing AgentTeamOrchestrator ---")
@@ -248,6 +466,14 @@ def test_integration():
     return True
 
 
+def _run_test(test_func):
+    """Run one test in a worker process; returns (success, error)"""
+    try:
+        return test_func(), None
+    except Exception as e:
+        return False, str(e)
+
+
 def run_all_tests():
     """Run all tests"""
     print("=" * 60)
@@ -258,18 +484,27 @@ def run_all_tests():
         ("TeamCoordinator", test_team_coordinator),
         ("MemoryManager", test_memory_manager),
         ("WorkflowEngine", test_workflow_engine),
+        ("msgpack store", test_msgpack_store),
+        ("Caches", test_caches),
         ("Orchestrator", test_orchestrator),
         ("Integration", test_integration),
     ]
 
-    results = []
-    for name, test_func in tests:
-        try:
-            success = test_func()
-            results.append((name, success, None))
-        except Exception as e:
-            results.append((name, False, str(e)))
-            print(f"  {name}: FAILED - {e}")
+    # Every test keeps its state in its own objects and temp directories,
+    # so they can run side by side in separate processes
+    outcomes = {}
+    with ProcessPoolExecutor() as pool:
+        futures = {
+            pool.submit(_run_test, test_func): name for name, test_func in tests
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            success, error = future.result()
+            outcomes[name] = (success, error)
+            if error is not None:
+                print(f"  {name}: FAILED - {error}")
+
+    results = [(name, *outcomes[name]) for name, _ in tests]
 
     print("\n" + "=" * 60)
     print("TEST RESULTS")
@@ -7,24 +7,49 @@ and parallelization, provides quality gates and validation, handles error recove
 and adaptive strategies for multi-agent coordination.
 """
 
+import hashlib
 import json
+import os
 import time
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import Deque, Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
-import heapq
+from pathlib import Path
+import queue
 import threading
-from collections import defaultdict
-from dataclasses import field as dataclass_field
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # Optional: faster JSON encoding of workflow results
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: native topological layering for large workflows
+    import rustworkx as rx
+except ImportError:
+    rx = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj: Any) -> bytes:
+        """Compact JSON encoding, byte-for-byte what orjson produces"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    _loads = json.loads
+
+# Bump when the layout of cached plan files changes so stale ones are ignored
+_PLAN_CACHE_FORMAT = 1
+
 
 class WorkflowStatus(Enum):
     """Status of workflow execution"""
@@ -46,7 +71,7 @@ class ExecutionStrategy(Enum):
     HYBRID = "hybrid"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskNode:
     """Represents a task in the workflow graph"""
 
@@ -64,6 +89,10 @@ class TaskNode:
     metadata: Dict[str, Any] = field(default_factory=dict)
     started_at: Optional[float] = None
     completed_at: Optional[float] = None
+    # Monotonic readings (time.monotonic_ns) of the same moments, used only
+    # to measure durations, which wall-clock steps would skew
+    _started_ns: Optional[int] = field(default=None, init=False, repr=False)
+    _completed_ns: Optional[int] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         if self.estimated_duration <= 0:
@@ -73,13 +102,29 @@ class TaskNode:
         """Mark this task as completed"""
         self.status = "completed"
         self.completed_at = time.time()
+        self._completed_ns = time.monotonic_ns()
         if outputs:
-            self.outputs.update(outputs)
+            # Take ownership of a fresh outputs dict instead of copying it
+            if self.outputs:
+                self.outputs.update(outputs)
+            else:
+                self.outputs = outputs
 
 
 class WorkflowNode:
     """Node in the workflow execution graph"""
 
+    __slots__ = (
+        "task_id",
+        "task",
+        "predecessors",
+        "successors",
+        "children",
+        "completed",
+        "started_at",
+        "completed_at",
+    )
+
     def __init__(
         self,
         task_id: str,
@@ -107,41 +152,219 @@ class WorkflowNode:
 class WorkflowEngine:
     """Main workflow engine for managing multi-agent task execution"""
 
-    def __init__(self, strategy: ExecutionStrategy = ExecutionStrategy.HYBRID):
+    # Same default as concurrent.futures.ThreadPoolExecutor
+    DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+    def __init__(
+        self,
+        strategy: ExecutionStrategy = ExecutionStrategy.HYBRID,
+        simulate_work: bool = False,
+        plan_cache_dir: Optional[str] = None,
+    ):
         """
         Initialize the workflow engine
 
         Args:
             strategy: Execution strategy to use
+            simulate_work: Make mock task execution sleep in proportion to
+                the task's estimated duration (for demos)
+            plan_cache_dir: Directory for reusing built graphs and plans of
+                identical task sets across runs (optional)
         """
         self.strategy = strategy
+        self.simulate_work = simulate_work
+        self.plan_cache_dir: Optional[Path] = (
+            Path(plan_cache_dir) if plan_cache_dir else None
+        )
         self.tasks: Dict[str, TaskNode] = {}
         self.task_graph: Dict[str, WorkflowNode] = {}
         self.execution_log: List[Dict] = []
         self.results: Dict[str, Dict[str, Any]] = {}
-        self.lock = threading.RLock()
-        self.progress_monitoring: Dict[str, float] = {}
+        # Structural state (tasks, graph, plan, results) has its own lock;
+        # progress reports live in independently locked shards so progress
+        # ticks neither wait on scheduling nor on each other
+        self._graph_lock = threading.RLock()
+        shard_count = 1 << (max(8, 4 * (os.cpu_count() or 1)) - 1).bit_length()
+        self._progress_mask = shard_count - 1
+        self._progress_shards: List[Tuple[threading.Lock, Dict[str, float]]] = [
+            (threading.Lock(), {}) for _ in range(shard_count)
+        ]
+
+        # Bumped on every structural change; the execution plan is reused
+        # while it stays the same
+        self._graph_version = 0
+        self._graph_built = False
+        self._cached_plan: Optional[Tuple[int, List[Tuple[int, List[str]]]]] = None
+
+        # Scheduling view of the graph, prebuilt by build_graph: task ids by
+        # index, successors in CSR form (the children of task i are
+        # _indices[_indptr[i]:_indptr[i + 1]]) and each task's in-degree
+        self._task_ids: List[str] = []
+        self._indptr = array("i", [0])
+        self._indices = array("i")
+        self._in_degree_init = array("i")
+        self._rx_graph = None
+        self._csr_version = -1
+        # Plan levels read from plan_cache_dir, as (graph version, levels)
+        self._cached_levels: Optional[Tuple[int, List[List[int]]]] = None
+
+        # Once the graph is built, add_task links new nodes in place;
+        # dependencies not added yet wait here keyed by the missing task id
+        self._missing_deps: Dict[str, List[str]] = {}
 
     def add_task(self, task: TaskNode) -> None:
         """Add a task to the workflow"""
-        with self.lock:
+        with self._graph_lock:
+            replaced = task.id in self.tasks
             self.tasks[task.id] = task
+            self._graph_version += 1
+            if self._graph_built:
+                if replaced:
+                    # Edges of the old task are unknown here; rebuild later
+                    self._graph_built = False
+                else:
+                    self._link_node(task)
             logger.info(f"Added task: {task.title} ({task.id})")
 
+    def _link_node(self, task: TaskNode) -> None:
+        """Add a task's node and its edges to the dependency graph"""
+        node = WorkflowNode(task.id, task)
+        self.task_graph[task.id] = node
+
+        # Dependencies outside the graph are ignored until they are added
+        for dep_id in task.dependencies:
+            if dep_id in self.task_graph:
+                self.task_graph[dep_id].children.append(task.id)
+            else:
+                self._missing_deps.setdefault(dep_id, []).append(task.id)
+        node.children.extend(self._missing_deps.pop(task.id, ()))
+
     def build_graph(self) -> None:
         """Build the workflow dependency graph"""
-        with self.lock:
-            # Initialize workflow nodes
-            for task_id, task in self.tasks.items():
-                self.task_graph[task_id] = WorkflowNode(task_id, task)
+        with self._graph_lock:
+            if not self._graph_built:
+                self.task_graph = {}
+                self._missing_deps = {}
+                for task in self.tasks.values():
+                    self._link_node(task)
+                self._graph_built = True
+
+            if self._csr_version != self._graph_version:
+                if not self._load_plan_cache():
+                    self._flatten_graph()
+                logger.info("Built workflow dependency graph")
+
+    def _plan_cache_file(self) -> Path:
+        """Cache file for the current tasks and their dependencies"""
+        shape = [
+            [task_id, node.task.dependencies]
+            for task_id, node in self.task_graph.items()
+        ]
+        key = hashlib.blake2b(
+            b"%d:%s" % (_PLAN_CACHE_FORMAT, _dumps(shape)), digest_size=16
+        ).hexdigest()
+        return self.plan_cache_dir / f"plan-{key}.json"
 
-            # Build adjacency list
-            for task_id, workflow_node in self.task_graph.items():
-                for dep_id in workflow_node.task.dependencies:
-                    if dep_id in self.task_graph:
-                        self.task_graph[dep_id].children.append(task_id)
+    def _load_plan_cache(self) -> bool:
+        """
+        Load the CSR arrays and plan levels from plan_cache_dir
 
-            logger.info("Built workflow dependency graph")
+        Returns:
+            True if a matching cached plan was loaded
+        """
+        if self.plan_cache_dir is None:
+            return False
+
+        cache_file = self._plan_cache_file()
+        try:
+            cached = _loads(cache_file.read_bytes())
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable plan cache {cache_file.name}: {e}")
+            return False
+        try:
+            task_ids = cached["task_ids"]
+            indptr = array("i", cached["indptr"])
+            indices = array("i", cached["indices"])
+            in_degree = array("i", cached["in_degree"])
+            levels = [[int(i) for i in level] for level in cached["levels"]]
+        except (KeyError, TypeError, ValueError, OverflowError) as e:
+            logger.warning(f"Ignoring malformed plan cache {cache_file.name}: {e}")
+            return False
+
+        # A cache written by other code, or edited, must still fit the graph
+        n = len(self.task_graph)
+        if (
+            task_ids != list(self.task_graph)
+            or len(indptr) != n + 1
+            or len(in_degree) != n
+            or indptr[-1] != len(indices)
+            or not all(0 <= i < n for i in indices)
+            or not all(0 <= i < n for level in levels for i in level)
+        ):
+            return False
+
+        self._task_ids = task_ids
+        self._indptr = indptr
+        self._indices = indices
+        self._in_degree_init = in_degree
+        self._rx_graph = None
+        self._csr_version = self._graph_version
+        self._cached_levels = (self._graph_version, levels)
+        logger.info(f"Using cached plan: {cache_file.name}")
+        return True
+
+    def _store_plan_cache(self, levels: List[List[int]]) -> None:
+        """Write the CSR arrays and plan levels to plan_cache_dir"""
+        if self.plan_cache_dir is None:
+            return
+
+        cached = {
+            "task_ids": self._task_ids,
+            "indptr": self._indptr.tolist(),
+            "indices": self._indices.tolist(),
+            "in_degree": self._in_degree_init.tolist(),
+            "levels": levels,
+        }
+        try:
+            self.plan_cache_dir.mkdir(parents=True, exist_ok=True)
+            self._plan_cache_file().write_bytes(_dumps(cached))
+        except OSError as e:
+            logger.warning(f"Could not cache plan: {e}")
+
+    def _flatten_graph(self) -> None:
+        """Rebuild the index-based CSR arrays the scheduler works on"""
+        task_ids = list(self.task_graph)
+        index = {task_id: i for i, task_id in enumerate(task_ids)}
+        indptr = array("i", [0])
+        indices = array("i")
+        in_degree = array("i", bytes(4 * len(task_ids)))
+        for task_id in task_ids:
+            for child_id in self.task_graph[task_id].children:
+                child = index[child_id]
+                indices.append(child)
+                in_degree[child] += 1
+            indptr.append(len(indices))
+
+        self._task_ids = task_ids
+        self._indptr = indptr
+        self._indices = indices
+        self._in_degree_init = in_degree
+        self._rx_graph = None
+        if rx is not None:
+            # Node indices of a fresh graph match positions in task_ids
+            graph = rx.PyDiGraph()
+            graph.add_nodes_from(task_ids)
+            graph.add_edges_from_no_data(
+                [
+                    (i, child)
+                    for i in range(len(task_ids))
+                    for child in indices[indptr[i] : indptr[i + 1]]
+                ]
+            )
+            self._rx_graph = graph
+        self._csr_version = self._graph_version
 
     def create_execution_plan(self) -> List[Tuple[int, List[str]]]:
         """
@@ -152,42 +375,67 @@ class WorkflowEngine:
         """
         plan: List[Tuple[int, List[str]]] = []
 
-        with self.lock:
+        with self._graph_lock:
             if not self.task_graph:
                 return plan
 
-            # Calculate in-degree for each task
-            in_degree = {
-                task_id: len(workflow_node.task.dependencies)
-                for task_id, workflow_node in self.task_graph.items()
-            }
+            cached = self._cached_plan
+            if cached is not None and cached[0] == self._graph_version:
+                return cached[1]
 
-            # Start with tasks that have no dependencies
-            current_level = [
-                task_id for task_id, degree in in_degree.items() if degree == 0
-            ]
+            # Pick up tasks added since the graph was last built
+            self.build_graph()
 
-            parallel_groups: Dict[int, List[str]] = {}
-            counter = 0
-
-            while current_level:
-                # Add current level as a parallel group
-                parallel_groups[counter] = list(current_level)
-
-                # Find next level of tasks
-                next_level = []
-                for task_id in current_level:
-                    # Decrease in-degree for all children
-                    for child_id in self.task_graph[task_id].children:
-                        in_degree[child_id] -= 1
-                        if in_degree[child_id] == 0:
-                            next_level.append(child_id)
-
-                current_level = next_level
-                counter += 1
-
-            # Convert to plan format
-            plan = list(parallel_groups.items())
+            task_ids = self._task_ids
+            levels = None
+            cached_levels = self._cached_levels
+            from_cache = (
+                cached_levels is not None and cached_levels[0] == self._graph_version
+            )
+            if from_cache:
+                levels = cached_levels[1]
+            elif max(self._in_degree_init, default=0) <= 1:
+                # Chains and fan-out trees need no in-degree bookkeeping
+                levels = self._forest_levels()
+            elif self._rx_graph is not None:
+                try:
+                    levels = [
+                        sorted(generation)
+                        for generation in rx.topological_generations(self._rx_graph)
+                    ]
+                except rx.DAGHasCycle:
+                    # Fall back so acyclic parts of the graph still run
+                    pass
+            if levels is None:
+                levels = self._kahn_levels()
+            if not from_cache:
+                self._store_plan_cache(levels)
+
+            # Critical path (own cost plus the costliest chain of descendants,
+            # a task's cost being its duration weighted by priority) in one
+            # reverse-topological pass; each level then runs its most
+            # critical tasks first
+            indptr = self._indptr
+            indices = self._indices
+            critical_path = [0] * len(task_ids)
+            for level in reversed(levels):
+                for i in level:
+                    task = self.tasks[task_ids[i]]
+                    children = indices[indptr[i] : indptr[i + 1]]
+                    critical_path[i] = task.estimated_duration * task.priority + max(
+                        (critical_path[c] for c in children), default=0
+                    )
+
+            plan = [
+                (
+                    group_id,
+                    [
+                        task_ids[i]
+                        for i in sorted(level, key=lambda i: -critical_path[i])
+                    ],
+                )
+                for group_id, level in enumerate(levels)
+            ]
 
             # Update task nodes with execution info
             for group_id, task_ids in plan:
@@ -197,21 +445,121 @@ class WorkflowEngine:
 
             logger.info(f"Created execution plan with {len(plan)} parallel groups")
 
+            self._cached_plan = (self._graph_version, plan)
             return plan
 
+    def _forest_levels(self) -> List[List[int]]:
+        """
+        Layer a graph in which no task has more than one dependency
+
+        Each level is simply the children of the previous one; tasks on a
+        cycle have no root above them and are left out, as with Kahn.
+
+        Returns:
+            Lists of task indices, one per parallel group
+        """
+        indptr = self._indptr
+        indices = self._indices
+        current_level = [
+            i for i, degree in enumerate(self._in_degree_init) if degree == 0
+        ]
+        levels = []
+
+        while current_level:
+            levels.append(current_level)
+            current_level = [
+                child
+                for i in current_level
+                for child in indices[indptr[i] : indptr[i + 1]]
+            ]
+
+        return levels
+
+    def _kahn_levels(self) -> List[List[int]]:
+        """
+        Layer the CSR graph with Kahn's algorithm
+
+        Tasks caught in a dependency cycle never reach in-degree zero and
+        are left out of the layers.
+
+        Returns:
+            Lists of task indices, one per parallel group
+        """
+        indptr = self._indptr
+        indices = self._indices
+        in_degree = array("i", self._in_degree_init)
+
+        # Start with tasks that have no dependencies
+        current_level = [i for i, degree in enumerate(in_degree) if degree == 0]
+        levels = []
+
+        while current_level:
+            levels.append(current_level)
+
+            # Find next level of tasks
+            next_level = []
+            for i in current_level:
+                # Decrease in-degree for all children
+                for child in indices[indptr[i] : indptr[i + 1]]:
+                    in_degree[child] -= 1
+                    if in_degree[child] == 0:
+                        next_level.append(child)
+
+            current_level = next_level
+
+        return levels
+
+    def _ancestors(self, targets: List[str]) -> Set[str]:
+        """
+        Collect the targets and everything they transitively depend on
+
+        Args:
+            targets: Task IDs whose outputs are wanted
+
+        Returns:
+            Set of task IDs that have to run
+        """
+        needed: Set[str] = set()
+        stack = [task_id for task_id in targets if task_id in self.tasks]
+        for task_id in set(targets) - self.tasks.keys():
+            logger.warning(f"Ignoring unknown target task {task_id}")
+
+        while stack:
+            task_id = stack.pop()
+            if task_id in needed:
+                continue
+            needed.add(task_id)
+            stack.extend(
+                dep_id
+                for dep_id in self.tasks[task_id].dependencies
+                if dep_id in self.tasks and dep_id not in needed
+            )
+
+        return needed
+
     def execute_workflow(
         self,
-        max_parallel_tasks: int = 3,
+        max_parallel_tasks: Optional[int] = None,
         timeout: Optional[int] = None,
         quality_gates: Optional[List[str]] = None,
+        max_in_flight: Optional[int] = None,
+        targets: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Execute the workflow
 
+        Each parallel group runs on a shared thread pool; the next group
+        starts once every task of the current one has finished.
+
         Args:
-            max_parallel_tasks: Maximum number of parallel tasks
+            max_parallel_tasks: Maximum number of parallel tasks; defaults
+                to DEFAULT_MAX_WORKERS
             timeout: Workflow timeout in seconds (optional)
             quality_gates: List of quality gate task IDs to validate
+            max_in_flight: Cap on tasks submitted but not yet finished
+                (queued plus running); defaults to twice max_parallel_tasks
+            targets: Only run these tasks and their transitive dependencies
+                (optional; all tasks by default)
 
         Returns:
             Execution results
@@ -233,68 +581,117 @@ class WorkflowEngine:
         try:
             # Create execution plan
             plan = self.create_execution_plan()
-
-            start_time = time.time()
+            if targets is not None:
+                needed = self._ancestors(targets)
+                plan = [
+                    (group_id, [t for t in task_ids if t in needed])
+                    for group_id, task_ids in plan
+                ]
+                plan = [(group_id, ids) for group_id, ids in plan if ids]
+                results["total_tasks"] = len(needed)
+
+            start_ns = time.monotonic_ns()
             completed = 0
             failed_count = 0
 
-            # Execute each parallel group
-            for group_id, task_ids in plan:
-                logger.info(
-                    f"\n=== Executing Group {group_id} - Tasks: {len(task_ids)} ==="
-                )
+            workers = max(1, max_parallel_tasks or self.DEFAULT_MAX_WORKERS)
+            in_flight = threading.BoundedSemaphore(max_in_flight or 2 * workers)
+            # Workers post (task_id, outputs) here instead of taking a lock;
+            # this thread drains it and does all the bookkeeping. One queue
+            # per run, so outcomes of an aborted run never reach the next one
+            completions: "queue.SimpleQueue[Tuple[str, Dict[str, Any]]]" = (
+                queue.SimpleQueue()
+            )
 
-                if timeout and (time.time() - start_time) > timeout:
-                    raise TimeoutError(f"Workflow timeout after {timeout} seconds")
-
-                # Determine group size
-                group_size = min(len(task_ids), max_parallel_tasks)
-
-                for i in range(group_size):
-                    task_id = task_ids[i % len(task_ids)]
-
-                    # Check if this task has already completed
-                    if self.tasks[task_id].status == "completed":
-                        completed += 1
-                        results["tasks_completed"].append(task_id)
-                        continue
-
-                    # Execute task
-                    task = self.tasks[task_id]
-                    task.status = "running"
-
-                    # Execute logic (mock)
-                    outputs = self.execute_single_task(task)
-
-                    if outputs.get("success", False):
-                        task.status = "completed"
-                        task.mark_complete(outputs.get("outputs", {}))
-                        task_graph_node = self.task_graph[task_id]
-                        task_graph_node.mark_complete(outputs.get("outputs", {}))
-
-                        completed += 1
-                        results["tasks_completed"].append(task_id)
-
-                        # Log progress
-                        self.execution_log.append(
-                            {
-                                "timestamp": time.time() - start_time,
-                                "task_id": task_id,
-                                "status": "completed",
-                                "duration": outputs.get(
-                                    "duration", task.estimated_duration
-                                ),
-                            }
-                        )
-
-                        logger.info(f"✓ Completed task {task_id} ({task.title})")
-                    else:
-                        task.status = "failed"
-                        failed_count += 1
-                        results["tasks_failed"].append(task_id)
-                        results["errors"].append(outputs.get("error", "Unknown error"))
-
-                        logger.error(f"✗ Failed task {task_id} ({task.title})")
+            with ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="workflow",
+            ) as pool:
+                # Execute each parallel group
+                for group_id, task_ids in plan:
+                    logger.info(
+                        f"\n=== Executing Group {group_id} - Tasks: {len(task_ids)} ==="
+                    )
+
+                    elapsed = (time.monotonic_ns() - start_ns) / 1e9
+                    if timeout and elapsed > timeout:
+                        raise TimeoutError(f"Workflow timeout after {timeout} seconds")
+
+                    level_start_ns = time.monotonic_ns()
+                    submitted = 0
+                    for task_id in task_ids:
+                        task = self.tasks[task_id]
+
+                        # Check if this task has already completed
+                        if task.status == "completed":
+                            completed += 1
+                            results["tasks_completed"].append(task_id)
+                            continue
+
+                        task.status = "running"
+                        in_flight.acquire()
+                        pool.submit(self._run_task, task, completions, in_flight)
+                        submitted += 1
+
+                    # Collect the group's outcomes in batches: block for one,
+                    # then take whatever else has already been posted, so the
+                    # graph lock is taken once per batch rather than per task
+                    level_log: List[Dict[str, Any]] = []
+                    remaining = submitted
+                    while remaining:
+                        batch = [completions.get()]
+                        while len(batch) < remaining:
+                            try:
+                                batch.append(completions.get_nowait())
+                            except queue.Empty:
+                                break
+                        remaining -= len(batch)
+
+                        with self._graph_lock:
+                            for task_id, outputs in batch:
+                                task = self.tasks[task_id]
+                                if outputs.get("success", False):
+                                    task.status = "completed"
+                                    task.mark_complete(outputs.get("outputs"))
+                                    # The node wraps the same task object, so
+                                    # only its own flags need updating
+                                    node = self.task_graph[task_id]
+                                    node.completed = True
+                                    node.completed_at = task.completed_at
+                                    self.results[task_id] = task.outputs
+
+                                    completed += 1
+                                    results["tasks_completed"].append(task_id)
+                                    done_at = (task._completed_ns - start_ns) / 1e9
+                                    level_log.append(
+                                        {
+                                            "timestamp": done_at,
+                                            "task_id": task_id,
+                                            "status": "completed",
+                                            "duration": outputs.get(
+                                                "duration", task.estimated_duration
+                                            ),
+                                        }
+                                    )
+                                else:
+                                    task.status = "failed"
+                                    failed_count += 1
+                                    results["tasks_failed"].append(task_id)
+                                    results["errors"].append(
+                                        outputs.get("error", "Unknown error")
+                                    )
+
+                                    logger.error(
+                                        f"✗ Failed task {task_id} ({task.title})"
+                                    )
+
+                    # Flush the level's completion records in one go
+                    self.execution_log.extend(level_log)
+                    logger.info(
+                        f"Level {group_id}: {len(level_log)}/{len(task_ids)} "
+                        f"tasks done in "
+                        f"{(time.monotonic_ns() - level_start_ns) / 1e9:.3f}s"
+                    )
 
             # Check quality gates
             if quality_gates:
@@ -304,18 +701,18 @@ class WorkflowEngine:
                         results["quality_gate_results"][gate_id] = gate_result
 
             # Final results
-            end_time = time.time()
+            total_duration = (time.monotonic_ns() - start_ns) / 1e9
             results["success"] = failed_count == 0
             results["completed_tasks"] = completed
             results["failed_tasks"] = failed_count
-            results["total_duration"] = end_time - start_time
+            results["total_duration"] = total_duration
 
             logger.info(
                 f"\n=== Workflow Execution Complete ===\n"
                 f"Total: {len(self.tasks)} tasks, "
                 f"Completed: {completed}, "
                 f"Failed: {failed_count}, "
-                f"Duration: {end_time - start_time:.2f}s"
+                f"Duration: {total_duration:.2f}s"
             )
 
         except Exception as e:
@@ -325,19 +722,39 @@ class WorkflowEngine:
 
         return results
 
+    def _run_task(
+        self,
+        task: TaskNode,
+        completions: "queue.SimpleQueue[Tuple[str, Dict[str, Any]]]",
+        in_flight: threading.BoundedSemaphore,
+    ) -> None:
+        """Worker body: run one task and post its outcome to the scheduler"""
+        # Whatever escapes the task, the scheduler waiting on completions
+        # gets an outcome and the slot is freed
+        outputs: Dict[str, Any] = {"success": False, "error": "Task aborted"}
+        try:
+            outputs = self.execute_single_task(task)
+        except Exception as e:
+            outputs = {"success": False, "error": str(e)}
+        finally:
+            completions.put((task.id, outputs))
+            in_flight.release()
+
     def execute_single_task(self, task: TaskNode) -> Dict[str, Any]:
         """
         Execute a single task
         In a real system, this would invoke an agent
         """
         task.started_at = time.time()
+        task._started_ns = time.monotonic_ns()
 
         logger.info(f"Executing task: {task.id}")
 
         # Simulate task execution
-        time.sleep(min(task.estimated_duration / 1000, 1.0))
+        if self.simulate_work:
+            time.sleep(min(task.estimated_duration / 1000, 1.0))
 
-        duration = time.time() - task.started_at
+        duration = (time.monotonic_ns() - task._started_ns) // 1_000_000_000
 
         # Mock outputs based on task metadata
         outputs = {
@@ -347,7 +764,7 @@ class WorkflowEngine:
                 "task_title": task.title,
                 "completed": True,
             },
-            "duration": int(duration),
+            "duration": duration,
         }
 
         return outputs
@@ -384,8 +801,9 @@ class WorkflowEngine:
             task_id: Task to monitor
             progress_update: Progress value (0.0 to 1.0)
         """
-        with self.lock:
-            self.progress_monitoring[task_id] = progress_update
+        lock, shard = self._progress_shards[hash(task_id) & self._progress_mask]
+        with lock:
+            shard[task_id] = progress_update
             logger.debug(f"Progress update for {task_id}: {progress_update:.1%}")
 
     def get_progress(self, task_id: str) -> Optional[float]:
@@ -398,8 +816,18 @@ class WorkflowEngine:
         Returns:
             Progress value or None
         """
-        with self.lock:
-            return self.progress_monitoring.get(task_id)
+        lock, shard = self._progress_shards[hash(task_id) & self._progress_mask]
+        with lock:
+            return shard.get(task_id)
+
+    @property
+    def progress_monitoring(self) -> Dict[str, float]:
+        """Snapshot of the latest progress of every monitored task"""
+        progress: Dict[str, float] = {}
+        for lock, shard in self._progress_shards:
+            with lock:
+                progress.update(shard)
+        return progress
 
     def pause_workflow(self) -> None:
         """Pause workflow execution"""
@@ -417,14 +845,25 @@ class WorkflowEngine:
 class AdaptiveWorkflowEngine(WorkflowEngine):
     """Adaptive workflow engine that adjusts execution based on performance"""
 
+    # Number of most recent performance records kept for recommendations
+    HISTORY_SIZE = 4096
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.performance_history: List[Dict] = []
+        self.performance_history: Deque[Dict] = deque(maxlen=self.HISTORY_SIZE)
+        # Running totals over performance_history
+        self._duration_sum = 0.0
+        self._failure_count = 0
         self.agent_performance: Dict[str, float] = {}
         self.adaptation_threshold: float = 0.7
 
     def record_performance_metrics(
-        self, task_id: str, duration: float, quality_score: float, agent_id: str = ""
+        self,
+        task_id: str,
+        duration: float,
+        quality_score: float,
+        agent_id: str = "",
+        success: bool = True,
     ) -> None:
         """
         Record performance metrics for task execution
@@ -434,16 +873,26 @@ class AdaptiveWorkflowEngine(WorkflowEngine):
             duration: Execution duration
             quality_score: Quality assessment (0.0 to 1.0)
             agent_id: Agent that executed the task
+            success: Whether the task succeeded
         """
         metrics = {
             "task_id": task_id,
             "duration": duration,
             "quality_score": quality_score,
             "agent_id": agent_id,
+            "success": success,
             "timestamp": time.time(),
         }
 
-        self.performance_history.append(metrics)
+        history = self.performance_history
+        if len(history) == history.maxlen:
+            # The oldest record is about to drop out of the window
+            oldest = history[0]
+            self._duration_sum -= oldest["duration"]
+            self._failure_count -= not oldest["success"]
+        history.append(metrics)
+        self._duration_sum += duration
+        self._failure_count += not success
 
         if agent_id:
             self.agent_performance[agent_id] = quality_score
@@ -485,9 +934,7 @@ class AdaptiveWorkflowEngine(WorkflowEngine):
 
         # Analyze task completion times
         if self.performance_history:
-            avg_duration = sum(m["duration"] for m in self.performance_history) / len(
-                self.performance_history
-            )
+            avg_duration = self._duration_sum / len(self.performance_history)
 
             recommendations.append(
                 {
@@ -499,16 +946,12 @@ class AdaptiveWorkflowEngine(WorkflowEngine):
             )
 
         # Find patterns in failures
-        failed_tasks = [
-            m["task_id"] for m in self.performance_history if not m.get("success")
-        ]
-
-        if len(failed_tasks) > 3:
+        if self._failure_count > 3:
             recommendations.append(
                 {
                     "type": "failure_pattern",
-                    "count": len(failed_tasks),
-                    "recommendation": f"Review {len(failed_tasks)} repeated failures",
+                    "count": self._failure_count,
+                    "recommendation": f"Review {self._failure_count} repeated failures",
                 }
             )
 
@@ -531,9 +974,13 @@ class AdaptiveWorkflowEngine(WorkflowEngine):
 
 def main():
     """Example usage of the Workflow Engine"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
 
     # Initialize workflow engine
-    engine = WorkflowEngine(strategy=ExecutionStrategy.HYBRID)
+    engine = WorkflowEngine(strategy=ExecutionStrategy.HYBRID, simulate_work=True)
 
     # Add sample tasks
     engine.add_task(
@@ -589,7 +1036,10 @@ def main():
     results = engine.execute_workflow(max_parallel_tasks=2)
 
     print(f"\nWorkflow Results:")
-    print(json.dumps(results, indent=2))
+    if orjson is not None:
+        print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(results, indent=2))
 
     return engine, results
 
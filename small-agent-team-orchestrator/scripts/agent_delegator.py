@@ -5,14 +5,64 @@ Manages the workflow transitions and ensures proper context transfer between tea
 """
 
 import json
+import mmap
+import os
 import sys
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, Iterator, List, Optional, Any, Sequence
 from pathlib import Path
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 
+try:
+    # Optional: much faster JSON encoding/decoding for the storage files
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+if orjson is not None:
+
+    def _dump_json(obj: Any) -> bytes:
+        """Encode a storage file as indented JSON."""
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+
+    def _dump_line(obj: Any) -> bytes:
+        """Encode one journal record as a single JSON line."""
+        return (
+            orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        )
+
+    _load_json = orjson.loads
+
+else:
+
+    def _dump_json(obj: Any) -> bytes:
+        """Encode a storage file as indented JSON."""
+        return json.dumps(obj, indent=2, default=str, ensure_ascii=False).encode()
+
+    def _dump_line(obj: Any) -> bytes:
+        """Encode one journal record as a single JSON line."""
+        return json.dumps(obj, default=str, ensure_ascii=False).encode() + b"\n"
+
+    _load_json = json.loads
+
+
+# Drops the separators of an ISO timestamp for use in delegation ids
+_TIMESTAMP_STRIP = str.maketrans("", "", "-:.T")
+
+
+def _pretty(obj: Any) -> str:
+    """Render a value as indented JSON for a prompt."""
+    return _dump_json(obj).decode()
+
+
+@dataclass(slots=True)
 class DelegationContext:
     """Stores context information for agent handoffs."""
 
@@ -22,12 +72,40 @@ class DelegationContext:
     timestamp: str
     state: str
     requirements: Dict[str, Any] = field(default_factory=dict)
-    deliverables: List[str] = field(default_factory=list)
-    constraints: List[str] = field(default_factory=list)
-    success_criteria: List[str] = field(default_factory=list)
+    deliverables: Sequence[str] = field(default_factory=list)
+    constraints: Sequence[str] = field(default_factory=list)
+    success_criteria: Sequence[str] = field(default_factory=list)
     handoff_notes: str = ""
     context_accumulated: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a plain dict for storage (shallow copies, unlike asdict)."""
+        return {
+            "task_id": self.task_id,
+            "from_agent": self.from_agent,
+            "to_agent": self.to_agent,
+            "timestamp": self.timestamp,
+            "state": self.state,
+            "requirements": dict(self.requirements),
+            "deliverables": list(self.deliverables),
+            "constraints": list(self.constraints),
+            "success_criteria": list(self.success_criteria),
+            "handoff_notes": self.handoff_notes,
+            "context_accumulated": self.context_accumulated,
+        }
+
+
+def _format_items(items: Sequence[str]) -> str:
+    """Format a list as markdown bullet points."""
+    return "\n".join(f"- {item}" for item in items)
+
+
+def _parse_json_arg(arg: str) -> Any:
+    """Parse a CLI JSON argument; ``@path`` reads the payload from a file."""
+    if arg.startswith("@"):
+        return _load_json(Path(arg[1:]).read_bytes())
+    return _load_json(arg)
+
 
 class AgentDelegator:
     """Manages agent delegation and handoff coordination."""
@@ -45,11 +123,300 @@ class AgentDelegator:
         "complete",
     ]
 
+    # Fixed deliverables, constraints and success criteria of each handoff
+    _ARCHITECT_DELIVERABLES = (
+        "Technical specifications document",
+        "System architecture design",
+        "API design documentation",
+        "Database schema if applicable",
+        "Technology stack decisions with rationale",
+        "Security considerations",
+        "Performance requirements",
+        "Success criteria and quality gates",
+    )
+    _ARCHITECT_CONSTRAINTS = (
+        "Follow established project patterns",
+        "Consider scalability and maintainability",
+        "Document all architectural decisions (ADRs)",
+        "Define clear interfaces between components",
+    )
+    _ARCHITECT_SUCCESS_CRITERIA = (
+        "Complete technical specifications delivered",
+        "Architecture addresses all requirements",
+        "Technology choices justified and documented",
+        "Security considerations addressed",
+        "Performance requirements defined",
+    )
+    _CODER_DELIVERABLES = (
+        "Working implementation matching specifications",
+        "Unit tests (>80% coverage target)",
+        "Integration tests for key workflows",
+        "Code documentation and comments",
+        "Configuration files if needed",
+    )
+    _CODER_CONSTRAINTS = (
+        "Follow architectural specifications exactly",
+        "Write clean, modular, extensible code",
+        "Include comprehensive error handling",
+        "Follow existing codebase patterns",
+        "Apply security best practices",
+    )
+    _CODER_SUCCESS_CRITERIA = (
+        "All requirements implemented",
+        "Tests pass with >80% coverage",
+        "Code passes linting and type checking",
+        "Documentation complete",
+        "No critical security issues",
+    )
+    _REVIEWER_DELIVERABLES = (
+        "Quality assessment report",
+        "Security review findings",
+        "Performance analysis",
+        "Improvement recommendations",
+        "Approval or change requests",
+    )
+    _REVIEWER_CONSTRAINTS = (
+        "Focus on critical and high-priority issues",
+        "Provide actionable, specific feedback",
+        "Reference best practices and patterns",
+        "Verify architectural compliance",
+        "Check test coverage and quality",
+    )
+    _REVIEWER_SUCCESS_CRITERIA = (
+        "Zero critical security issues",
+        "All high-priority issues addressed",
+        "Performance benchmarks acceptable",
+        "Code quality standards satisfied",
+        "Architectural compliance verified",
+    )
+    _QA_DELIVERABLES = (
+        "Test execution results",
+        "Bug report (if any found)",
+        "Coverage analysis",
+        "Performance validation results",
+        "Sign-off recommendation",
+    )
+    _QA_CONSTRAINTS = (
+        "Validate all functional requirements",
+        "Test edge cases and error scenarios",
+        "Perform integration testing",
+        "Verify no regressions",
+        "Document all test scenarios",
+    )
+    _QA_SUCCESS_CRITERIA = (
+        "All acceptance criteria met",
+        "No critical bugs found",
+        "Test coverage requirements satisfied",
+        "Performance within acceptable range",
+        "Integration tests passing",
+    )
+
+    # The same lists as they appear in the prompts, formatted once
+    _ARCHITECT_DELIVERABLES_FMT = _format_items(_ARCHITECT_DELIVERABLES)
+    _ARCHITECT_CONSTRAINTS_FMT = _format_items(_ARCHITECT_CONSTRAINTS)
+    _ARCHITECT_SUCCESS_CRITERIA_FMT = _format_items(_ARCHITECT_SUCCESS_CRITERIA)
+    _CODER_DELIVERABLES_FMT = _format_items(_CODER_DELIVERABLES)
+    _CODER_CONSTRAINTS_FMT = _format_items(_CODER_CONSTRAINTS)
+    _CODER_SUCCESS_CRITERIA_FMT = _format_items(_CODER_SUCCESS_CRITERIA)
+    _REVIEWER_DELIVERABLES_FMT = _format_items(_REVIEWER_DELIVERABLES)
+    _REVIEWER_SUCCESS_CRITERIA_FMT = _format_items(_REVIEWER_SUCCESS_CRITERIA)
+    _QA_DELIVERABLES_FMT = _format_items(_QA_DELIVERABLES)
+    _QA_CONSTRAINTS_FMT = _format_items(_QA_CONSTRAINTS)
+    _QA_SUCCESS_CRITERIA_FMT = _format_items(_QA_SUCCESS_CRITERIA)
+
+    _ARCHITECT_HANDOFF_NOTES = (
+        "Analyze requirements and create comprehensive technical architecture. "
+        "Consider existing codebase patterns and constraints."
+    )
+    _CODER_HANDOFF_NOTES = (
+        "Implement features according to architectural specifications. "
+        "Focus on clean code, comprehensive testing, and thorough documentation."
+    )
+    _REVIEWER_HANDOFF_NOTES = (
+        "Conduct comprehensive code review focusing on quality, security, "
+        "performance, and compliance with architectural decisions."
+    )
+    _QA_HANDOFF_NOTES = (
+        "Execute comprehensive testing including functional, integration, "
+        "edge cases, and performance validation."
+    )
+
+    # Fixed parts of the prompts, assembled once; the _generate_*_prompt
+    # methods join them with the per-delegation values
+    _ARCHITECT_PROMPT_BODY = f"""
+
+## Expected Deliverables
+{_ARCHITECT_DELIVERABLES_FMT}
+
+## Constraints
+{_ARCHITECT_CONSTRAINTS_FMT}
+
+## Success Criteria
+{_ARCHITECT_SUCCESS_CRITERIA_FMT}
+
+## Handoff Notes
+{_ARCHITECT_HANDOFF_NOTES}
+
+## Previous Context
+"""
+    _ARCHITECT_PROMPT_FOOTER = """
+
+---
+
+Please analyze the requirements and create comprehensive technical specifications including:
+1. System architecture design
+2. Technology decisions with rationale
+3. API specifications
+4. Data models/schemas
+5. Security considerations
+6. Performance requirements
+7. Implementation guidelines
+
+After completion, document your architectural decisions and provide clear specifications for the Coder agent."""
+
+    _CODER_PROMPT_FOOTER = f"""
+
+## Expected Deliverables
+{_CODER_DELIVERABLES_FMT}
+
+## Implementation Constraints
+{_CODER_CONSTRAINTS_FMT}
+
+## Success Criteria
+{_CODER_SUCCESS_CRITERIA_FMT}
+
+## Handoff Notes
+{_CODER_HANDOFF_NOTES}
+
+## Quality Checklist
+- [ ] All functions have docstrings/comments
+- [ ] Error handling for all edge cases
+- [ ] No hardcoded values (use config)
+- [ ] Follows DRY and SOLID principles
+- [ ] Security best practices applied
+- [ ] Performance considerations addressed
+
+---
+
+Please implement the features according to the architectural specifications. Focus on:
+1. Clean, modular, extensible code
+2. Comprehensive testing (>80% coverage)
+3. Thorough documentation
+4. Security best practices
+
+After implementation, prepare the code for review by the PR Reviewer agent."""
+
+    _REVIEWER_PROMPT_FOOTER = f"""
+
+## Review Focus Areas
+{_REVIEWER_DELIVERABLES_FMT}
+
+## Review Checklist
+
+### Security Review
+- [ ] Input validation and sanitization
+- [ ] SQL injection prevention
+- [ ] XSS protection
+- [ ] Authentication/authorization correctness
+- [ ] Sensitive data handling
+- [ ] Dependencies security audit
+
+### Code Quality
+- [ ] Follows architectural specifications
+- [ ] Clean, readable, maintainable code
+- [ ] Proper error handling
+- [ ] No code duplication
+- [ ] Appropriate abstractions
+
+### Testing
+- [ ] Test coverage >80%
+- [ ] Edge cases covered
+- [ ] Integration tests present
+
+### Performance
+- [ ] No obvious bottlenecks
+- [ ] Efficient algorithms
+- [ ] Appropriate caching
+
+## Approval Criteria
+{_REVIEWER_SUCCESS_CRITERIA_FMT}
+
+## Output Format
+Provide structured feedback:
+- **CRITICAL**: Must fix before merge (security, bugs)
+- **HIGH**: Strongly recommended (quality, performance)
+- **MEDIUM**: Suggested improvements
+- **LOW**: Nice to have
+
+---
+
+Please conduct a thorough review. If approved, provide merge recommendation. If changes needed, list specific actionable items."""
+
+    _QA_PROMPT_FOOTER = f"""
+
+## Test Requirements
+{_QA_DELIVERABLES_FMT}
+
+## Testing Constraints
+{_QA_CONSTRAINTS_FMT}
+
+## Acceptance Criteria
+{_QA_SUCCESS_CRITERIA_FMT}
+
+## Test Scenarios to Execute
+1. Functional testing of all requirements
+2. Edge case validation
+3. Error handling scenarios
+4. Integration testing
+5. Performance validation
+6. Regression testing
+
+## Output Required
+- Test execution results (pass/fail for each scenario)
+- Bug report (severity, description, steps to reproduce)
+- Coverage analysis
+- Performance results
+- Sign-off recommendation (APPROVED / NEEDS FIXES)
+
+---
+
+Execute comprehensive testing and provide detailed results. Flag any issues that block release."""
+
+    # Delegation history entries kept; the journal is compacted back to this
+    # many lines once it grows to twice the size
+    HISTORY_LIMIT = 100
+
+    # Storage files in the order flush() writes them. current_agents.json
+    # comes after context.json, so a sidecar older than the context marks one
+    # that missed the last change and is derived again.
+    FLUSH_ORDER = ("delegations", "context", "current_agents", "history")
+
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root)
         self.delegations_file = self.project_root / ".dev_team" / "delegations.json"
         self.context_file = self.project_root / ".dev_team" / "context.json"
-        self.history_file = self.project_root / ".dev_team" / "history.json"
+        self.history_file = self.project_root / ".dev_team" / "history.jsonl"
+        # Small task_id -> current agent map, so lookups skip context.json
+        self.current_agents_file = (
+            self.project_root / ".dev_team" / "current_agents.json"
+        )
+
+        # Parsed file contents, loaded on first use; saves write through
+        self._delegations: Optional[Dict[str, Any]] = None
+        self._context: Optional[Dict[str, Dict]] = None
+        self._history: Optional[Deque[Dict]] = None
+        self._current_agents: Optional[Dict[str, str]] = None
+        # History entries not yet appended to the journal, and its line count
+        self._history_pending: List[Dict] = []
+        self._history_lines = 0
+        # Delegation ids per task, built from the delegations on first lookup
+        self._task_index: Optional[Dict[str, List[str]]] = None
+        # Retained history entries per task, built on first filtered lookup
+        self._history_by_task: Optional[Dict[str, Deque[Dict]]] = None
+
+        # Files saved inside a batch() are only written when it ends
+        self._dirty: set = set()
+        self._batch_depth = 0
         self._ensure_storage()
 
     def _ensure_storage(self):
@@ -63,49 +430,183 @@ class AgentDelegator:
             self._save_context({})
 
         if not self.history_file.exists():
-            self._save_history([])
+            legacy_file = self.history_file.with_suffix(".json")
+            if legacy_file.exists():
+                # Convert the old whole-file history to the journal format
+                history = self._read_json(legacy_file, [])[-self.HISTORY_LIMIT :]
+                self._replace_file(
+                    self.history_file, b"".join(map(_dump_line, history))
+                )
+                legacy_file.unlink()
+            else:
+                self.history_file.touch()
 
-    def _load_delegations(self) -> Dict[str, Any]:
-        """Load all delegation records."""
+    @staticmethod
+    def _read_json(path: Path, default: Any) -> Any:
+        """Parse a storage file, returning default if it is missing or corrupt."""
         try:
-            with open(self.delegations_file, "r") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                if orjson is None or os.fstat(f.fileno()).st_size == 0:
+                    return _load_json(f.read())
+                # orjson parses straight from the page cache, without first
+                # copying the file into a bytes object
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
         except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+            return default
+
+    @staticmethod
+    def _mtime(path: Path) -> Optional[int]:
+        """A file's modification time in nanoseconds, or None if it is missing."""
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write_json(path: Path, data: Any):
+        """Write a storage file."""
+        AgentDelegator._replace_file(path, _dump_json(data))
+
+    @staticmethod
+    def _replace_file(path: Path, content: bytes):
+        """Replace a file atomically, so a crash never leaves it half written."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def _load_delegations(self) -> Dict[str, Any]:
+        """Load all delegation records."""
+        if self._delegations is None:
+            self._delegations = self._read_json(self.delegations_file, {})
+        return self._delegations
 
     def _save_delegations(self, delegations: Dict[str, Any]):
         """Save all delegations."""
-        with open(self.delegations_file, "w") as f:
-            json.dump(delegations, f, indent=2, default=str)
+        self._delegations = delegations
+        self._mark_dirty("delegations")
 
     def _load_context(self) -> Dict[str, Dict]:
         """Load task context."""
-        try:
-            with open(self.context_file, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+        if self._context is None:
+            self._context = self._read_json(self.context_file, {})
+        return self._context
 
     def _save_context(self, context: Dict[str, Dict]):
         """Save task context."""
-        with open(self.context_file, "w") as f:
-            json.dump(context, f, indent=2, default=str)
-
-    def _load_history(self) -> List[Dict]:
-        """Load delegation history."""
+        self._context = context
+        self._mark_dirty("context")
+
+    def _load_current_agents(self) -> Dict[str, str]:
+        """Load the current agent of each task."""
+        if self._current_agents is None:
+            context_mtime = self._mtime(self.context_file) or 0
+            sidecar_mtime = self._mtime(self.current_agents_file)
+            if sidecar_mtime is None or sidecar_mtime < context_mtime:
+                # Missing, or context.json was written after it by a run that
+                # stopped before the sidecar, or edited by hand: derive it anew
+                self._save_current_agents(
+                    {
+                        task_id: task_context["current_agent"]
+                        for task_id, task_context in self._load_context().items()
+                        if task_context.get("current_agent")
+                    }
+                )
+            else:
+                self._current_agents = self._read_json(self.current_agents_file, {})
+        return self._current_agents
+
+    def _save_current_agents(self, current_agents: Dict[str, str]):
+        """Save the current agent of each task."""
+        self._current_agents = current_agents
+        self._mark_dirty("current_agents")
+
+    def _load_history(self) -> Deque[Dict]:
+        """Load the most recent delegation history from the journal."""
+        if self._history is None:
+            history: Deque[Dict] = deque(maxlen=self.HISTORY_LIMIT)
+            lines = 0
+            torn = False
+            try:
+                with open(self.history_file, "rb") as f:
+                    for line in f:
+                        lines += 1
+                        if not line.endswith(b"\n"):
+                            torn = True
+                        try:
+                            history.append(_load_json(line))
+                        except ValueError:
+                            # Blank or torn line from an interrupted write; one
+                            # cut inside a character fails to decode as UTF-8
+                            torn = True
+            except FileNotFoundError:
+                pass
+            if torn:
+                # Rewrite the journal now, so the next append does not land
+                # on the end of the torn line
+                self._replace_file(
+                    self.history_file, b"".join(map(_dump_line, history))
+                )
+                lines = len(history)
+            self._history = history
+            self._history_lines = lines
+        return self._history
+
+    def _flush_history(self):
+        """Append pending history entries to the journal, compacting it."""
+        pending = self._history_pending
+        if not pending:
+            return
+
+        if self._history_lines + len(pending) > 2 * self.HISTORY_LIMIT:
+            history = self._load_history()
+            self._replace_file(self.history_file, b"".join(map(_dump_line, history)))
+            self._history_lines = len(history)
+        else:
+            with open(self.history_file, "ab") as f:
+                f.writelines(_dump_line(entry) for entry in pending)
+            self._history_lines += len(pending)
+        pending.clear()
+
+    def _mark_dirty(self, name: str):
+        """Schedule a storage file for writing, immediately outside a batch."""
+        self._dirty.add(name)
+        if not self._batch_depth:
+            self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator["AgentDelegator"]:
+        """Defer storage writes until the outermost batch exits."""
+        self._batch_depth += 1
         try:
-            with open(self.history_file, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
-
-    def _save_history(self, history: List[Dict]):
-        """Save delegation history."""
-        with open(self.history_file, "w") as f:
-            json.dump(history, f, indent=2, default=str)
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self):
+        """Write every storage file changed since the last flush."""
+        for name in self.FLUSH_ORDER:
+            if name not in self._dirty:
+                continue
+            if name == "history":
+                self._flush_history()
+            else:
+                self._write_json(
+                    getattr(self, f"{name}_file"), getattr(self, f"_{name}")
+                )
+        self._dirty.clear()
 
     def _get_accumulated_context(self, task_id: str) -> Dict[str, Any]:
-        """Get accumulated context from all previous delegations."""
+        """
+        Get accumulated context from all previous delegations.
+
+        The values are the stored per-agent dicts themselves, not copies;
+        _update_task_context never mutates them in place.
+        """
         context = self._load_context()
         task_context = context.get(task_id, {})
 
@@ -120,443 +621,309 @@ class AgentDelegator:
 
     def delegate_to_architect(self, task_id: str, requirements: Dict) -> str:
         """Delegate task to Architect agent."""
+        now_iso = datetime.now().isoformat()
         accumulated = self._get_accumulated_context(task_id)
 
         delegation = DelegationContext(
             task_id=task_id,
             from_agent="coordinator",
             to_agent="architect",
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
             state="analyzing",
             requirements=requirements,
-            deliverables=[
-                "Technical specifications document",
-                "System architecture design",
-                "API design documentation",
-                "Database schema if applicable",
-                "Technology stack decisions with rationale",
-                "Security considerations",
-                "Performance requirements",
-                "Success criteria and quality gates",
-            ],
-            constraints=[
-                "Follow established project patterns",
-                "Consider scalability and maintainability",
-                "Document all architectural decisions (ADRs)",
-                "Define clear interfaces between components",
-            ],
-            success_criteria=[
-                "Complete technical specifications delivered",
-                "Architecture addresses all requirements",
-                "Technology choices justified and documented",
-                "Security considerations addressed",
-                "Performance requirements defined",
-            ],
-            handoff_notes="Analyze requirements and create comprehensive technical architecture. Consider existing codebase patterns and constraints.",
+            deliverables=self._ARCHITECT_DELIVERABLES,
+            constraints=self._ARCHITECT_CONSTRAINTS,
+            success_criteria=self._ARCHITECT_SUCCESS_CRITERIA,
+            handoff_notes=self._ARCHITECT_HANDOFF_NOTES,
             context_accumulated=accumulated,
         )
 
-        self._store_delegation(delegation)
-        self._update_task_context(
-            task_id,
-            "architect",
-            {"requirements": requirements, "started_at": datetime.now().isoformat()},
-        )
-        self._add_to_history(task_id, "delegated_to_architect", requirements)
+        with self.batch():
+            self._store_delegation(delegation)
+            self._update_task_context(
+                task_id,
+                "architect",
+                {
+                    "requirements": requirements,
+                    "started_at": now_iso,
+                },
+                now_iso,
+            )
+            self._add_to_history(
+                task_id, "delegated_to_architect", requirements, now_iso
+            )
 
         return self._generate_architect_prompt(delegation)
 
     def delegate_to_coder(self, task_id: str, context: Dict) -> str:
         """Delegate task to Coder agent."""
+        now_iso = datetime.now().isoformat()
         accumulated = self._get_accumulated_context(task_id)
 
         delegation = DelegationContext(
             task_id=task_id,
             from_agent=context.get("from_agent", "architect"),
             to_agent="coder",
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
             state="implementing",
             requirements=context.get("requirements", {}),
-            deliverables=[
-                "Working implementation matching specifications",
-                "Unit tests (>80% coverage target)",
-                "Integration tests for key workflows",
-                "Code documentation and comments",
-                "Configuration files if needed",
-            ],
-            constraints=[
-                "Follow architectural specifications exactly",
-                "Write clean, modular, extensible code",
-                "Include comprehensive error handling",
-                "Follow existing codebase patterns",
-                "Apply security best practices",
-            ],
-            success_criteria=[
-                "All requirements implemented",
-                "Tests pass with >80% coverage",
-                "Code passes linting and type checking",
-                "Documentation complete",
-                "No critical security issues",
-            ],
-            handoff_notes="Implement features according to architectural specifications. Focus on clean code, comprehensive testing, and thorough documentation.",
+            deliverables=self._CODER_DELIVERABLES,
+            constraints=self._CODER_CONSTRAINTS,
+            success_criteria=self._CODER_SUCCESS_CRITERIA,
+            handoff_notes=self._CODER_HANDOFF_NOTES,
             context_accumulated=accumulated,
         )
 
-        self._store_delegation(delegation)
-        self._update_task_context(
-            task_id,
-            "coder",
-            {
-                "architect_specs": context.get("architect_specs", {}),
-                "started_at": datetime.now().isoformat(),
-            },
-        )
-        self._add_to_history(task_id, "delegated_to_coder", context)
+        with self.batch():
+            self._store_delegation(delegation)
+            self._update_task_context(
+                task_id,
+                "coder",
+                {
+                    "architect_specs": context.get("architect_specs", {}),
+                    "started_at": now_iso,
+                },
+                now_iso,
+            )
+            self._add_to_history(task_id, "delegated_to_coder", context, now_iso)
 
         return self._generate_coder_prompt(delegation)
 
     def delegate_to_reviewer(self, task_id: str, implementation_info: Dict) -> str:
         """Delegate task to PR Reviewer agent."""
+        now_iso = datetime.now().isoformat()
         accumulated = self._get_accumulated_context(task_id)
 
         delegation = DelegationContext(
             task_id=task_id,
             from_agent="coder",
             to_agent="pr_reviewer",
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
             state="reviewing",
             requirements=implementation_info,
-            deliverables=[
-                "Quality assessment report",
-                "Security review findings",
-                "Performance analysis",
-                "Improvement recommendations",
-                "Approval or change requests",
-            ],
-            constraints=[
-                "Focus on critical and high-priority issues",
-                "Provide actionable, specific feedback",
-                "Reference best practices and patterns",
-                "Verify architectural compliance",
-                "Check test coverage and quality",
-            ],
-            success_criteria=[
-                "Zero critical security issues",
-                "All high-priority issues addressed",
-                "Performance benchmarks acceptable",
-                "Code quality standards satisfied",
-                "Architectural compliance verified",
-            ],
-            handoff_notes="Conduct comprehensive code review focusing on quality, security, performance, and compliance with architectural decisions.",
+            deliverables=self._REVIEWER_DELIVERABLES,
+            constraints=self._REVIEWER_CONSTRAINTS,
+            success_criteria=self._REVIEWER_SUCCESS_CRITERIA,
+            handoff_notes=self._REVIEWER_HANDOFF_NOTES,
             context_accumulated=accumulated,
         )
 
-        self._store_delegation(delegation)
-        self._update_task_context(
-            task_id,
-            "pr_reviewer",
-            {
-                "implementation": implementation_info,
-                "started_at": datetime.now().isoformat(),
-            },
-        )
-        self._add_to_history(task_id, "delegated_to_reviewer", implementation_info)
+        with self.batch():
+            self._store_delegation(delegation)
+            self._update_task_context(
+                task_id,
+                "pr_reviewer",
+                {
+                    "implementation": implementation_info,
+                    "started_at": now_iso,
+                },
+                now_iso,
+            )
+            self._add_to_history(
+                task_id, "delegated_to_reviewer", implementation_info, now_iso
+            )
 
         return self._generate_reviewer_prompt(delegation)
 
     def delegate_to_qa(self, task_id: str, test_info: Dict) -> str:
         """Delegate task to QA/Tester agent."""
+        now_iso = datetime.now().isoformat()
         accumulated = self._get_accumulated_context(task_id)
 
         delegation = DelegationContext(
             task_id=task_id,
             from_agent=test_info.get("from_agent", "pr_reviewer"),
             to_agent="qa_tester",
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
             state="testing",
             requirements=test_info,
-            deliverables=[
-                "Test execution results",
-                "Bug report (if any found)",
-                "Coverage analysis",
-                "Performance validation results",
-                "Sign-off recommendation",
-            ],
-            constraints=[
-                "Validate all functional requirements",
-                "Test edge cases and error scenarios",
-                "Perform integration testing",
-                "Verify no regressions",
-                "Document all test scenarios",
-            ],
-            success_criteria=[
-                "All acceptance criteria met",
-                "No critical bugs found",
-                "Test coverage requirements satisfied",
-                "Performance within acceptable range",
-                "Integration tests passing",
-            ],
-            handoff_notes="Execute comprehensive testing including functional, integration, edge cases, and performance validation.",
+            deliverables=self._QA_DELIVERABLES,
+            constraints=self._QA_CONSTRAINTS,
+            success_criteria=self._QA_SUCCESS_CRITERIA,
+            handoff_notes=self._QA_HANDOFF_NOTES,
             context_accumulated=accumulated,
         )
 
-        self._store_delegation(delegation)
-        self._update_task_context(
-            task_id,
-            "qa_tester",
-            {"test_info": test_info, "started_at": datetime.now().isoformat()},
-        )
-        self._add_to_history(task_id, "delegated_to_qa", test_info)
+        with self.batch():
+            self._store_delegation(delegation)
+            self._update_task_context(
+                task_id,
+                "qa_tester",
+                {"test_info": test_info, "started_at": now_iso},
+                now_iso,
+            )
+            self._add_to_history(task_id, "delegated_to_qa", test_info, now_iso)
 
         return self._generate_qa_prompt(delegation)
 
     def _store_delegation(self, delegation: DelegationContext):
         """Store delegation record."""
         delegations = self._load_delegations()
-        timestamp_clean = (
-            delegation.timestamp.replace("-", "")
-            .replace(":", "")
-            .replace(".", "")
-            .replace("T", "")
-        )
-        delegation_id = (
-            f"{delegation.task_id}_{delegation.to_agent}_{timestamp_clean[:14]}"
-        )
-        delegations[delegation_id] = asdict(delegation)
+        timestamp_clean = delegation.timestamp.translate(_TIMESTAMP_STRIP)[:14]
+        delegation_id = f"{delegation.task_id}_{delegation.to_agent}_{timestamp_clean}"
+        if self._task_index is not None and delegation_id not in delegations:
+            self._task_index.setdefault(delegation.task_id, []).append(delegation_id)
+        delegations[delegation_id] = delegation.to_dict()
         self._save_delegations(delegations)
 
-    def _update_task_context(self, task_id: str, agent: str, context: Dict):
+    def _get_task_index(self) -> Dict[str, List[str]]:
+        """Map each task to the ids of its delegations, in storage order."""
+        if self._task_index is None:
+            index: Dict[str, List[str]] = {}
+            for delegation_id, record in self._load_delegations().items():
+                index.setdefault(record.get("task_id"), []).append(delegation_id)
+            self._task_index = index
+        return self._task_index
+
+    def _update_task_context(
+        self,
+        task_id: str,
+        agent: str,
+        context: Dict,
+        timestamp: Optional[str] = None,
+    ):
         """Update task context for the agent."""
         all_context = self._load_context()
-        if task_id not in all_context:
-            all_context[task_id] = {"original_requirements": {}}
-
-        if agent not in all_context[task_id]:
-            all_context[task_id][agent] = {}
-
-        all_context[task_id][agent].update(context)
-        all_context[task_id]["last_updated"] = datetime.now().isoformat()
-        all_context[task_id]["current_agent"] = agent
+        task_context = all_context.setdefault(task_id, {"original_requirements": {}})
+        # Replace rather than update the agent's dict: delegations made so far
+        # hold references to the old one as their accumulated context
+        task_context[agent] = {**task_context.get(agent, {}), **context}
+        task_context["last_updated"] = timestamp or datetime.now().isoformat()
+        task_context["current_agent"] = agent
 
         self._save_context(all_context)
-
-    def _add_to_history(self, task_id: str, action: str, details: Dict):
+        current_agents = self._load_current_agents()
+        current_agents[task_id] = agent
+        self._save_current_agents(current_agents)
+
+    def _add_to_history(
+        self,
+        task_id: str,
+        action: str,
+        details: Dict,
+        timestamp: Optional[str] = None,
+    ):
         """Add entry to delegation history."""
         history = self._load_history()
-        history.append(
-            {
-                "task_id": task_id,
-                "action": action,
-                "timestamp": datetime.now().isoformat(),
-                "details": details,
-            }
-        )
-        self._save_history(history[-100:])
+        entry = {
+            "task_id": task_id,
+            "action": action,
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "details": details,
+        }
+        by_task = self._history_by_task
+        if by_task is not None and len(history) == history.maxlen:
+            # Appending evicts the oldest entry, also the oldest of its task
+            evicted_id = history[0].get("task_id")
+            by_task[evicted_id].popleft()
+            if not by_task[evicted_id]:
+                del by_task[evicted_id]
+        history.append(entry)
+        if by_task is not None:
+            by_task.setdefault(task_id, deque()).append(entry)
+        self._history_pending.append(entry)
+        self._mark_dirty("history")
 
     def _generate_architect_prompt(self, delegation: DelegationContext) -> str:
         """Generate delegation prompt for Architect agent."""
-        return f"""# Architecture Analysis Request
-
-**Task ID**: {delegation.task_id}
-**Assigned to**: Architect Agent
-**State**: {delegation.state}
-
-## Requirements
-{json.dumps(delegation.requirements, indent=2)}
-
-## Expected Deliverables
-{self._format_list(delegation.deliverables)}
-
-## Constraints
-{self._format_list(delegation.constraints)}
-
-## Success Criteria
-{self._format_list(delegation.success_criteria)}
-
-## Handoff Notes
-{delegation.handoff_notes}
-
-## Previous Context
-{json.dumps(delegation.context_accumulated, indent=2) if delegation.context_accumulated else "No previous context"}
-
----
-
-Please analyze the requirements and create comprehensive technical specifications including:
-1. System architecture design
-2. Technology decisions with rationale
-3. API specifications
-4. Data models/schemas
-5. Security considerations
-6. Performance requirements
-7. Implementation guidelines
-
-After completion, document your architectural decisions and provide clear specifications for the Coder agent."""
+        if delegation.context_accumulated:
+            previous_context = _pretty(delegation.context_accumulated)
+        else:
+            previous_context = "No previous context"
+
+        return "".join(
+            [
+                "# Architecture Analysis Request\n\n**Task ID**: ",
+                delegation.task_id,
+                "\n**Assigned to**: Architect Agent\n**State**: ",
+                delegation.state,
+                "\n\n## Requirements\n",
+                _pretty(delegation.requirements),
+                self._ARCHITECT_PROMPT_BODY,
+                previous_context,
+                self._ARCHITECT_PROMPT_FOOTER,
+            ]
+        )
 
     def _generate_coder_prompt(self, delegation: DelegationContext) -> str:
         """Generate delegation prompt for Coder agent."""
         architect_decisions = delegation.context_accumulated.get(
             "architect_decisions", {}
         )
-
-        return f"""# Implementation Request
-
-**Task ID**: {delegation.task_id}
-**Assigned to**: Coder Agent
-**State**: {delegation.state}
-
-## Architectural Specifications
-{json.dumps(architect_decisions, indent=2) if architect_decisions else "See requirements below"}
-
-## Requirements
-{json.dumps(delegation.requirements, indent=2)}
-
-## Expected Deliverables
-{self._format_list(delegation.deliverables)}
-
-## Implementation Constraints
-{self._format_list(delegation.constraints)}
-
-## Success Criteria
-{self._format_list(delegation.success_criteria)}
-
-## Handoff Notes
-{delegation.handoff_notes}
-
-## Quality Checklist
-- [ ] All functions have docstrings/comments
-- [ ] Error handling for all edge cases
-- [ ] No hardcoded values (use config)
-- [ ] Follows DRY and SOLID principles
-- [ ] Security best practices applied
-- [ ] Performance considerations addressed
-
----
-
-Please implement the features according to the architectural specifications. Focus on:
-1. Clean, modular, extensible code
-2. Comprehensive testing (>80% coverage)
-3. Thorough documentation
-4. Security best practices
-
-After implementation, prepare the code for review by the PR Reviewer agent."""
+        if architect_decisions:
+            specifications = _pretty(architect_decisions)
+        else:
+            specifications = "See requirements below"
+
+        return "".join(
+            [
+                "# Implementation Request\n\n**Task ID**: ",
+                delegation.task_id,
+                "\n**Assigned to**: Coder Agent\n**State**: ",
+                delegation.state,
+                "\n\n## Architectural Specifications\n",
+                specifications,
+                "\n\n## Requirements\n",
+                _pretty(delegation.requirements),
+                self._CODER_PROMPT_FOOTER,
+            ]
+        )
 
     def _generate_reviewer_prompt(self, delegation: DelegationContext) -> str:
         """Generate delegation prompt for PR Reviewer agent."""
-        implementation = delegation.context_accumulated.get(
-            "implementation_details", {}
+        architect_decisions = delegation.context_accumulated.get(
+            "architect_decisions", {}
         )
 
-        return f"""# Code Review Request
-
-**Task ID**: {delegation.task_id}
-**Assigned to**: PR Reviewer Agent
-**State**: {delegation.state}
-
-## Implementation to Review
-{json.dumps(delegation.requirements, indent=2)}
-
-## Architectural Context
-{json.dumps(delegation.context_accumulated.get("architect_decisions", {}), indent=2)}
-
-## Review Focus Areas
-{self._format_list(delegation.deliverables)}
-
-## Review Checklist
-
-### Security Review
-- [ ] Input validation and sanitization
-- [ ] SQL injection prevention
-- [ ] XSS protection
-- [ ] Authentication/authorization correctness
-- [ ] Sensitive data handling
-- [ ] Dependencies security audit
-
-### Code Quality
-- [ ] Follows architectural specifications
-- [ ] Clean, readable, maintainable code
-- [ ] Proper error handling
-- [ ] No code duplication
-- [ ] Appropriate abstractions
-
-### Testing
-- [ ] Test coverage >80%
-- [ ] Edge cases covered
-- [ ] Integration tests present
-
-### Performance
-- [ ] No obvious bottlenecks
-- [ ] Efficient algorithms
-- [ ] Appropriate caching
-
-## Approval Criteria
-{self._format_list(delegation.success_criteria)}
-
-## Output Format
-Provide structured feedback:
-- **CRITICAL**: Must fix before merge (security, bugs)
-- **HIGH**: Strongly recommended (quality, performance)
-- **MEDIUM**: Suggested improvements
-- **LOW**: Nice to have
-
----
-
-Please conduct a thorough review. If approved, provide merge recommendation. If changes needed, list specific actionable items."""
+        return "".join(
+            [
+                "# Code Review Request\n\n**Task ID**: ",
+                delegation.task_id,
+                "\n**Assigned to**: PR Reviewer Agent\n**State**: ",
+                delegation.state,
+                "\n\n## Implementation to Review\n",
+                _pretty(delegation.requirements),
+                "\n\n## Architectural Context\n",
+                _pretty(architect_decisions),
+                self._REVIEWER_PROMPT_FOOTER,
+            ]
+        )
 
     def _generate_qa_prompt(self, delegation: DelegationContext) -> str:
         """Generate delegation prompt for QA/Tester agent."""
-        return f"""# Testing & Validation Request
-
-**Task ID**: {delegation.task_id}
-**Assigned to**: QA/Tester Agent
-**State**: {delegation.state}
-
-## Implementation Summary
-{json.dumps(delegation.requirements, indent=2)}
-
-## Architectural Context
-{json.dumps(delegation.context_accumulated.get("architect_decisions", {}), indent=2)}
-
-## Test Requirements
-{self._format_list(delegation.deliverables)}
-
-## Testing Constraints
-{self._format_list(delegation.constraints)}
-
-## Acceptance Criteria
-{self._format_list(delegation.success_criteria)}
-
-## Test Scenarios to Execute
-1. Functional testing of all requirements
-2. Edge case validation
-3. Error handling scenarios
-4. Integration testing
-5. Performance validation
-6. Regression testing
-
-## Output Required
-- Test execution results (pass/fail for each scenario)
-- Bug report (severity, description, steps to reproduce)
-- Coverage analysis
-- Performance results
-- Sign-off recommendation (APPROVED / NEEDS FIXES)
-
----
+        architect_decisions = delegation.context_accumulated.get(
+            "architect_decisions", {}
+        )
 
-Execute comprehensive testing and provide detailed results. Flag any issues that block release."""
+        return "".join(
+            [
+                "# Testing & Validation Request\n\n**Task ID**: ",
+                delegation.task_id,
+                "\n**Assigned to**: QA/Tester Agent\n**State**: ",
+                delegation.state,
+                "\n\n## Implementation Summary\n",
+                _pretty(delegation.requirements),
+                "\n\n## Architectural Context\n",
+                _pretty(architect_decisions),
+                self._QA_PROMPT_FOOTER,
+            ]
+        )
 
-    def _format_list(self, items: List[str]) -> str:
+    def _format_list(self, items: Sequence[str]) -> str:
         """Format a list for display."""
-        return "\n".join(f"- {item}" for item in items)
+        return _format_items(items)
 
     def get_task_delegations(self, task_id: str) -> List[Dict]:
         """Get all delegations for a specific task."""
         delegations = self._load_delegations()
-        return [d for d in delegations.values() if d.get("task_id") == task_id]
+        return [
+            delegations[delegation_id]
+            for delegation_id in self._get_task_index().get(task_id, ())
+        ]
 
     def get_current_assignee(self, task_id: str) -> Optional[str]:
         """Get current assignee for a task."""
-        context = self._load_context()
-        return context.get(task_id, {}).get("current_agent")
+        return self._load_current_agents().get(task_id)
 
     def get_task_context(self, task_id: str) -> Dict:
         """Get full context for a task."""
@@ -567,8 +934,13 @@ Execute comprehensive testing and provide detailed results. Flag any issues that
         """Get delegation history, optionally filtered by task."""
         history = self._load_history()
         if task_id:
-            return [h for h in history if h.get("task_id") == task_id]
-        return history
+            if self._history_by_task is None:
+                by_task: Dict[str, Deque[Dict]] = {}
+                for entry in history:
+                    by_task.setdefault(entry.get("task_id"), deque()).append(entry)
+                self._history_by_task = by_task
+            return list(self._history_by_task.get(task_id, ()))
+        return list(history)
 
 
 def main():
@@ -584,6 +956,7 @@ def main():
         print("  current <task_id>                        Get current assignee")
         print("  context <task_id>                        Get full task context")
         print("  history [task_id]                        Get delegation history")
+        print("JSON arguments may be given as @file.json to read them from a file")
         sys.exit(1)
 
     delegator = AgentDelegator()
@@ -597,7 +970,7 @@ def main():
                 )
                 sys.exit(1)
             task_id = sys.argv[2]
-            requirements = json.loads(sys.argv[3])
+            requirements = _parse_json_arg(sys.argv[3])
             prompt = delegator.delegate_to_architect(task_id, requirements)
             print("ARCHITECT DELEGATION PROMPT:")
             print("=" * 50)
@@ -608,7 +981,7 @@ def main():
                 print("Usage: agent_delegator.py coder <task_id> <context_json>")
                 sys.exit(1)
             task_id = sys.argv[2]
-            context = json.loads(sys.argv[3])
+            context = _parse_json_arg(sys.argv[3])
             prompt = delegator.delegate_to_coder(task_id, context)
             print("CODER DELEGATION PROMPT:")
             print("=" * 50)
@@ -621,7 +994,7 @@ def main():
                 )
                 sys.exit(1)
             task_id = sys.argv[2]
-            implementation_info = json.loads(sys.argv[3])
+            implementation_info = _parse_json_arg(sys.argv[3])
             prompt = delegator.delegate_to_reviewer(task_id, implementation_info)
             print("PR REVIEWER DELEGATION PROMPT:")
             print("=" * 50)
@@ -632,7 +1005,7 @@ def main():
                 print("Usage: agent_delegator.py qa <task_id> <test_info_json>")
                 sys.exit(1)
             task_id = sys.argv[2]
-            test_info = json.loads(sys.argv[3])
+            test_info = _parse_json_arg(sys.argv[3])
             prompt = delegator.delegate_to_qa(task_id, test_info)
             print("QA/TESTER DELEGATION PROMPT:")
             print("=" * 50)
@@ -7,12 +7,67 @@ Supports parallel execution, subtasks, and dependency management.
 
 import json
 import os
+import socket
+import sqlite3
 import sys
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Set
+from typing import BinaryIO, Dict, Iterator, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from enum import Enum
+from functools import lru_cache, wraps
+
+try:
+    # Optional: much faster JSON encoding/decoding for the storage files
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # no advisory file locks outside POSIX
+    fcntl = None
+
+
+if orjson is not None:
+
+    def _dump_json(obj: Any) -> bytes:
+        """Encode a storage file as indented JSON."""
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+
+    def _dump_compact(obj: Any) -> bytes:
+        """Encode a value as JSON on a single line."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    _load_json = orjson.loads
+
+else:
+
+    def _dump_json(obj: Any) -> bytes:
+        """Encode a storage file as indented JSON."""
+        return json.dumps(obj, indent=2, default=str, ensure_ascii=False).encode()
+
+    def _dump_compact(obj: Any) -> bytes:
+        """Encode a value as JSON on a single line."""
+        return json.dumps(obj, default=str, ensure_ascii=False).encode()
+
+    _load_json = json.loads
+
+
+def _dump_line(obj: Any) -> bytes:
+    """Encode one journal record as a single JSON line."""
+    return _dump_compact(obj) + b"\n"
+
+
+def _isoformat_now() -> str:
+    """Current time as an ISO timestamp; seconds are precise enough here."""
+    return datetime.now().isoformat(timespec="seconds")
 
 
 class TaskStatus(Enum):
@@ -27,6 +82,48 @@ class TaskStatus(Enum):
     COMPLETE = "complete"
 
 
+# Progress (percent) a task has made by reaching each state
+_STATE_WEIGHTS = {
+    "new": 0,
+    "analyzing": 10,
+    "planning": 20,
+    "implementing": 50,
+    "reviewing": 70,
+    "testing": 85,
+    "iteration": 75,
+    "blocked": 50,
+    "complete": 100,
+}
+
+
+@lru_cache(maxsize=256)
+def _progress(state: str, gates: Tuple[bool, ...]) -> float:
+    """
+    Progress percentage of a task in a state with the given gate results.
+
+    Cached: most tasks share a handful of (state, gates) combinations. Only
+    the count of passed gates matters, so gate order needs no normalizing.
+    """
+    base_progress = _STATE_WEIGHTS.get(state, 0)
+    if not base_progress:
+        return 0
+
+    gates_passed = sum(map(bool, gates))
+    total_gates = len(gates) or 1
+
+    gate_bonus = (gates_passed / total_gates) * 10
+
+    return min(100, base_progress + gate_bonus)
+
+
+# States in which a task is never ready to start
+_TERMINAL_STATES = frozenset(["complete", "blocked"])
+
+# Record fields drawn from a handful of values; interned so every task shares
+# one string object per value and comparisons short-circuit on identity
+_INTERNED_FIELDS = ("current_state", "assignee", "priority")
+
+
 class TaskPriority(Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -34,7 +131,7 @@ class TaskPriority(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class HandoffRecord:
     """Records a handoff between agents."""
 
@@ -46,7 +143,7 @@ class HandoffRecord:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskState:
     """Represents the current state of a development task."""
 
@@ -70,38 +167,394 @@ class TaskState:
     quality_gates: Dict[str, bool] = field(default_factory=dict)
 
 
+def _copy_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a task record for a caller, so edits to it leave the cache alone."""
+    return {
+        key: value.copy() if isinstance(value, (list, dict)) else value
+        for key, value in task.items()
+    }
+
+
+def _status_view(task: Dict[str, Any], progress: float) -> Dict[str, Any]:
+    """Summarize a task record for get_task_status (sharing none of it)."""
+    return {
+        "task_id": task["task_id"],
+        "title": task["title"],
+        "current_state": task["current_state"],
+        "assignee": task["assignee"],
+        "priority": task["priority"],
+        "progress": progress,
+        "handoffs": len(task["handoffs"]),
+        "blockers": list(task["blockers"]),
+        "deliverables": list(task["deliverables"]),
+        "dependencies": list(task["dependencies"]),
+        "subtasks": list(task["subtasks"]),
+        "iteration_count": task["iteration_count"],
+        "quality_gates": dict(task.get("quality_gates") or {}),
+        "created_at": task["created_at"],
+        "updated_at": task["updated_at"],
+    }
+
+
+def _exclusive(method):
+    """Run a TaskTracker method under the tracker's file lock."""
+
+    @wraps(method)
+    def locked_method(self, *args, **kwargs):
+        with self._locked():
+            return method(self, *args, **kwargs)
+
+    return locked_method
+
+
 class TaskTracker:
     """Manages task tracking and coordination for the dev team."""
 
-    VALID_STATES = [s.value for s in TaskStatus]
-    VALID_PRIORITIES = [p.value for p in TaskPriority]
-    VALID_ASSIGNEES = ["architect", "coder", "pr_reviewer", "qa_tester", "coordinator"]
+    # Storage backend name, as selected by TASK_TRACKER_BACKEND
+    BACKEND = "json"
+
+    VALID_STATES = frozenset(s.value for s in TaskStatus)
+    VALID_PRIORITIES = frozenset(p.value for p in TaskPriority)
+    VALID_ASSIGNEES = frozenset(
+        ["architect", "coder", "pr_reviewer", "qa_tester", "coordinator"]
+    )
+
+    # The journal is folded into tasks.json once it grows past this many
+    # times the size of the snapshot (or COMPACT_MIN_BYTES, if larger)
+    COMPACT_RATIO = 4
+    COMPACT_MIN_BYTES = 1 << 16
 
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root)
         self.tasks_file = self.project_root / ".dev_team" / "tasks.json"
+        # Changes since the last snapshot, one JSON record per line
+        self.journal_file = self.project_root / ".dev_team" / "tasks.jsonl"
+        # Held by every change, so processes sharing the files take turns
+        self.lock_file = self.project_root / ".dev_team" / "tasks.lock"
+
+        # Snapshot plus replayed journal, loaded on first use and reloaded
+        # once another process has changed either file
+        self._tasks: Optional[Dict[str, Any]] = None
+        self._snapshot_stat: Optional[Tuple[int, int, int]] = None
+        self._snapshot_bytes = 0
+        self._journal_bytes = 0
+        # Set by a load that found a torn line or an oversized journal
+        self._needs_compact = False
+        self._lock_depth = 0
+
+        # Summaries kept up to date by every mutation, built with _tasks
+        self._counts: Dict[str, Counter] = {}
+        self._blocker_total = 0
+        # Tasks listing each task id (existing or not) as a dependency, and
+        # how many of each task's dependencies are not complete yet
+        self._dependents: Dict[str, Set[str]] = {}
+        self._unmet: Dict[str, int] = {}
+        self._ready: Set[str] = set()
+        # Creation order of the tasks, used to list ready tasks stably
+        self._position: Dict[str, int] = {}
+        # Built subtask trees per task id, dropped when a node in them changes
+        self._tree_cache: Dict[str, Dict] = {}
+
+        # Journal records made inside a batch() are only written when it ends
+        self._journal_pending: List[bytes] = []
+        self._batch_depth = 0
         self._ensure_storage()
 
     def _ensure_storage(self):
         """Ensure the tasks storage directory exists."""
         self.tasks_file.parent.mkdir(exist_ok=True)
         if not self.tasks_file.exists():
-            self._save_tasks({})
+            with self._locked():
+                # Another process may have created it while we waited
+                if not self.tasks_file.exists():
+                    self._save_tasks({})
 
     def _load_tasks(self) -> Dict[str, Any]:
-        """Load all tasks from storage."""
+        """Load all tasks: the snapshot with the journal replayed on top."""
+        if self._tasks is not None and not self._changed_on_disk():
+            return self._tasks
+
+        # Taken before reading, so a snapshot replaced meanwhile still shows
+        # up as a change next time
+        snapshot_stat = self._stat(self.tasks_file)
         try:
-            with open(self.tasks_file, "r") as f:
-                data = json.load(f)
-                return data
+            tasks = _load_json(self.tasks_file.read_bytes())
         except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+            tasks = {}
+
+        journal_bytes = 0
+        torn = False
+        try:
+            with open(self.journal_file, "rb") as f:
+                for line in f:
+                    journal_bytes += len(line)
+                    try:
+                        delta = _load_json(line)
+                    except ValueError:
+                        # Blank or torn line from an interrupted write; one
+                        # cut inside a character fails to decode as UTF-8
+                        torn = True
+                        continue
+                    self._apply_delta(tasks, delta)
+        except FileNotFoundError:
+            pass
+        # Changes made in a batch that has not written them yet
+        for line in self._journal_pending:
+            self._apply_delta(tasks, _load_json(line))
+
+        for task in tasks.values():
+            for key in _INTERNED_FIELDS:
+                task[key] = sys.intern(task[key])
+
+        self._tasks = tasks
+        self._snapshot_stat = snapshot_stat
+        self._snapshot_bytes = snapshot_stat[2] if snapshot_stat else 0
+        self._journal_bytes = journal_bytes
+        self._build_indexes()
+
+        # Settle a damaged or oversized journal now, rather than making every
+        # later load skip over the same lines again. That needs the lock,
+        # which compacts on acquiring it; without it, a line another process
+        # is still appending could be taken for a torn one.
+        self._needs_compact |= torn or self._journal_too_big()
+        if self._needs_compact and not self._lock_depth:
+            with self._locked():
+                pass
+        return self._tasks
+
+    def _changed_on_disk(self) -> bool:
+        """Whether another process has written the files since our load."""
+        return (
+            self._stat(self.tasks_file) != self._snapshot_stat
+            or self._file_size(self.journal_file) != self._journal_bytes
+        )
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the tracker's file lock, with _tasks up to date with disk."""
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            self._lock_depth = 1
+            self._load_tasks()
+            if self._needs_compact:
+                self.compact()
+            yield
+        finally:
+            self._lock_depth = 0
+            # Closing the file releases the lock
+            os.close(fd)
+
+    def _build_indexes(self):
+        """Derive the counters, dependents and ready set from _tasks."""
+        records = self._tasks.values()
+        self._counts = {
+            "by_state": Counter(t["current_state"] for t in records),
+            "by_assignee": Counter(t["assignee"] for t in records),
+            "by_priority": Counter(t["priority"] for t in records),
+            "by_group": Counter(
+                t["parallel_group"] for t in records if t.get("parallel_group")
+            ),
+        }
+        self._blocker_total = sum(len(t["blockers"]) for t in records)
+        self._dependents = {}
+        self._unmet = {}
+        self._ready = set()
+        self._position = {}
+        self._tree_cache = {}
+        for task_id, task in self._tasks.items():
+            self._index_task(task_id, task)
+        for task_id in self._tasks:
+            self._check_ready(task_id)
+
+    def _index_task(self, task_id: str, task: Dict[str, Any]):
+        """Add a task to the dependency indexes (not the counters or ready set)."""
+        self._position[task_id] = len(self._position)
+        self._unmet[task_id] = 0
+        for dep in set(task["dependencies"]):
+            self._add_dependent(dep, task_id)
+
+    def _add_dependent(self, dep: str, task_id: str):
+        """Record that task_id waits on dep."""
+        self._dependents.setdefault(dep, set()).add(task_id)
+        if self._tasks.get(dep, {}).get("current_state") != "complete":
+            self._unmet[task_id] += 1
+
+    def _count(self, task: Dict[str, Any], delta: int):
+        """Add (1) or remove (-1) a task's contribution to the counters."""
+        counts = self._counts
+        counts["by_state"][task["current_state"]] += delta
+        counts["by_assignee"][task["assignee"]] += delta
+        counts["by_priority"][task["priority"]] += delta
+        if task.get("parallel_group"):
+            counts["by_group"][task["parallel_group"]] += delta
+        self._blocker_total += delta * len(task["blockers"])
+
+    def _check_ready(self, task_id: str):
+        """Re-check whether a task can be started."""
+        task = self._tasks.get(task_id)
+        if (
+            task is not None
+            and not self._unmet[task_id]
+            and task["current_state"] not in _TERMINAL_STATES
+        ):
+            self._ready.add(task_id)
+        else:
+            self._ready.discard(task_id)
+
+    def _state_changed(self, task_id: str, old_state: str):
+        """Update readiness and trees after a task moved from old_state."""
+        self._invalidate_tree(task_id)
+        self._check_ready(task_id)
+        was_complete = old_state == "complete"
+        if was_complete != (self._tasks[task_id]["current_state"] == "complete"):
+            # Completing satisfies one dependency of each dependent; reopening
+            # takes it back
+            delta = 1 if was_complete else -1
+            unmet = self._unmet
+            for dependent in self._dependents.get(task_id, ()):
+                unmet[dependent] += delta
+                self._check_ready(dependent)
+
+    def _invalidate_tree(self, task_id: str):
+        """Drop the cached trees containing a task: its own and its ancestors'."""
+        tasks = self._tasks
+        cache = self._tree_cache
+        while task_id in tasks:
+            cache.pop(task_id, None)
+            task_id = tasks[task_id]["parent_task"]
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int, int]]:
+        """Identity of a file's current version: inode, mtime and size."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        """Size of a file in bytes, 0 if it is missing."""
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _apply_delta(tasks: Dict[str, Any], delta: Dict[str, Any]):
+        """
+        Apply one journal record to the tasks.
+
+        Records carry whole field values rather than edits, so replaying one
+        that is already part of the snapshot is harmless.
+        """
+        task_id = delta["task_id"]
+        if delta["op"] == "create":
+            tasks[task_id] = delta["fields"]
+        elif task_id in tasks:
+            tasks[task_id].update(delta["fields"])
+
+    def _append_delta(self, op: str, task_id: str, fields: Dict[str, Any]):
+        """Record a change to one task in the journal."""
+        self._journal_pending.append(
+            _dump_line({"op": op, "task_id": task_id, "fields": fields})
+        )
+        if not self._batch_depth:
+            self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator["TaskTracker"]:
+        """Defer journal writes until the outermost batch exits."""
+        # Other processes wait until the batch is written
+        with self._locked():
+            kept = len(self._journal_pending)
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                # Undo the batch's changes, as a database rollback would
+                del self._journal_pending[kept:]
+                self._tasks = None
+                self._load_tasks()
+                raise
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+
+    @_exclusive
+    def flush(self):
+        """Write the journal records made since the last flush, in one write."""
+        if self._batch_depth:
+            # The batch writes its records when it exits, if it succeeds
+            return
+        if self._journal_pending:
+            data = b"".join(self._journal_pending)
+            self._journal_pending.clear()
+            with open(self.journal_file, "ab") as f:
+                f.write(data)
+            self._journal_bytes += len(data)
+        if self._needs_compact or self._journal_too_big():
+            self.compact()
+
+    def _journal_too_big(self) -> bool:
+        """Whether the journal has outgrown the snapshot enough to compact."""
+        return self._journal_bytes > self.COMPACT_RATIO * max(
+            self._snapshot_bytes, self.COMPACT_MIN_BYTES
+        )
+
+    @_exclusive
+    def compact(self):
+        """Fold the journal into a fresh tasks.json snapshot."""
+        if self._batch_depth:
+            # A snapshot would keep the batch's changes even if it fails
+            self._needs_compact = True
+            return
+        # The snapshot covers any records still waiting for a flush
+        self._journal_pending.clear()
+        self._save_tasks(self._load_tasks())
+        # Truncate only after the snapshot is in place; a crash in between
+        # just replays records the snapshot already contains
+        with open(self.journal_file, "wb"):
+            pass
+        self._snapshot_stat = self._stat(self.tasks_file)
+        self._snapshot_bytes = self._snapshot_stat[2]
+        self._journal_bytes = 0
+        self._needs_compact = False
 
     def _save_tasks(self, tasks: Dict[str, Any]):
-        """Save all tasks to storage."""
-        with open(self.tasks_file, "w") as f:
-            json.dump(tasks, f, indent=2, default=str)
+        """Save all tasks to storage, replacing the file atomically."""
+        # Encode up front so the file gets one write instead of one per token
+        data = memoryview(_dump_json(tasks))
+        tmp_path = self.tasks_file.with_suffix(".json.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+            # compact() truncates the journal next, so the snapshot must be
+            # on disk before that, not just in the page cache
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.tasks_file)
+        # Persist the rename itself
+        dir_fd = os.open(self.tasks_file.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
+    @_exclusive
     def create_task(
         self,
         title: str,
@@ -115,23 +568,66 @@ class TaskTracker:
         """Create a new task and return its ID."""
         tasks = self._load_tasks()
         task_id = f"task_{len(tasks) + 1:03d}"
-        now = datetime.now().isoformat()
+        now = _isoformat_now()
+
+        task = self._new_task(
+            task_id,
+            title,
+            task_type,
+            context,
+            priority,
+            dependencies,
+            parent_task,
+            parallel_group,
+            now,
+        )
+
+        tasks[task_id] = task
+        self._count(task, 1)
+        self._index_task(task_id, task)
+        self._check_ready(task_id)
+        self._append_delta("create", task_id, task)
+
+        if parent_task and parent_task in tasks:
+            subtasks = tasks[parent_task]["subtasks"]
+            subtasks.append(task_id)
+            self._invalidate_tree(parent_task)
+            self._append_delta("update", parent_task, {"subtasks": subtasks})
+
+        return task_id
 
-        initial_state = "analyzing" if task_type in ["architect"] else "new"
+    @classmethod
+    def _new_task(
+        cls,
+        task_id: str,
+        title: str,
+        task_type: str,
+        context: Optional[Dict[str, Any]],
+        priority: str,
+        dependencies: Optional[List[str]],
+        parent_task: Optional[str],
+        parallel_group: Optional[str],
+        now: str,
+    ) -> Dict[str, Any]:
+        """Build the record for a newly created task."""
+        initial_state = "analyzing" if task_type == "architect" else "new"
 
-        task = {
+        return {
             "task_id": task_id,
             "title": title,
             "current_state": initial_state,
-            "assignee": task_type,
+            "assignee": sys.intern(task_type),
             "created_at": now,
             "updated_at": now,
-            "priority": priority if priority in self.VALID_PRIORITIES else "medium",
-            "context": context or {},
+            "priority": (
+                sys.intern(priority) if priority in cls.VALID_PRIORITIES else "medium"
+            ),
+            # Copied: the cached task must not share state with the caller
+            "context": dict(context) if context else {},
             "handoffs": [],
             "blockers": [],
             "deliverables": [],
-            "dependencies": dependencies or [],
+            "dependencies": list(dependencies) if dependencies else [],
             "subtasks": [],
             "parent_task": parent_task,
             "parallel_group": parallel_group,
@@ -145,14 +641,6 @@ class TaskTracker:
             },
         }
 
-        tasks[task_id] = task
-
-        if parent_task and parent_task in tasks:
-            tasks[parent_task]["subtasks"].append(task_id)
-
-        self._save_tasks(tasks)
-        return task_id
-
     def create_subtask(
         self,
         parent_id: str,
@@ -170,6 +658,7 @@ class TaskTracker:
             parallel_group=parallel_group,
         )
 
+    @_exclusive
     def update_task_state(
         self,
         task_id: str,
@@ -185,33 +674,41 @@ class TaskTracker:
             raise ValueError(f"Task {task_id} not found")
 
         task = tasks[task_id]
-        now = datetime.now().isoformat()
 
         if new_state not in self.VALID_STATES:
             raise ValueError(
-                f"Invalid state: {new_state}. Valid states: {self.VALID_STATES}"
+                f"Invalid state: {new_state}. "
+                f"Valid states: {[s.value for s in TaskStatus]}"
             )
 
-        if new_assignee and new_assignee != task["assignee"]:
-            if new_assignee not in self.VALID_ASSIGNEES:
-                raise ValueError(f"Invalid assignee: {new_assignee}")
+        reassign = bool(new_assignee) and new_assignee != task["assignee"]
+        if reassign and new_assignee not in self.VALID_ASSIGNEES:
+            raise ValueError(f"Invalid assignee: {new_assignee}")
+
+        # Validated; take the task out of the counters while it changes
+        now = _isoformat_now()
+        old_state = task["current_state"]
+        self._count(task, -1)
 
+        if reassign:
             handoff = {
                 "from": task["assignee"],
                 "to": new_assignee,
                 "timestamp": now,
                 "state": task["current_state"],
-                "context": task["context"].copy(),
+                # Shared, not copied: the context dict is never changed in
+                # place, updates below swap in a new one
+                "context": task["context"],
                 "notes": notes,
             }
             task["handoffs"].append(handoff)
-            task["assignee"] = new_assignee
+            task["assignee"] = sys.intern(new_assignee)
 
-        task["current_state"] = new_state
+        task["current_state"] = sys.intern(new_state)
         task["updated_at"] = now
 
         if context_update:
-            task["context"].update(context_update)
+            task["context"] = {**task["context"], **context_update}
 
         if deliverable:
             task["deliverables"].append(deliverable)
@@ -223,8 +720,27 @@ class TaskTracker:
                     f"Max iterations ({task['max_iterations']}) exceeded"
                 )
 
-        self._save_tasks(tasks)
+        self._count(task, 1)
+        self._state_changed(task_id, old_state)
+        self._append_delta(
+            "update",
+            task_id,
+            {
+                key: task[key]
+                for key in (
+                    "current_state",
+                    "assignee",
+                    "updated_at",
+                    "context",
+                    "handoffs",
+                    "deliverables",
+                    "iteration_count",
+                    "blockers",
+                )
+            },
+        )
 
+    @_exclusive
     def set_quality_gate(self, task_id: str, gate: str, passed: bool):
         """Set a quality gate status."""
         tasks = self._load_tasks()
@@ -236,20 +752,39 @@ class TaskTracker:
             task["quality_gates"] = {}
 
         task["quality_gates"][gate] = passed
-        task["updated_at"] = datetime.now().isoformat()
-        self._save_tasks(tasks)
+        task["updated_at"] = _isoformat_now()
+        self._append_delta(
+            "update",
+            task_id,
+            {"quality_gates": task["quality_gates"], "updated_at": task["updated_at"]},
+        )
 
+    @_exclusive
     def add_blocker(self, task_id: str, blocker: str):
         """Add a blocker to a task."""
         tasks = self._load_tasks()
         if task_id not in tasks:
             raise ValueError(f"Task {task_id} not found")
 
-        tasks[task_id]["blockers"].append(blocker)
-        tasks[task_id]["current_state"] = "blocked"
-        tasks[task_id]["updated_at"] = datetime.now().isoformat()
-        self._save_tasks(tasks)
+        task = tasks[task_id]
+        old_state = task["current_state"]
+        self._count(task, -1)
+        task["blockers"].append(blocker)
+        task["current_state"] = "blocked"
+        task["updated_at"] = _isoformat_now()
+        self._count(task, 1)
+        self._state_changed(task_id, old_state)
+        self._append_delta(
+            "update",
+            task_id,
+            {
+                "blockers": task["blockers"],
+                "current_state": task["current_state"],
+                "updated_at": task["updated_at"],
+            },
+        )
 
+    @_exclusive
     def remove_blocker(self, task_id: str, blocker_index: int):
         """Remove a blocker from a task."""
         tasks = self._load_tasks()
@@ -258,12 +793,25 @@ class TaskTracker:
 
         task = tasks[task_id]
         if 0 <= blocker_index < len(task["blockers"]):
+            old_state = task["current_state"]
+            self._count(task, -1)
             task["blockers"].pop(blocker_index)
             if not task["blockers"]:
                 task["current_state"] = "implementing"
-            task["updated_at"] = datetime.now().isoformat()
-            self._save_tasks(tasks)
+            task["updated_at"] = _isoformat_now()
+            self._count(task, 1)
+            self._state_changed(task_id, old_state)
+            self._append_delta(
+                "update",
+                task_id,
+                {
+                    "blockers": task["blockers"],
+                    "current_state": task["current_state"],
+                    "updated_at": task["updated_at"],
+                },
+            )
 
+    @_exclusive
     def add_dependency(self, task_id: str, depends_on: str):
         """Add a dependency to a task."""
         tasks = self._load_tasks()
@@ -272,29 +820,28 @@ class TaskTracker:
         if depends_on not in tasks:
             raise ValueError(f"Dependency task {depends_on} not found")
 
-        if depends_on not in tasks[task_id]["dependencies"]:
-            tasks[task_id]["dependencies"].append(depends_on)
-            tasks[task_id]["updated_at"] = datetime.now().isoformat()
-            self._save_tasks(tasks)
+        task = tasks[task_id]
+        if depends_on not in task["dependencies"]:
+            task["dependencies"].append(depends_on)
+            task["updated_at"] = _isoformat_now()
+            self._add_dependent(depends_on, task_id)
+            self._check_ready(task_id)
+            self._append_delta(
+                "update",
+                task_id,
+                {
+                    "dependencies": task["dependencies"],
+                    "updated_at": task["updated_at"],
+                },
+            )
 
     def get_ready_tasks(self) -> List[Dict]:
         """Get tasks that are ready to be worked on (all dependencies met)."""
         tasks = self._load_tasks()
-        ready = []
-
-        for task_id, task in tasks.items():
-            if task["current_state"] in ["complete", "blocked"]:
-                continue
-
-            dependencies_met = all(
-                tasks.get(dep, {}).get("current_state") == "complete"
-                for dep in task["dependencies"]
-            )
-
-            if dependencies_met:
-                ready.append(task)
-
-        return ready
+        return [
+            _copy_task(tasks[task_id])
+            for task_id in sorted(self._ready, key=self._position.__getitem__)
+        ]
 
     def get_parallel_groups(self) -> Dict[str, List[Dict]]:
         """Get tasks grouped by their parallel execution group."""
@@ -306,7 +853,7 @@ class TaskTracker:
             if group:
                 if group not in groups:
                     groups[group] = []
-                groups[group].append(task)
+                groups[group].append(_copy_task(task))
 
         return groups
 
@@ -332,104 +879,786 @@ class TaskTracker:
             return None
 
         task = tasks[task_id]
-        return {
-            "task_id": task["task_id"],
-            "title": task["title"],
-            "current_state": task["current_state"],
-            "assignee": task["assignee"],
-            "priority": task["priority"],
-            "progress": self._calculate_progress(task),
-            "handoffs": len(task["handoffs"]),
-            "blockers": task["blockers"],
-            "deliverables": task["deliverables"],
-            "dependencies": task["dependencies"],
-            "subtasks": task["subtasks"],
-            "iteration_count": task["iteration_count"],
-            "quality_gates": task.get("quality_gates", {}),
-            "created_at": task["created_at"],
-            "updated_at": task["updated_at"],
-        }
+        return _status_view(task, self._calculate_progress(task))
 
     def _calculate_progress(self, task: Dict) -> float:
         """Calculate task progress percentage."""
-        state_weights = {
-            "new": 0,
-            "analyzing": 10,
-            "planning": 20,
-            "implementing": 50,
-            "reviewing": 70,
-            "testing": 85,
-            "iteration": 75,
-            "blocked": 50,
-            "complete": 100,
-        }
-        base_progress = state_weights.get(task["current_state"], 0)
+        quality_gates = task.get("quality_gates") or {}
+        return _progress(task["current_state"], tuple(quality_gates.values()))
 
-        quality_gates = task.get("quality_gates", {})
-        gates_passed = sum(1 for v in quality_gates.values() if v)
-        total_gates = len(quality_gates) if quality_gates else 1
+    def get_backend(self) -> str:
+        """Name of the storage backend."""
+        return self.BACKEND
 
-        gate_bonus = (gates_passed / total_gates) * 10 if base_progress > 0 else 0
-
-        return min(100, base_progress + gate_bonus)
+    def get_progress(self) -> Dict[str, float]:
+        """Progress percentage of every task, in creation order."""
+        calculate = self._calculate_progress
+        tasks = self._load_tasks()
+        return {task_id: calculate(task) for task_id, task in tasks.items()}
 
     def get_team_status(self) -> Dict:
         """Get overall team status and task summary."""
         tasks = self._load_tasks()
-        status = {
+        counts = self._counts
+        by_state = counts["by_state"]
+        return {
             "total_tasks": len(tasks),
-            "by_state": {},
-            "by_assignee": {},
-            "by_priority": {},
-            "active_blockers": 0,
-            "completed_tasks": 0,
-            "in_progress": 0,
-            "ready_to_start": len(self.get_ready_tasks()),
-            "parallel_groups": len(self.get_parallel_groups()),
+            "by_state": {k: v for k, v in by_state.items() if v},
+            "by_assignee": {k: v for k, v in counts["by_assignee"].items() if v},
+            "by_priority": {k: v for k, v in counts["by_priority"].items() if v},
+            "active_blockers": self._blocker_total,
+            "completed_tasks": by_state["complete"],
+            "in_progress": (
+                by_state["implementing"] + by_state["reviewing"] + by_state["testing"]
+            ),
+            "ready_to_start": len(self._ready),
+            "parallel_groups": len(counts["by_group"]),
         }
 
-        for task in tasks.values():
-            status["by_state"][task["current_state"]] = (
-                status["by_state"].get(task["current_state"], 0) + 1
-            )
-
-            status["by_assignee"][task["assignee"]] = (
-                status["by_assignee"].get(task["assignee"], 0) + 1
-            )
-
-            status["by_priority"][task["priority"]] = (
-                status["by_priority"].get(task["priority"], 0) + 1
-            )
-
-            status["active_blockers"] += len(task["blockers"])
-
-            if task["current_state"] == "complete":
-                status["completed_tasks"] += 1
-            elif task["current_state"] in ["implementing", "reviewing", "testing"]:
-                status["in_progress"] += 1
-
-        return status
+    def write_team_status_json(self, out: BinaryIO):
+        """Write the team status as indented JSON to a binary stream."""
+        out.write(_dump_json(self.get_team_status()))
+        out.write(b"\n")
 
     def get_task_tree(self, task_id: str) -> Dict:
         """Get task with all subtasks as a tree structure."""
         tasks = self._load_tasks()
         if task_id not in tasks:
             return {}
+        # Cached nodes are shared between trees, so callers must not modify
+        # the result
+        return self._build_tree(task_id, tasks, self._tree_cache)
+
+    @staticmethod
+    def _build_tree(
+        task_id: str, tasks: Dict[str, Any], cache: Optional[Dict[str, Dict]] = None
+    ) -> Dict:
+        """
+        Assemble the subtask tree under task_id from the task records.
+
+        With a cache, subtrees already built are reused and new ones added.
+        """
+        # Walk with an explicit stack so deep trees cannot hit the recursion
+        # limit; each entry is a task id and the list its node goes into
+        root: List[Dict] = []
+        stack = [(task_id, root)]
+        while stack:
+            tid, siblings = stack.pop()
+            if cache is not None and tid in cache:
+                siblings.append(cache[tid])
+                continue
 
-        def build_tree(tid: str) -> Dict:
             task = tasks.get(tid, {})
-            tree = {
+            children: List[Dict] = []
+            node = {
                 "task_id": tid,
                 "title": task.get("title", ""),
                 "state": task.get("current_state", ""),
                 "assignee": task.get("assignee", ""),
-                "subtasks": [],
+                "subtasks": children,
+            }
+            siblings.append(node)
+            if cache is not None:
+                # Complete by the time the walk ends; a tree has no other
+                # path back to this node before then
+                cache[tid] = node
+            # Reversed, so subtasks pop (and are appended) in their own order
+            stack.extend(
+                (sub_id, children) for sub_id in reversed(task.get("subtasks", []))
+            )
+        return root[0]
+
+
+class TaskTrackerSQLite(TaskTracker):
+    """
+    TaskTracker storing tasks in an SQLite database (.dev_team/tasks.db).
+
+    Every operation reads and writes only the rows it touches, and WAL mode
+    lets concurrent CLI invocations share the database safely.
+    """
+
+    BACKEND = "sqlite"
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS tasks (
+        task_id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        current_state TEXT NOT NULL,
+        assignee TEXT NOT NULL,
+        priority TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        context TEXT NOT NULL,
+        deliverables TEXT NOT NULL,
+        iteration_count INTEGER NOT NULL,
+        max_iterations INTEGER NOT NULL,
+        parent_task TEXT,
+        parallel_group TEXT
+    );
+    CREATE TABLE IF NOT EXISTS handoffs (
+        task_id TEXT NOT NULL,
+        from_agent TEXT,
+        to_agent TEXT,
+        timestamp TEXT,
+        state TEXT,
+        context TEXT,
+        notes TEXT
+    );
+    CREATE TABLE IF NOT EXISTS deps (
+        task_id TEXT NOT NULL,
+        depends_on TEXT NOT NULL,
+        PRIMARY KEY (task_id, depends_on)
+    );
+    CREATE TABLE IF NOT EXISTS subtasks (
+        parent TEXT NOT NULL,
+        child TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS blockers (
+        task_id TEXT NOT NULL,
+        text TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS gates (
+        task_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        passed INTEGER NOT NULL,
+        PRIMARY KEY (task_id, name)
+    );
+    CREATE INDEX IF NOT EXISTS tasks_state ON tasks (current_state);
+    CREATE INDEX IF NOT EXISTS tasks_assignee ON tasks (assignee);
+    CREATE INDEX IF NOT EXISTS deps_depends_on ON deps (depends_on);
+    CREATE INDEX IF NOT EXISTS handoffs_task ON handoffs (task_id);
+    CREATE INDEX IF NOT EXISTS subtasks_parent ON subtasks (parent);
+    CREATE INDEX IF NOT EXISTS blockers_task ON blockers (task_id);
+    """
+
+    def __init__(self, project_root: str = "."):
+        self.project_root = Path(project_root)
+        self.db_file = self.project_root / ".dev_team" / "tasks.db"
+        self.db_file.parent.mkdir(exist_ok=True)
+
+        # Autocommit; _transaction() opens explicit write transactions
+        self._conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._import_json_tasks()
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a read-modify-write under the database write lock."""
+        conn = self._conn
+        if conn.in_transaction:
+            # Inside a batch(): a savepoint undoes just this part on error,
+            # and the batch commits or rolls back as a whole
+            conn.execute("SAVEPOINT op")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK TO op")
+                conn.execute("RELEASE op")
+                raise
+            conn.execute("RELEASE op")
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @contextmanager
+    def batch(self) -> Iterator["TaskTracker"]:
+        """Run several operations as one transaction."""
+        with self._transaction():
+            yield self
+
+    def flush(self):
+        """Nothing to flush: every transaction commits to the database."""
+
+    def _import_json_tasks(self):
+        """Copy the tasks of an existing JSON tracker into an empty database."""
+        tasks_file = self.project_root / ".dev_team" / "tasks.json"
+        if not tasks_file.exists():
+            return
+        with self._transaction() as conn:
+            if conn.execute("SELECT 1 FROM tasks LIMIT 1").fetchone():
+                return
+            for task in TaskTracker(str(self.project_root))._load_tasks().values():
+                self._insert_task(conn, task)
+                conn.executemany(
+                    "INSERT INTO subtasks (parent, child) VALUES (?, ?)",
+                    [(task["task_id"], child) for child in task["subtasks"]],
+                )
+
+    @staticmethod
+    def _insert_task(conn: sqlite3.Connection, task: Dict[str, Any]):
+        """Insert a task record (apart from its subtasks) into the tables."""
+        task_id = task["task_id"]
+        conn.execute(
+            "INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                task_id,
+                task["title"],
+                task["current_state"],
+                task["assignee"],
+                task["priority"],
+                task["created_at"],
+                task["updated_at"],
+                _dump_compact(task["context"]).decode(),
+                _dump_compact(task["deliverables"]).decode(),
+                task["iteration_count"],
+                task["max_iterations"],
+                task["parent_task"],
+                task["parallel_group"],
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO handoffs VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    task_id,
+                    handoff["from"],
+                    handoff["to"],
+                    handoff["timestamp"],
+                    handoff["state"],
+                    _dump_compact(handoff["context"]).decode(),
+                    handoff["notes"],
+                )
+                for handoff in task["handoffs"]
+            ],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO deps (task_id, depends_on) VALUES (?, ?)",
+            [(task_id, dep) for dep in task["dependencies"]],
+        )
+        conn.executemany(
+            "INSERT INTO blockers (task_id, text) VALUES (?, ?)",
+            [(task_id, blocker) for blocker in task["blockers"]],
+        )
+        conn.executemany(
+            "INSERT INTO gates (task_id, name, passed) VALUES (?, ?, ?)",
+            [
+                (task_id, name, bool(passed))
+                for name, passed in (task.get("quality_gates") or {}).items()
+            ],
+        )
+
+    def _get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Assemble the full record of one task, as the JSON tracker stores it."""
+        conn = self._conn
+        row = conn.execute(
+            "SELECT * FROM tasks WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        task = dict(row)
+        task["context"] = _load_json(task["context"])
+        task["deliverables"] = _load_json(task["deliverables"])
+        task["handoffs"] = [
+            {
+                "from": h["from_agent"],
+                "to": h["to_agent"],
+                "timestamp": h["timestamp"],
+                "state": h["state"],
+                "context": _load_json(h["context"]),
+                "notes": h["notes"],
             }
-            for subtask_id in task.get("subtasks", []):
-                tree["subtasks"].append(build_tree(subtask_id))
-            return tree
+            for h in conn.execute(
+                "SELECT * FROM handoffs WHERE task_id = ? ORDER BY rowid", (task_id,)
+            )
+        ]
+        task["blockers"] = [
+            r[0]
+            for r in conn.execute(
+                "SELECT text FROM blockers WHERE task_id = ? ORDER BY rowid", (task_id,)
+            )
+        ]
+        task["dependencies"] = [
+            r[0]
+            for r in conn.execute(
+                "SELECT depends_on FROM deps WHERE task_id = ? ORDER BY rowid",
+                (task_id,),
+            )
+        ]
+        task["subtasks"] = [
+            r[0]
+            for r in conn.execute(
+                "SELECT child FROM subtasks WHERE parent = ? ORDER BY rowid", (task_id,)
+            )
+        ]
+        task["quality_gates"] = {
+            r[0]: bool(r[1])
+            for r in conn.execute(
+                "SELECT name, passed FROM gates WHERE task_id = ? ORDER BY rowid",
+                (task_id,),
+            )
+        }
+        return task
+
+    def _get_tasks(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Assemble the records of the task ids a query returns."""
+        rows = self._conn.execute(query, params).fetchall()
+        return [self._get_task(row[0]) for row in rows]
+
+    def _load_tasks(self) -> Dict[str, Any]:
+        """Load every task record (for callers expecting the JSON layout)."""
+        return {
+            task["task_id"]: task
+            for task in self._get_tasks("SELECT task_id FROM tasks ORDER BY rowid")
+        }
+
+    def _require_task(self, conn: sqlite3.Connection, task_id: str) -> sqlite3.Row:
+        """Fetch a task row, raising ValueError if it does not exist."""
+        row = conn.execute(
+            "SELECT * FROM tasks WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Task {task_id} not found")
+        return row
+
+    def compact(self):
+        """Fold the write-ahead log back into the database file."""
+        if self._conn.in_transaction:
+            # A checkpoint cannot run inside batch()'s open transaction
+            return
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def create_task(
+        self,
+        title: str,
+        task_type: str,
+        context: Optional[Dict[str, Any]] = None,
+        priority: str = "medium",
+        dependencies: Optional[List[str]] = None,
+        parent_task: Optional[str] = None,
+        parallel_group: Optional[str] = None,
+    ) -> str:
+        """Create a new task and return its ID."""
+        with self._transaction() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()
+            task_id = f"task_{count + 1:03d}"
+            task = self._new_task(
+                task_id,
+                title,
+                task_type,
+                context,
+                priority,
+                dependencies,
+                parent_task,
+                parallel_group,
+                _isoformat_now(),
+            )
+            self._insert_task(conn, task)
+            if parent_task and conn.execute(
+                "SELECT 1 FROM tasks WHERE task_id = ?", (parent_task,)
+            ).fetchone():
+                conn.execute(
+                    "INSERT INTO subtasks (parent, child) VALUES (?, ?)",
+                    (parent_task, task_id),
+                )
+        return task_id
+
+    def update_task_state(
+        self,
+        task_id: str,
+        new_state: str,
+        new_assignee: Optional[str] = None,
+        context_update: Optional[Dict[str, Any]] = None,
+        deliverable: Optional[str] = None,
+        notes: str = "",
+    ):
+        """Update task state and track handoff."""
+        with self._transaction() as conn:
+            row = self._require_task(conn, task_id)
+
+            if new_state not in self.VALID_STATES:
+                raise ValueError(
+                    f"Invalid state: {new_state}. "
+                    f"Valid states: {[s.value for s in TaskStatus]}"
+                )
+
+            reassign = bool(new_assignee) and new_assignee != row["assignee"]
+            if reassign and new_assignee not in self.VALID_ASSIGNEES:
+                raise ValueError(f"Invalid assignee: {new_assignee}")
+
+            now = _isoformat_now()
+            assignee = row["assignee"]
+            if reassign:
+                # The stored context text is the snapshot; no need to parse it
+                conn.execute(
+                    "INSERT INTO handoffs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        task_id,
+                        assignee,
+                        new_assignee,
+                        now,
+                        row["current_state"],
+                        row["context"],
+                        notes,
+                    ),
+                )
+                assignee = new_assignee
+
+            context = row["context"]
+            if context_update:
+                context = _dump_compact(
+                    {**_load_json(context), **context_update}
+                ).decode()
+
+            deliverables = row["deliverables"]
+            if deliverable:
+                deliverables = _dump_compact(
+                    _load_json(deliverables) + [deliverable]
+                ).decode()
+
+            iteration_count = row["iteration_count"]
+            if new_state == "iteration":
+                iteration_count += 1
+                if iteration_count > row["max_iterations"]:
+                    conn.execute(
+                        "INSERT INTO blockers (task_id, text) VALUES (?, ?)",
+                        (
+                            task_id,
+                            f"Max iterations ({row['max_iterations']}) exceeded",
+                        ),
+                    )
+
+            conn.execute(
+                "UPDATE tasks SET current_state = ?, assignee = ?, updated_at = ?,"
+                " context = ?, deliverables = ?, iteration_count = ?"
+                " WHERE task_id = ?",
+                (
+                    new_state,
+                    assignee,
+                    now,
+                    context,
+                    deliverables,
+                    iteration_count,
+                    task_id,
+                ),
+            )
+
+    def set_quality_gate(self, task_id: str, gate: str, passed: bool):
+        """Set a quality gate status."""
+        with self._transaction() as conn:
+            self._require_task(conn, task_id)
+            # Upserting keeps an existing gate's rowid, and so its position
+            conn.execute(
+                "INSERT INTO gates (task_id, name, passed) VALUES (?, ?, ?)"
+                " ON CONFLICT (task_id, name) DO UPDATE SET passed = excluded.passed",
+                (task_id, gate, bool(passed)),
+            )
+            conn.execute(
+                "UPDATE tasks SET updated_at = ? WHERE task_id = ?",
+                (_isoformat_now(), task_id),
+            )
+
+    def add_blocker(self, task_id: str, blocker: str):
+        """Add a blocker to a task."""
+        with self._transaction() as conn:
+            self._require_task(conn, task_id)
+            conn.execute(
+                "INSERT INTO blockers (task_id, text) VALUES (?, ?)", (task_id, blocker)
+            )
+            conn.execute(
+                "UPDATE tasks SET current_state = 'blocked', updated_at = ?"
+                " WHERE task_id = ?",
+                (_isoformat_now(), task_id),
+            )
+
+    def remove_blocker(self, task_id: str, blocker_index: int):
+        """Remove a blocker from a task."""
+        with self._transaction() as conn:
+            self._require_task(conn, task_id)
+            rowids = [
+                r[0]
+                for r in conn.execute(
+                    "SELECT rowid FROM blockers WHERE task_id = ? ORDER BY rowid",
+                    (task_id,),
+                )
+            ]
+            if not 0 <= blocker_index < len(rowids):
+                return
+
+            conn.execute(
+                "DELETE FROM blockers WHERE rowid = ?", (rowids[blocker_index],)
+            )
+            if len(rowids) == 1:
+                conn.execute(
+                    "UPDATE tasks SET current_state = 'implementing' WHERE task_id = ?",
+                    (task_id,),
+                )
+            conn.execute(
+                "UPDATE tasks SET updated_at = ? WHERE task_id = ?",
+                (_isoformat_now(), task_id),
+            )
 
-        return build_tree(task_id)
+    def add_dependency(self, task_id: str, depends_on: str):
+        """Add a dependency to a task."""
+        with self._transaction() as conn:
+            self._require_task(conn, task_id)
+            if not conn.execute(
+                "SELECT 1 FROM tasks WHERE task_id = ?", (depends_on,)
+            ).fetchone():
+                raise ValueError(f"Dependency task {depends_on} not found")
+
+            added = conn.execute(
+                "INSERT OR IGNORE INTO deps (task_id, depends_on) VALUES (?, ?)",
+                (task_id, depends_on),
+            ).rowcount
+            if added:
+                conn.execute(
+                    "UPDATE tasks SET updated_at = ? WHERE task_id = ?",
+                    (_isoformat_now(), task_id),
+                )
+
+    def get_ready_tasks(self) -> List[Dict]:
+        """Get tasks that are ready to be worked on (all dependencies met)."""
+        return self._get_tasks(
+            "SELECT task_id FROM tasks t"
+            " WHERE current_state NOT IN ('complete', 'blocked')"
+            " AND NOT EXISTS ("
+            "  SELECT 1 FROM deps d LEFT JOIN tasks td ON td.task_id = d.depends_on"
+            "  WHERE d.task_id = t.task_id"
+            "  AND (td.current_state IS NULL OR td.current_state <> 'complete'))"
+            " ORDER BY rowid"
+        )
+
+    def get_parallel_groups(self) -> Dict[str, List[Dict]]:
+        """Get tasks grouped by their parallel execution group."""
+        groups: Dict[str, List[Dict]] = {}
+        for task in self._get_tasks(
+            "SELECT task_id FROM tasks"
+            " WHERE parallel_group IS NOT NULL AND parallel_group <> ''"
+            " ORDER BY rowid"
+        ):
+            groups.setdefault(task["parallel_group"], []).append(task)
+        return groups
+
+    def can_parallelize(self, task_ids: List[str]) -> bool:
+        """Check if multiple tasks can be executed in parallel."""
+        ids = list(dict.fromkeys(task_ids))
+        marks = ", ".join("?" * len(ids))
+        conn = self._conn
+        (found,) = conn.execute(
+            f"SELECT COUNT(*) FROM tasks WHERE task_id IN ({marks})", ids
+        ).fetchone()
+        if found != len(ids):
+            return False
+        return not conn.execute(
+            f"SELECT 1 FROM deps WHERE task_id IN ({marks})"
+            f" AND depends_on IN ({marks}) LIMIT 1",
+            ids + ids,
+        ).fetchone()
+
+    def get_task_status(self, task_id: str) -> Optional[Dict]:
+        """Get comprehensive task status."""
+        task = self._get_task(task_id)
+        if task is None:
+            return None
+        return _status_view(task, self._calculate_progress(task))
+
+    def get_progress(self) -> Dict[str, float]:
+        """Progress percentage of every task, in creation order."""
+        # Gate results only count towards progress, so fetch them as counts
+        rows = self._conn.execute(
+            "SELECT t.task_id, t.current_state, COUNT(g.name),"
+            " COALESCE(SUM(g.passed), 0)"
+            " FROM tasks t LEFT JOIN gates g ON g.task_id = t.task_id"
+            " GROUP BY t.task_id ORDER BY t.rowid"
+        )
+        return {
+            task_id: _progress(state, (True,) * passed + (False,) * (total - passed))
+            for task_id, state, total, passed in rows
+        }
+
+    def get_team_status(self) -> Dict:
+        """Get overall team status and task summary."""
+        conn = self._conn
+
+        def count_by(column: str) -> Dict[str, int]:
+            return dict(
+                conn.execute(
+                    f"SELECT {column}, COUNT(*) FROM tasks"
+                    f" GROUP BY {column} ORDER BY MIN(rowid)"
+                ).fetchall()
+            )
+
+        by_state = count_by("current_state")
+        (total,) = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()
+        (blockers,) = conn.execute("SELECT COUNT(*) FROM blockers").fetchone()
+        (groups,) = conn.execute(
+            "SELECT COUNT(DISTINCT parallel_group) FROM tasks"
+            " WHERE parallel_group <> ''"
+        ).fetchone()
+        (ready,) = conn.execute(
+            "SELECT COUNT(*) FROM tasks t"
+            " WHERE current_state NOT IN ('complete', 'blocked')"
+            " AND NOT EXISTS ("
+            "  SELECT 1 FROM deps d LEFT JOIN tasks td ON td.task_id = d.depends_on"
+            "  WHERE d.task_id = t.task_id"
+            "  AND (td.current_state IS NULL OR td.current_state <> 'complete'))"
+        ).fetchone()
+        return {
+            "total_tasks": total,
+            "by_state": by_state,
+            "by_assignee": count_by("assignee"),
+            "by_priority": count_by("priority"),
+            "active_blockers": blockers,
+            "completed_tasks": by_state.get("complete", 0),
+            "in_progress": sum(
+                by_state.get(state, 0)
+                for state in ("implementing", "reviewing", "testing")
+            ),
+            "ready_to_start": ready,
+            "parallel_groups": groups,
+        }
+
+    def get_task_tree(self, task_id: str) -> Dict:
+        """Get task with all subtasks as a tree structure."""
+        conn = self._conn
+        rows = conn.execute(
+            "WITH RECURSIVE tree (id) AS ("
+            " SELECT ? UNION ALL"
+            " SELECT child FROM subtasks JOIN tree ON parent = tree.id)"
+            " SELECT task_id, title, current_state, assignee"
+            " FROM tasks JOIN tree ON task_id = tree.id",
+            (task_id,),
+        ).fetchall()
+        if not rows:
+            return {}
+
+        tasks = {row["task_id"]: dict(row, subtasks=[]) for row in rows}
+        for parent, child in conn.execute(
+            "SELECT parent, child FROM subtasks"
+            f" WHERE parent IN ({', '.join('?' * len(tasks))}) ORDER BY rowid",
+            list(tasks),
+        ):
+            tasks[parent]["subtasks"].append(child)
+        return self._build_tree(task_id, tasks)
+
+
+# Socket a running task_tracker_daemon.py listens on, inside .dev_team/
+DAEMON_SOCKET_NAME = "trackerd.sock"
+
+# Seconds the daemon waits for a client's request, and a client for the
+# reply. The daemon serves one connection at a time, so neither side may
+# wait on the other indefinitely.
+DAEMON_REQUEST_TIMEOUT = 5.0
+DAEMON_REPLY_TIMEOUT = 30.0
+
+# TaskTracker methods the daemon serves
+DAEMON_OPS = frozenset(
+    [
+        "create_task",
+        "create_subtask",
+        "update_task_state",
+        "set_quality_gate",
+        "add_blocker",
+        "remove_blocker",
+        "add_dependency",
+        "get_ready_tasks",
+        "get_parallel_groups",
+        "can_parallelize",
+        "get_task_status",
+        "get_progress",
+        "get_team_status",
+        "get_task_tree",
+        "compact",
+        "get_backend",
+    ]
+)
+
+
+def _tracker_class() -> type:
+    """The TaskTracker class selected by the TASK_TRACKER_BACKEND variable."""
+    if os.environ.get("TASK_TRACKER_BACKEND") == "sqlite":
+        return TaskTrackerSQLite
+    return TaskTracker
+
+
+class TaskTrackerClient:
+    """
+    Forwards TaskTracker calls to a running task_tracker_daemon.py.
+
+    Each request is a single JSON line on its own Unix domain socket
+    connection, answered with a single JSON line, so a CLI invocation skips
+    loading the tasks itself.
+    """
+
+    def __init__(self, path: Path, sock: Optional[socket.socket] = None):
+        self._path = path
+        # Connection opened by connect(), used for the first call
+        self._sock = sock
+
+    @staticmethod
+    def _open(path: Path) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(DAEMON_REPLY_TIMEOUT)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    @classmethod
+    def connect(cls, project_root: str = ".") -> Optional["TaskTrackerClient"]:
+        """Connect to the project's daemon; None if it is not running."""
+        path = Path(project_root) / ".dev_team" / DAEMON_SOCKET_NAME
+        if not hasattr(socket, "AF_UNIX") or not path.exists():
+            return None
+
+        try:
+            return cls(path, cls._open(path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Socket left behind by a daemon that is gone
+            return None
+
+    def close(self):
+        """Close a connection opened by connect() and not used yet."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def call(self, op: str, *args: Any, **kwargs: Any) -> Any:
+        """Run one TaskTracker method in the daemon and return its result."""
+        sock, self._sock = self._sock or self._open(self._path), None
+        with sock, sock.makefile("rb") as replies:
+            sock.sendall(_dump_line({"op": op, "args": args, "kwargs": kwargs}))
+            try:
+                line = replies.readline()
+            except TimeoutError:
+                raise TimeoutError(
+                    f"Task tracker daemon did not answer {op} within"
+                    f" {DAEMON_REPLY_TIMEOUT:g}s"
+                ) from None
+        if not line:
+            raise ConnectionError("Task tracker daemon closed the connection")
+
+        reply = _load_json(line)
+        if "error" in reply:
+            if reply.get("type") == "ValueError":
+                raise ValueError(reply["error"])
+            raise RuntimeError(reply["error"])
+        return reply["result"]
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in DAEMON_OPS:
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self.call(name, *args, **kwargs)
+
+    def write_team_status_json(self, out: BinaryIO):
+        """Write the team status as indented JSON to a binary stream."""
+        out.write(_dump_json(self.call("get_team_status")))
+        out.write(b"\n")
 
 
 def main():
@@ -442,6 +1671,7 @@ def main():
         print("  status <task_id>                     Get task status")
         print("  update <task_id> <state> [assignee]  Update task state")
         print("  team                                 Get team status")
+        print("  progress                             Show progress of all tasks")
         print("  blocker <task_id> <desc>             Add blocker to task")
         print("  unblock <task_id> <index>            Remove blocker")
         print("  depend <task_id> <depends_on>        Add dependency")
@@ -451,10 +1681,27 @@ def main():
         print("  tree <task_id>                       Show task tree")
         sys.exit(1)
 
-    tracker = TaskTracker()
+    # Prefer a running daemon, which already has the tasks loaded
+    tracker_class = _tracker_class()
+    tracker: Any = TaskTrackerClient.connect()
+    if tracker is None:
+        tracker = tracker_class()
     command = sys.argv[1]
 
     try:
+        if (
+            isinstance(tracker, TaskTrackerClient)
+            and "TASK_TRACKER_BACKEND" in os.environ
+            and tracker.get_backend() != tracker_class.BACKEND
+        ):
+            # Bypassing the daemon would let two trackers write the tasks
+            print(
+                f"Error: the running task tracker daemon uses the"
+                f" {tracker.get_backend()} backend, not {tracker_class.BACKEND};"
+                f" stop it to switch backends"
+            )
+            sys.exit(1)
+
         if command == "create":
             if len(sys.argv) < 4:
                 print("Usage: task_tracker.py create <title> <type> [priority]")
@@ -482,7 +1729,7 @@ def main():
             task_id = sys.argv[2]
             status = tracker.get_task_status(task_id)
             if status:
-                print(json.dumps(status, indent=2))
+                print(_dump_json(status).decode())
             else:
                 print(f"Task {task_id} not found")
 
@@ -497,8 +1744,12 @@ def main():
             print(f"Updated task {task_id} to {new_state}")
 
         elif command == "team":
-            status = tracker.get_team_status()
-            print(json.dumps(status, indent=2))
+            # Encoded bytes go straight to stdout, skipping the text layer
+            tracker.write_team_status_json(sys.stdout.buffer)
+
+        elif command == "progress":
+            for task_id, progress in tracker.get_progress().items():
+                print(f"  {task_id}: {progress:g}%")
 
         elif command == "blocker":
             if len(sys.argv) < 4:
@@ -565,7 +1816,7 @@ def main():
                 sys.exit(1)
             task_id = sys.argv[2]
             tree = tracker.get_task_tree(task_id)
-            print(json.dumps(tree, indent=2))
+            print(_dump_json(tree).decode())
 
         else:
             print(f"Unknown command: {command}")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Long-running task tracker daemon.
+Keeps the tasks loaded in memory and serves task_tracker.py commands over a
+Unix domain socket (.dev_team/trackerd.sock), so each CLI invocation skips
+loading and parsing the task storage. Changes are persisted as they happen.
+"""
+
+import signal
+import socket
+import socketserver
+import sys
+from pathlib import Path
+
+from task_tracker import (
+    DAEMON_OPS,
+    DAEMON_REQUEST_TIMEOUT,
+    DAEMON_SOCKET_NAME,
+    TaskTracker,
+    _dump_line,
+    _load_json,
+    _tracker_class,
+)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers the single JSON line request of a connection."""
+
+    # A client that connects and then stalls must not hold up the others
+    timeout = DAEMON_REQUEST_TIMEOUT
+
+    def handle(self):
+        try:
+            line = self.rfile.readline()
+        except TimeoutError:
+            return
+        if not line:
+            return
+
+        try:
+            request = _load_json(line)
+            op = request["op"]
+            if op not in DAEMON_OPS:
+                raise ValueError(f"Unknown operation: {op}")
+            result = getattr(self.server.tracker, op)(
+                *request.get("args", ()), **request.get("kwargs", {})
+            )
+            reply = {"result": result}
+        except Exception as e:
+            reply = {"error": str(e), "type": type(e).__name__}
+
+        try:
+            self.wfile.write(_dump_line(reply))
+        except OSError:
+            # The client gave up waiting or went away
+            pass
+
+
+class TaskTrackerDaemon(socketserver.UnixStreamServer):
+    """
+    Serves a TaskTracker over a Unix domain socket.
+
+    Connections are handled one at a time, so the tracker needs no locking;
+    each carries a single request, and both sides of it time out.
+    """
+
+    def __init__(self, tracker: TaskTracker, socket_path: Path):
+        self.tracker = tracker
+        super().__init__(str(socket_path), _RequestHandler)
+
+
+def _daemon_running(socket_path: Path) -> bool:
+    """Whether a daemon is accepting connections on socket_path."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        return False
+    finally:
+        sock.close()
+    return True
+
+
+def main():
+    """Run the daemon for a project until interrupted."""
+    project_root = sys.argv[1] if len(sys.argv) > 1 else "."
+    tracker: TaskTracker = _tracker_class()(project_root)
+    # Load up front so the first request is as fast as the rest
+    tracker._load_tasks()
+
+    socket_path = Path(project_root) / ".dev_team" / DAEMON_SOCKET_NAME
+    if socket_path.exists():
+        if _daemon_running(socket_path):
+            print(f"Task tracker daemon already running on {socket_path}")
+            sys.exit(1)
+        socket_path.unlink()
+
+    # Exit through the finally block below on a plain `kill` as well
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    server = TaskTrackerDaemon(tracker, socket_path)
+    print(f"Task tracker daemon ({tracker.BACKEND}) listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Tests for the agent delegator's storage files
+
+Run with: python test_agent_delegator.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Make the sibling scripts importable when run from elsewhere
+script_dir = str(Path(__file__).parent)
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+
+from agent_delegator import AgentDelegator
+
+
+class SmallHistoryDelegator(AgentDelegator):
+    """Keeps a short history, so compaction is quick to reach"""
+
+    HISTORY_LIMIT = 5
+
+
+def _delegate_rounds(delegator, task_ids) -> None:
+    """Walk each task through architect, coder, reviewer and QA"""
+    for task_id in task_ids:
+        delegator.delegate_to_architect(task_id, {"feature": task_id})
+        delegator.delegate_to_coder(task_id, {"files": [f"{task_id}.py"]})
+        delegator.delegate_to_reviewer(task_id, {"pr": task_id})
+        delegator.delegate_to_qa(task_id, {"suite": "unit"})
+
+
+def _journal_lines(delegator) -> list:
+    return delegator.history_file.read_bytes().splitlines()
+
+
+def test_history_replay():
+    """Test that a new delegator replays the history journal"""
+    print("\n--- Testing history replay ---")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        delegator = AgentDelegator(tmpdir)
+        _delegate_rounds(delegator, ["task_001", "task_002"])
+
+        reloaded = AgentDelegator(tmpdir)
+        history = reloaded.get_delegation_history()
+        assert history == delegator.get_delegation_history()
+        assert len(history) == 8
+        assert [entry["action"] for entry in history[:2]] == [
+            "delegated_to_architect",
+            "delegated_to_coder",
+        ]
+        assert reloaded.get_delegation_history("task_002") == history[4:]
+
+    print("  History replay: PASSED")
+    return True
+
+
+def test_history_compaction():
+    """Test that the journal is cut back once it doubles the history limit"""
+    print("\n--- Testing history compaction ---")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        delegator = SmallHistoryDelegator(tmpdir)
+        limit = delegator.HISTORY_LIMIT
+        _delegate_rounds(delegator, ["task_001", "task_002"])
+        assert len(_journal_lines(delegator)) == 8
+
+        _delegate_rounds(delegator, ["task_003"])
+        lines = _journal_lines(delegator)
+        assert len(lines) <= 2 * limit
+        expected = delegator.get_delegation_history()
+        assert len(expected) == limit
+        assert [json.loads(line) for line in lines[-limit:]] == expected
+
+        # Only the retained entries come back, for every task
+        reloaded = SmallHistoryDelegator(tmpdir)
+        assert reloaded.get_delegation_history() == expected
+        assert reloaded.get_delegation_history("task_001") == []
+        assert len(reloaded.get_delegation_history("task_003")) == 4
+
+    print("  History compaction: PASSED")
+    return True
+
+
+def test_torn_history():
+    """Test that a torn last history line is dropped and the journal rewritten"""
+    print("\n--- Testing torn history recovery ---")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        delegator = AgentDelegator(tmpdir)
+        delegator.delegate_to_architect("task_001", {"feature": "Résumé"})
+        delegator.delegate_to_coder("task_001", {"feature": "Café"})
+
+        # Cut the last record inside a multibyte character
+        journal = delegator.history_file
+        data = journal.read_bytes()
+        journal.write_bytes(data[: data.rindex("é".encode()) + 1])
+
+        reloaded = AgentDelegator(tmpdir)
+        history = reloaded.get_delegation_history()
+        assert [entry["action"] for entry in history] == ["delegated_to_architect"]
+        assert journal.read_bytes().endswith(b"\n")
+        assert len(_journal_lines(reloaded)) == 1
+
+        # Later entries land on a clean line and survive a reload
+        reloaded.delegate_to_qa("task_001", {"suite": "unit"})
+        actions = [
+            entry["action"]
+            for entry in AgentDelegator(tmpdir).get_delegation_history()
+        ]
+        assert actions == ["delegated_to_architect", "delegated_to_qa"]
+
+    print("  Torn history recovery: PASSED")
+    return True
+
+
+def test_legacy_history_migration():
+    """Test that an old history.json is converted to the journal"""
+    print("\n--- Testing legacy history migration ---")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        legacy = [
+            {
+                "task_id": f"task_{n:03d}",
+                "action": "delegated_to_coder",
+                "timestamp": f"2024-01-01T00:00:{n:02d}",
+                "details": {"n": n},
+            }
+            for n in range(8)
+        ]
+        storage = Path(tmpdir) / ".dev_team"
+        storage.mkdir()
+        (storage / "history.json").write_text(json.dumps(legacy))
+
+        delegator = SmallHistoryDelegator(tmpdir)
+        assert not (storage / "history.json").exists()
+        assert delegator.get_delegation_history() == legacy[-5:]
+        assert [json.loads(line) for line in _journal_lines(delegator)] == (
+            legacy[-5:]
+        )
+        assert delegator.get_delegation_history("task_007") == [legacy[-1]]
+
+    print("  Legacy history migration: PASSED")
+    return True
+
+
+def test_current_agents_sidecar():
+    """Test that current_agents.json agrees with context.json after a reload"""
+    print("\n--- Testing current agents sidecar ---")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        delegator = AgentDelegator(tmpdir)
+        delegator.delegate_to_architect("task_001", {"feature": "login"})
+        delegator.delegate_to_coder("task_002", {"feature": "search"})
+        delegator.delegate_to_reviewer("task_002", {"pr": 7})
+
+        def assignees(d):
+            return {
+                task_id: d.get_current_assignee(task_id)
+                for task_id in ("task_001", "task_002")
+            }
+
+        def context_agents():
+            context = json.loads(delegator.context_file.read_text())
+            return {
+                task_id: task_context["current_agent"]
+                for task_id, task_context in context.items()
+            }
+
+        expected = {"task_001": "architect", "task_002": "pr_reviewer"}
+        assert assignees(delegator) == expected
+        assert assignees(AgentDelegator(tmpdir)) == context_agents() == expected
+
+        # A context.json written after the sidecar, as by a run that stopped
+        # in between, wins over the sidecar
+        context = json.loads(delegator.context_file.read_text())
+        context["task_001"]["current_agent"] = "qa_tester"
+        delegator.context_file.write_text(json.dumps(context))
+        sidecar_mtime = delegator.current_agents_file.stat().st_mtime_ns
+        os.utime(delegator.context_file, ns=(sidecar_mtime + 1, sidecar_mtime + 1))
+
+        reloaded = AgentDelegator(tmpdir)
+        assert assignees(reloaded) == context_agents()
+        assert reloaded.get_current_assignee("task_001") == "qa_tester"
+        assert json.loads(reloaded.current_agents_file.read_text()) == (
+            context_agents()
+        )
+
+        # A missing sidecar is derived from the context as well
+        reloaded.current_agents_file.unlink()
+        assert assignees(AgentDelegator(tmpdir)) == context_agents()
+
+    print("  Current agents sidecar: PASSED")
+    return True
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("AGENT DELEGATOR - TEST SUITE")
+    print("=" * 60)
+
+    tests = [
+        ("History replay", test_history_replay),
+        ("History compaction", test_history_compaction),
+        ("Torn history", test_torn_history),
+        ("Legacy history migration", test_legacy_history_migration),
+        ("Current agents sidecar", test_current_agents_sidecar),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            success = test_func()
+            results.append((name, success, None))
+        except Exception as e:
+            results.append((name, False, str(e)))
+            print(f"  {name}: FAILED - {e}")
+
+    print("\n" + "=" * 60)
+    print("TEST RESULTS")
+    print("=" * 60)
+
+    passed = sum(1 for _, success, _ in results if success)
+    failed = len(results) - passed
+
+    for name, success, error in results:
+        status = "PASSED" if success else f"FAILED: {error}"
+        print(f"  {name}: {status}")
+
+    print(f"\nTotal: {passed}/{len(results)} passed, {failed} failed")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
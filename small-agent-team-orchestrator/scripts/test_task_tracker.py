@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Tests for the task tracker storage backends
+
+Run with: python test_task_tracker.py
+"""
+
+import json
+import random
+import socket
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Make the sibling scripts importable when run from elsewhere
+script_dir = str(Path(__file__).parent)
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+
+from task_tracker import (
+    DAEMON_SOCKET_NAME,
+    TaskStatus,
+    TaskTracker,
+    TaskTrackerClient,
+    TaskTrackerSQLite,
+)
+from task_tracker_daemon import TaskTrackerDaemon, _RequestHandler
+
+AGENTS = ["architect", "coder", "pr_reviewer", "qa_tester"]
+STATES = [state.value for state in TaskStatus]
+
+
+def _view(tracker) -> str:
+    """Everything the queries report, minus timestamps, as comparable JSON"""
+    task_ids = list(tracker._load_tasks())
+    statuses = []
+    for task_id in task_ids:
+        status = tracker.get_task_status(task_id)
+        del status["created_at"], status["updated_at"]
+        statuses.append(status)
+    return json.dumps(
+        {
+            "team": tracker.get_team_status(),
+            "ready": [task["task_id"] for task in tracker.get_ready_tasks()],
+            "progress": tracker.get_progress(),
+            "statuses": statuses,
+            "trees": [tracker.get_task_tree(task_id) for task_id in task_ids],
+        },
+        sort_keys=True,
+    )
+
+
+def _random_operations(tracker, seed: int, steps: int = 80) -> None:
+    """Apply a reproducible mix of task operations to a tracker"""
+    rnd = random.Random(seed)
+    task_ids = []
+    for step in range(steps):
+        op = rnd.random()
+        try:
+            if op < 0.25 or not task_ids:
+                parent = rnd.choice(task_ids) if task_ids and op < 0.1 else None
+                deps = rnd.sample(task_ids, min(len(task_ids), rnd.randint(0, 2)))
+                task_ids.append(
+                    tracker.create_task(
+                        f"Task {step}",
+                        rnd.choice(AGENTS),
+                        {"step": step},
+                        rnd.choice(["low", "medium", "high"]),
+                        deps,
+                        parent,
+                        rnd.choice([None, "group_a", "group_b"]),
+                    )
+                )
+            elif op < 0.6:
+                tracker.update_task_state(
+                    rnd.choice(task_ids),
+                    rnd.choice(STATES + ["complete"] * 2),
+                    rnd.choice([None] + AGENTS),
+                )
+            elif op < 0.7:
+                tracker.add_blocker(rnd.choice(task_ids), f"blocker {step}")
+            elif op < 0.8:
+                tracker.remove_blocker(rnd.choice(task_ids), rnd.randint(0, 1))
+            elif op < 0.9:
+                tracker.add_dependency(rnd.choice(task_ids), rnd.choice(task_ids))
+            else:
+                tracker.set_quality_gate(
+                    rnd.choice(task_ids), "tests_passing", rnd.random() < 0.5
+                )
+        except ValueError:
+            # Invalid transitions and dependency cycles are rejected alike
+            pass
+
+
+def test_backend_parity():
+    """Test that the JSON and SQLite backends report the same state"""
+    print("\n--- Testing backend parity ---")
+
+    for seed in range(10):
+        json_dir = tempfile.TemporaryDirectory()
+        db_dir = tempfile.TemporaryDirectory()
+        with json_dir, db_dir:
+            json_tracker = TaskTracker(json_dir.name)
+            db_tracker = TaskTrackerSQLite(db_dir.name)
+            if seed % 2:
+                with json_tracker.batch(), db_tracker.batch():
+                    _random_operations(json_tracker, seed)
+                    _random_operations(db_tracker, seed)
+            else:
+                _random_operations(json_tracker, seed)
+                _random_operations(db_tracker, seed)
+            assert _view(json_tracker) == _view(db_tracker), f"seed {seed}"
+
+            # A batch an exception escapes leaves no trace; a nested one that
+            # fails is undone on its own
+            before = _view(json_tracker)
+            for tracker in (json_tracker, db_tracker):
+                try:
+                    with tracker.batch():
+                        _random_operations(tracker, seed + 100, steps=20)
+                        tracker.compact()
+                        raise KeyError("abandon")
+                except KeyError:
+                    pass
+                with tracker.batch():
+                    tracker.create_task("Kept", "coder")
+                    try:
+                        with tracker.batch():
+                            _random_operations(tracker, seed + 200, steps=20)
+                            raise KeyError("abandon")
+                    except KeyError:
+                        pass
+            assert _view(json_tracker) == _view(db_tracker), f"seed {seed}"
+            assert _view(TaskTracker(json_dir.name)) == _view(json_tracker)
+            assert len(json.loads(_view(json_tracker))["statuses"]) == len(
+                json.loads(before)["statuses"]
+            ) + 1
+            db_tracker.close()
+
+            # An existing JSON store is imported into a new database
+            json_tracker.compact()
+            imported = TaskTrackerSQLite(json_dir.name)
+            assert _view(imported) == _view(json_tracker), f"seed {seed}"
+            imported.close()
+
+    print("  Backend parity: PASSED")
+    return True
+
+
+def test_journal_reload():
+    """Test that a reloaded JSON tracker replays its journal"""
+    print("\n--- Testing journal reload ---")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracker = TaskTracker(tmpdir)
+        _random_operations(tracker, seed=42)
+        assert tracker.journal_file.stat().st_size > 0
+        assert _view(TaskTracker(tmpdir)) == _view(tracker)
+
+        # Results are copies; editing them leaves the tracker's state alone
+        before = _view(tracker)
+        for task in tracker.get_ready_tasks():
+            task["current_state"] = "complete"
+            task["dependencies"].append("task_999")
+        for tasks in tracker.get_parallel_groups().values():
+            tasks[0]["blockers"].append("edited")
+        tracker.get_task_status("task_001")["quality_gates"]["edited"] = True
+        assert _view(tracker) == before
+
+        # Compaction folds the journal into the snapshot
+        tracker.compact()
+        assert tracker.journal_file.stat().st_size == 0
+        assert _view(TaskTracker(tmpdir)) == _view(tracker)
+
+    print("  Journal reload: PASSED")
+    return True
+
+
+def test_shared_files():
+    """Test that trackers sharing the files see each other's changes"""
+    print("\n--- Testing shared task files ---")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        first = TaskTracker(tmpdir)
+        second = TaskTracker(tmpdir)
+        first.create_task("Schema", "architect")
+        assert second.get_team_status()["total_tasks"] == 1
+
+        # A stale instance neither reuses an id nor compacts others' work away
+        first.create_task("API", "coder")
+        assert second.create_task("UI", "coder") == "task_003"
+        second.compact()
+        assert list(TaskTracker(tmpdir)._load_tasks()) == [
+            "task_001",
+            "task_002",
+            "task_003",
+        ]
+
+    print("  Shared task files: PASSED")
+    return True
+
+
+def test_torn_journal():
+    """Test that a torn journal line is dropped and the journal compacted"""
+    print("\n--- Testing torn journal recovery ---")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracker = TaskTracker(tmpdir)
+        first = tracker.create_task("Résumé parser", "coder")
+        tracker.create_task("Café menu", "coder")
+
+        # Cut the last record inside a multibyte character
+        journal = tracker.journal_file
+        data = journal.read_bytes()
+        journal.write_bytes(data[: data.rindex("é".encode()) + 1])
+
+        reloaded = TaskTracker(tmpdir)
+        assert list(reloaded._load_tasks()) == [first]
+        assert journal.stat().st_size == 0
+
+        # Later writes land on a clean journal and survive a reload
+        second = reloaded.create_task("Menu", "coder")
+        assert list(TaskTracker(tmpdir)._load_tasks()) == [first, second]
+
+    print("  Torn journal recovery: PASSED")
+    return True
+
+
+def test_daemon_round_trip():
+    """Test that the daemon client matches direct tracker access"""
+    print("\n--- Testing daemon round trip ---")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracker = TaskTracker(tmpdir)
+        server = TaskTrackerDaemon(
+            tracker, Path(tmpdir) / ".dev_team" / DAEMON_SOCKET_NAME
+        )
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        request_timeout = _RequestHandler.timeout
+        try:
+            client = TaskTrackerClient.connect(tmpdir)
+            assert client is not None
+            task_id = client.create_task("Login page", "coder")
+            client.update_task_state(task_id, "implementing")
+            assert client.get_backend() == "json"
+            assert client.get_task_tree(task_id) == tracker.get_task_tree(task_id)
+            assert client.get_team_status() == tracker.get_team_status()
+
+            # Errors come back as exceptions of the same kind
+            try:
+                client.update_task_state(task_id, "no_such_state")
+                raise AssertionError("invalid state accepted")
+            except ValueError:
+                pass
+
+            # A client that connects and sends nothing is dropped, not waited on
+            _RequestHandler.timeout = 0.2
+            stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            stalled.connect(str(server.server_address))
+            try:
+                assert client.get_progress() == {task_id: 50}
+            finally:
+                stalled.close()
+        finally:
+            _RequestHandler.timeout = request_timeout
+            server.shutdown()
+            server.server_close()
+
+    print("  Daemon round trip: PASSED")
+    return True
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("TASK TRACKER - TEST SUITE")
+    print("=" * 60)
+
+    tests = [
+        ("Backend parity", test_backend_parity),
+        ("Journal reload", test_journal_reload),
+        ("Shared files", test_shared_files),
+        ("Torn journal", test_torn_journal),
+        ("Daemon round trip", test_daemon_round_trip),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            success = test_func()
+            results.append((name, success, None))
+        except Exception as e:
+            results.append((name, False, str(e)))
+            print(f"  {name}: FAILED - {e}")
+
+    print("\n" + "=" * 60)
+    print("TEST RESULTS")
+    print("=" * 60)
+
+    passed = sum(1 for _, success, _ in results if success)
+    failed = len(results) - passed
+
+    for name, success, error in results:
+        status = "PASSED" if success else f"FAILED: {error}"
+        print(f"  {name}: {status}")
+
+    print(f"\nTotal: {passed}/{len(results)} passed, {failed} failed")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)